@@ -56,3 +56,13 @@ CREATE TABLE IF NOT EXISTS expenses (
     FOREIGN KEY (house_id) REFERENCES houses(house_id) ON DELETE CASCADE,
     FOREIGN KEY (house_member_id) REFERENCES house_members(house_member_id) ON DELETE RESTRICT
 );
+
+
+-- Indexes: Keyset pagination
+-- List endpoints page on (created_at, primary key), optionally within a house or member,
+-- so every page is an index range scan however long the history grows.
+CREATE INDEX IF NOT EXISTS idx_expenses_created_at ON expenses (created_at, expense_id);
+CREATE INDEX IF NOT EXISTS idx_expenses_house_created_at ON expenses (house_id, created_at, expense_id);
+CREATE INDEX IF NOT EXISTS idx_expenses_house_member_created_at ON expenses (house_member_id, created_at, expense_id);
+CREATE INDEX IF NOT EXISTS idx_house_members_house_created_at ON house_members (house_id, created_at, house_member_id);
+CREATE INDEX IF NOT EXISTS idx_house_members_user_created_at ON house_members (user_id, created_at, house_member_id);
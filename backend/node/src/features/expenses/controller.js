@@ -1,4 +1,5 @@
 const { query } = require("../../db/connection");
+const { wantsPage, buildPageQuery, toPage } = require("../../utils/pagination");
 
 class ExpensesController {
   /**
@@ -210,21 +211,67 @@ class ExpensesController {
     const queryData = req.query;
     let queryString = `SELECT * FROM expenses `;
     const queryParams = [];
+    const filters = [];
 
     // Add WHERE clauses for filtering
     const houseId = queryData.house_id;
     if (houseId) {
-      queryString += ` WHERE house_id = $${queryParams.length + 1} `;
       queryParams.push(houseId);
+      filters.push(`house_id = $${queryParams.length}`);
     }
 
     // Add WHERE clauses for filtering
     const houseMemberId = queryData.house_member_id;
     if (houseMemberId) {
-      queryString += ` ${
-        queryParams.length > 0 ? "AND" : "WHERE"
-      } house_member_id = $${queryParams.length + 1} `;
       queryParams.push(houseMemberId);
+      filters.push(`house_member_id = $${queryParams.length}`);
+    }
+
+    // page_size/cursor: one page, keyed on (created_at, expense_id) and ordered by
+    // sort_order (newest first by default). sort_by does not apply to pages.
+    if (wantsPage(queryData)) {
+      const page = buildPageQuery({
+        table: "expenses",
+        idColumn: "expense_id",
+        filters,
+        values: queryParams,
+        queryData,
+      });
+      if (!page) {
+        console.error("Error getting expenses - invalid cursor");
+        return res.status(400).json({
+          success: false,
+          error: "Invalid cursor parameter",
+          code: "INVALID_CURSOR",
+        });
+      }
+
+      try {
+        const result = await query(page.text, page.values);
+        const { data, next_cursor } = toPage(
+          result.rows,
+          "expense_id",
+          page.pageSize
+        );
+        console.log(`🚀 Expenses page found: ${data.length}`);
+        return res.status(200).json({
+          success: true,
+          data: data,
+          next_cursor: next_cursor,
+        });
+      } catch (err) {
+        console.error(`Error getting expenses: ${err.message}`);
+        return res.status(500).json({
+          success: false,
+          error: "Internal server error while retrieving expenses",
+          code: "INTERNAL_ERROR",
+          details: err.message,
+        });
+      }
+    }
+
+    if (filters.length > 0) {
+      queryString += ` WHERE ${filters.join(" AND ")} `;
     }
 
     // Add ORDER BY clause
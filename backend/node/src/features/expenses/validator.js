@@ -1,4 +1,5 @@
 const { body, query, param } = require("express-validator");
+const { MAX_PAGE_SIZE } = require("../../utils/pagination");
 
 const expensesValidators = {
   myExpensesQuery: [
@@ -47,6 +48,15 @@ const expensesValidators = {
       .optional()
       .isInt({ min: 1, max: 25 })
       .withMessage("Limit must be an integer between 1 and 100"),
+    query("page_size")
+      .optional()
+      .isInt({ min: 1, max: MAX_PAGE_SIZE })
+      .withMessage(`Page size must be an integer between 1 and ${MAX_PAGE_SIZE}`),
+    query("cursor")
+      .optional()
+      .isString()
+      .notEmpty()
+      .withMessage("Cursor must be a non-empty string"),
   ],
   updateExpenses: [
     body("house_id")
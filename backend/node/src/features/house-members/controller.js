@@ -1,5 +1,6 @@
 const { query } = require("../../db/connection");
 const { assertUserIsHouseHead } = require("../houses/utils/houseOwnership");
+const { wantsPage, buildPageQuery, toPage } = require("../../utils/pagination");
 
 class HouseMembersController {
   /**
@@ -95,6 +96,37 @@ class HouseMembersController {
       values.push(req.query.is_admin);
       filters.push(`is_admin = $${values.length}`);
     }
+    // page_size/cursor: one page, keyed on (created_at, house_member_id) and ordered
+    // by sort_order (newest first by default). sort_by does not apply to pages.
+    if (wantsPage(req.query)) {
+      const page = buildPageQuery({
+        table: "house_members",
+        idColumn: "house_member_id",
+        filters,
+        values,
+        queryData: req.query,
+      });
+      if (!page) {
+        return res.status(400).json({
+          success: false,
+          error: "Invalid cursor parameter",
+          code: "INVALID_CURSOR",
+        });
+      }
+
+      try {
+        const result = await query(page.text, page.values);
+        const { data, next_cursor } = toPage(
+          result.rows,
+          "house_member_id",
+          page.pageSize
+        );
+        return res.status(200).json({ data, next_cursor, success: true });
+      } catch (error) {
+        return next(error);
+      }
+    }
+
     if (filters.length > 0) {
       sql_query += " WHERE " + filters.join(" AND ");
     }
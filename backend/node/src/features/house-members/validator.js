@@ -1,4 +1,5 @@
 const { body, query, param } = require("express-validator");
+const { MAX_PAGE_SIZE } = require("../../utils/pagination");
 
 const houseMembersValidators = {
   houseMembersId: [
@@ -48,6 +49,17 @@ const houseMembersValidators = {
       .notEmpty()
       .withMessage("Sort order must be not be empty")
       .isIn(["asc", "desc"]),
+
+    query("page_size")
+      .optional()
+      .isInt({ min: 1, max: MAX_PAGE_SIZE })
+      .withMessage(`Page size must be an integer between 1 and ${MAX_PAGE_SIZE}`),
+
+    query("cursor")
+      .optional()
+      .isString()
+      .notEmpty()
+      .withMessage("Cursor must be a non-empty string"),
   ],
 
   createHouseMembers: [
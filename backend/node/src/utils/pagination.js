@@ -0,0 +1,119 @@
+// Keyset pagination for list endpoints.
+// Pages are ordered by (created_at, primary key) and continue after the last row of
+// the previous page, so every page is an index range scan however deep it is
+// (unlike OFFSET, which reads and discards every row before the page).
+
+const DEFAULT_PAGE_SIZE = 25;
+const MAX_PAGE_SIZE = 100;
+
+/**
+ * Whether a list request asks for a page rather than the whole (limited) list
+ * @param {*} queryData - Express request query
+ * @returns {boolean}
+ */
+function wantsPage(queryData) {
+  return queryData.page_size !== undefined || queryData.cursor !== undefined;
+}
+
+/**
+ * Encode the position of a row as an opaque cursor
+ * @param {string} createdAt - The row's created_at, as text (full precision)
+ * @param {string} id - The row's primary key
+ * @returns {string}
+ */
+function encodeCursor(createdAt, id) {
+  return Buffer.from(JSON.stringify([createdAt, id])).toString("base64url");
+}
+
+/**
+ * Decode a cursor made by encodeCursor
+ * @param {string} cursor
+ * @returns {string[] | null} [createdAt, id], or null if the cursor is malformed
+ */
+function decodeCursor(cursor) {
+  try {
+    const position = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+    if (
+      Array.isArray(position) &&
+      position.length === 2 &&
+      position.every((part) => typeof part === "string")
+    ) {
+      return position;
+    }
+  } catch (err) {
+    // Fall through: not a cursor we issued
+  }
+  return null;
+}
+
+/**
+ * Build the query of one page of a table
+ * @param {string} table - Table to read
+ * @param {string} idColumn - The table's primary key, the tiebreaker of created_at
+ * @param {string[]} filters - WHERE conditions, with $n placeholders into values
+ * @param {any[]} values - Values of the filters
+ * @param {*} queryData - Express request query (page_size, cursor, sort_order)
+ * @returns {{ text: string, values: any[], pageSize: number } | null} null if the cursor is malformed
+ */
+function buildPageQuery({ table, idColumn, filters, values, queryData }) {
+  const pageSize = Math.min(
+    parseInt(queryData.page_size, 10) || DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+  );
+  const descending = (queryData.sort_order || "desc").toLowerCase() !== "asc";
+  const direction = descending ? "DESC" : "ASC";
+  const conditions = [...filters];
+  const params = [...values];
+
+  if (queryData.cursor) {
+    const position = decodeCursor(queryData.cursor);
+    if (!position) {
+      return null;
+    }
+    params.push(position[0], position[1]);
+    conditions.push(
+      `(created_at, ${idColumn}) ${descending ? "<" : ">"} ($${
+        params.length - 1
+      }::timestamptz, $${params.length})`
+    );
+  }
+
+  // One extra row tells whether another page follows
+  params.push(pageSize + 1);
+  let text = `SELECT *, created_at::text AS cursor_created_at FROM ${table}`;
+  if (conditions.length > 0) {
+    text += ` WHERE ${conditions.join(" AND ")}`;
+  }
+  text += ` ORDER BY created_at ${direction}, ${idColumn} ${direction} LIMIT $${params.length}`;
+  return { text, values: params, pageSize };
+}
+
+/**
+ * Turn the rows of a page query into the response body fields
+ * @param {object[]} rows - Rows returned by the query of buildPageQuery
+ * @param {string} idColumn - The table's primary key
+ * @param {number} pageSize - Rows per page
+ * @returns {{ data: object[], next_cursor: string | null }}
+ */
+function toPage(rows, idColumn, pageSize) {
+  const pageRows = rows.slice(0, pageSize);
+  const last = pageRows[pageRows.length - 1];
+  const nextCursor =
+    rows.length > pageSize
+      ? encodeCursor(last.cursor_created_at, last[idColumn])
+      : null;
+  return {
+    data: pageRows.map(({ cursor_created_at, ...row }) => row),
+    next_cursor: nextCursor,
+  };
+}
+
+module.exports = {
+  DEFAULT_PAGE_SIZE,
+  MAX_PAGE_SIZE,
+  wantsPage,
+  encodeCursor,
+  decodeCursor,
+  buildPageQuery,
+  toPage,
+};
@@ -23,6 +23,7 @@ Future<void> setupDependencies({
   required Isar isarInstance,
   required GoogleSignIn googleSignIn,
   required FirebaseAuth firebaseAuth,
+  HttpClientConfig httpClientConfig = const HttpClientConfig(),
 }) async {
   // Register Dependencies
   getIt.registerLazySingleton<Isar>(() => isarInstance);
@@ -30,20 +31,28 @@ Future<void> setupDependencies({
   getIt.registerLazySingleton<FirebaseAuth>(() => firebaseAuth);
   // Register CacheManager, which depends on Isar
   getIt.registerLazySingleton<CacheManager>(() => CacheManager(getIt<Isar>()));
+  // One pooled, keep-alive HTTP client shared by every repository
+  getIt.registerLazySingleton<Dio>(
+    () => createHttpClient(httpClientConfig),
+    dispose: (dio) => dio.close(),
+  );
   // Register all your repositories as lazy singletons
   getIt.registerLazySingleton<UsersRepository>(
     () => UsersRepository(
       cacheManager: getIt<CacheManager>(),
+      dio: getIt<Dio>(),
     ),
   );
   getIt.registerLazySingleton<HousesRepository>(
     () => HousesRepository(
       cacheManager: getIt<CacheManager>(),
+      dio: getIt<Dio>(),
     ),
   );
   getIt.registerLazySingleton<ExpensesRepository>(
     () => ExpensesRepository(
       cacheManager: getIt<CacheManager>(),
+      dio: getIt<Dio>(),
     ),
   );
 }
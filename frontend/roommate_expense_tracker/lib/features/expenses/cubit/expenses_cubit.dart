@@ -94,6 +94,38 @@ class ExpensesCubit extends Cubit<ExpensesState> {
     }
   }
 
+  /// Fetch the next page of [Expenses] objects from Rds and append it
+  /// to the loaded list.
+  ///
+  /// Loads the first page if [refresh] is set or no list is loaded yet, and
+  /// does nothing once the last page has been loaded.
+  Future<void> fetchNextExpensesPage({
+    required String token,
+    int pageSize = defaultPageSize,
+    bool ascending = false,
+    bool refresh = false,
+  }) async {
+    final cursor = refresh ? null : state.expensesNextCursor;
+    if (cursor == null && !refresh && state.expensesList.isNotEmpty) return;
+    emit(state.fromLoading());
+    try {
+      final page = await _expensesRepository.fetchExpensesPage(
+        token: token,
+        pageSize: pageSize,
+        cursor: cursor,
+        ascending: ascending,
+      );
+      emit(state.fromExpensesPageLoaded(
+        expensesList:
+            cursor == null ? page.items : [...state.expensesList, ...page.items],
+        nextCursor: page.nextCursor,
+      ));
+    } on ExpensesFailure catch (failure) {
+      debugPrint('Failure to fetch a page of expenses: $failure');
+      emit(state.fromExpensesFailure(failure));
+    }
+  }
+
   /// Fetch single() [Expenses] object from Rds.
   ///
   /// Return data if exists, or an empty instance of [Expenses].
@@ -232,6 +264,42 @@ class ExpensesCubit extends Cubit<ExpensesState> {
     }
   }
 
+  /// Fetch the next page of [Expenses] objects from Rds and append it
+  /// to the loaded list.
+  ///
+  /// Loads the first page if [refresh] is set or no list is loaded yet, and
+  /// does nothing once the last page has been loaded.
+  ///
+  /// Requires the [houseMemberId] for lookup
+  Future<void> fetchNextExpensesPageWithHouseMemberId({
+    required String houseMemberId,
+    required String token,
+    int pageSize = defaultPageSize,
+    bool ascending = false,
+    bool refresh = false,
+  }) async {
+    final cursor = refresh ? null : state.expensesNextCursor;
+    if (cursor == null && !refresh && state.expensesList.isNotEmpty) return;
+    emit(state.fromLoading());
+    try {
+      final page = await _expensesRepository.fetchExpensesPageWithHouseMemberId(
+        houseMemberId: houseMemberId,
+        token: token,
+        pageSize: pageSize,
+        cursor: cursor,
+        ascending: ascending,
+      );
+      emit(state.fromExpensesPageLoaded(
+        expensesList:
+            cursor == null ? page.items : [...state.expensesList, ...page.items],
+        nextCursor: page.nextCursor,
+      ));
+    } on ExpensesFailure catch (failure) {
+      debugPrint('Failure to fetch a page of expenses: $failure');
+      emit(state.fromExpensesFailure(failure));
+    }
+  }
+
   /// Fetch list of all [Expenses] objects from Rds.
   ///
   /// Requires the [houseId] for lookup
@@ -262,6 +330,42 @@ class ExpensesCubit extends Cubit<ExpensesState> {
     }
   }
 
+  /// Fetch the next page of [Expenses] objects from Rds and append it
+  /// to the loaded list.
+  ///
+  /// Loads the first page if [refresh] is set or no list is loaded yet, and
+  /// does nothing once the last page has been loaded.
+  ///
+  /// Requires the [houseId] for lookup
+  Future<void> fetchNextExpensesPageWithHouseId({
+    required String houseId,
+    required String token,
+    int pageSize = defaultPageSize,
+    bool ascending = false,
+    bool refresh = false,
+  }) async {
+    final cursor = refresh ? null : state.expensesNextCursor;
+    if (cursor == null && !refresh && state.expensesList.isNotEmpty) return;
+    emit(state.fromLoading());
+    try {
+      final page = await _expensesRepository.fetchExpensesPageWithHouseId(
+        houseId: houseId,
+        token: token,
+        pageSize: pageSize,
+        cursor: cursor,
+        ascending: ascending,
+      );
+      emit(state.fromExpensesPageLoaded(
+        expensesList:
+            cursor == null ? page.items : [...state.expensesList, ...page.items],
+        nextCursor: page.nextCursor,
+      ));
+    } on ExpensesFailure catch (failure) {
+      debugPrint('Failure to fetch a page of expenses: $failure');
+      emit(state.fromExpensesFailure(failure));
+    }
+  }
+
   /// Update the given [Expenses] in Rds.
   ///
   /// Return data if successful, or an empty instance of [Expenses].
@@ -15,6 +15,7 @@ final class ExpensesState extends Equatable {
     this.status = ExpensesStatus.initial,
     this.expenses = Expenses.empty,
     this.expensesList = const [],
+    this.expensesNextCursor,
     this.weeklyExpenses = const [],
     this.expenseCategories = const [],
     this.failure = ExpensesFailure.empty,
@@ -26,6 +27,10 @@ final class ExpensesState extends Equatable {
   final ExpensesStatus status;
   final Expenses expenses;
   final List<Expenses> expensesList;
+
+  /// Cursor of the page after [expensesList]; null before the first page and
+  /// after the last
+  final String? expensesNextCursor;
   final List<Map<String, dynamic>> weeklyExpenses;
   final List<Map<String, dynamic>> expenseCategories;
   final ExpensesFailure failure;
@@ -36,6 +41,7 @@ final class ExpensesState extends Equatable {
         status,
         expenses,
         expensesList,
+        expensesNextCursor,
         weeklyExpenses,
         expenseCategories,
         failure,
@@ -55,6 +61,7 @@ final class ExpensesState extends Equatable {
       status: status ?? this.status,
       expenses: expenses ?? this.expenses,
       expensesList: expensesList ?? this.expensesList,
+      expensesNextCursor: expensesNextCursor,
       weeklyExpenses: weeklyExpenses ?? this.weeklyExpenses,
       expenseCategories: expenseCategories ?? this.expenseCategories,
       failure: failure ?? this.failure,
@@ -84,6 +91,20 @@ extension _ExpensesStateExtensions on ExpensesState {
         expensesList: expensesList,
       );
 
+  ExpensesState fromExpensesPageLoaded({
+    required List<Expenses> expensesList,
+    required String? nextCursor,
+  }) =>
+      ExpensesState._(
+        status: ExpensesStatus.loaded,
+        expenses: expenses,
+        expensesList: expensesList,
+        expensesNextCursor: nextCursor,
+        weeklyExpenses: weeklyExpenses,
+        expenseCategories: expenseCategories,
+        failure: failure,
+      );
+
   ExpensesState fromWeeklyExpensesLoaded({
     required List<Map<String, dynamic>> weeklyExpenses,
   }) =>
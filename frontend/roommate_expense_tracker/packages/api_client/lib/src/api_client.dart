@@ -1,2 +1,7 @@
 export 'cache/cache.dart';
+export 'cached_fetch.dart';
+export 'http_client.dart';
+export 'http_client_config.dart';
+export 'json_decode.dart';
+export 'page.dart';
 export 'request.dart';
@@ -1,3 +1,5 @@
 export 'cache_manager.dart';
 export 'cache_key.dart';
+export 'memory_cache.dart';
 export 'models/cached_http_response.dart';
+export 'record_cache.dart';
@@ -8,6 +8,10 @@ class CacheManager {
 
   final Isar _isar;
 
+  /// The Isar instance backing the cache, for typed record collections
+  /// (see [RecordCache]).
+  Isar get isar => _isar;
+
   // --- Configuration for Cache Durations ---
   /// Default duration for HTTP response caches.
   static const Duration _defaultHttpCacheExpiration = Duration(hours: 6);
@@ -27,7 +31,7 @@ class CacheManager {
       final cachedEntry = CachedHttpResponse.fromResponse(
         key: key,
         responseBody: responseBody,
-        cacheDuration: _defaultHttpCacheExpiration,
+        cacheDuration: cacheDuration ?? _defaultHttpCacheExpiration,
       );
       await _isar.cachedHttpResponses.put(cachedEntry);
     });
@@ -73,7 +77,8 @@ class CacheManager {
   // --- General Cache Cleanup (only for CachedHttpResponse) ---
 
   /// Performs cleanup on the CachedHttpResponse collection.
-  /// It removes entries older than their configured HTTP cache duration or past their explicit `expiresAt`.
+  /// It removes entries past their explicit `expiresAt`, and entries without one
+  /// that are older than the default HTTP cache duration.
   /// This should ideally be called periodically (e.g., app start, background fetch).
   Future<void> cleanupAllCaches() async {
     final httpThreshold =
@@ -84,7 +89,9 @@ class CacheManager {
         // final httpCacheCount =
         await _isar.cachedHttpResponses
             .filter()
-            .cachedAtLessThan(httpThreshold)
+            .group(
+              (q) => q.expiresAtIsNull().and().cachedAtLessThan(httpThreshold),
+            )
             .or()
             .expiresAtLessThan(DateTime.now().toUtc())
             .deleteAll();
@@ -95,11 +102,11 @@ class CacheManager {
   }
 
   /// Clears ALL data from ALL Isar collections. Use with extreme caution!
-  /// In your case, this will only clear the CachedHttpResponse collection.
+  /// This includes the typed record collections of generated repositories.
   Future<void> clearAllData() async {
     try {
       await _isar.writeTxn(() async {
-        await _isar.cachedHttpResponses.clear();
+        await _isar.clear();
       });
       debugPrint('CacheManager: All Isar data cleared.');
     } catch (e) {
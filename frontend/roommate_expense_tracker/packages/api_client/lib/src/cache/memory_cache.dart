@@ -0,0 +1,69 @@
+/// A bounded in-memory LRU cache of decoded objects, kept in front of the
+/// persistent [CacheManager] cache so repeated reads skip Isar entirely.
+///
+/// Holds at most [maxEntries] values and evicts the least recently used one
+/// when full. Values expire [ttl] after they were stored.
+class MemoryCache<K, V> {
+  /// Constructor for [MemoryCache].
+  MemoryCache({
+    required this.maxEntries,
+    required this.ttl,
+  });
+
+  /// The most values held at once. Nothing is cached if not positive.
+  final int maxEntries;
+
+  /// How long a value is served after it was stored.
+  final Duration ttl;
+
+  // Insertion-ordered, so the least recently used entry is always first
+  final Map<K, _MemoryCacheEntry<V>> _entries = {};
+
+  /// The number of values currently held, including expired ones not yet
+  /// evicted.
+  int get length => _entries.length;
+
+  /// Returns the value stored under [key] and marks it as most recently used,
+  /// or null if there is none or it expired.
+  V? get(K key) {
+    final entry = _entries.remove(key);
+    if (entry == null) {
+      return null;
+    }
+    if (entry.expiresAt.isBefore(DateTime.now())) {
+      return null;
+    }
+    _entries[key] = entry;
+    return entry.value;
+  }
+
+  /// Stores [value] under [key], evicting the least recently used values
+  /// if the cache is full.
+  void put(K key, V value) {
+    _entries.remove(key);
+    if (maxEntries <= 0) {
+      return;
+    }
+    while (_entries.length >= maxEntries) {
+      _entries.remove(_entries.keys.first);
+    }
+    _entries[key] = _MemoryCacheEntry(value, DateTime.now().add(ttl));
+  }
+
+  /// Removes the value stored under [key], if any.
+  void remove(K key) {
+    _entries.remove(key);
+  }
+
+  /// Removes every value.
+  void clear() {
+    _entries.clear();
+  }
+}
+
+class _MemoryCacheEntry<V> {
+  _MemoryCacheEntry(this.value, this.expiresAt);
+
+  final V value;
+  final DateTime expiresAt;
+}
@@ -0,0 +1,135 @@
+import 'package:isar/isar.dart';
+import 'cache_manager.dart';
+
+/// Separates the primary keys of a list cached with [RecordCache.cacheRecords].
+const String recordKeySeparator = '\n';
+
+/// Implemented by the Isar records of the typed model cache (the generated
+/// `<Model>Record` collections).
+abstract class CacheRecord {
+  /// The primary key of the cached row.
+  String get primaryKey;
+
+  /// When the row was cached.
+  DateTime get cachedAt;
+}
+
+/// FNV-1a 64-bit hash of a string primary key.
+///
+/// Used as the Isar [Id] of cache records, so a row is looked up by its
+/// primary key without a secondary index.
+int fastHash(String key) {
+  var hash = 0xcbf29ce484222325;
+  var i = 0;
+  while (i < key.length) {
+    final codeUnit = key.codeUnitAt(i++);
+    hash ^= codeUnit >> 8;
+    hash *= 0x100000001b3;
+    hash ^= codeUnit & 0xFF;
+    hash *= 0x100000001b3;
+  }
+  return hash;
+}
+
+/// Typed model caching on top of [CacheManager].
+///
+/// Rows are stored decoded, one [CacheRecord] per primary key, so cache hits
+/// skip JSON parsing. A cached list is an ordinary [CachedHttpResponse] entry
+/// holding the primary keys of its rows in order, which keeps its expiry and
+/// invalidation the same as for string-cached responses.
+extension RecordCache on CacheManager {
+  /// Retrieves the rows of a list cached under [key], in cached order.
+  /// Returns null if the list expired or one of its rows was evicted since.
+  Future<List<R>?> getCachedRecords<R extends CacheRecord>(String key) async {
+    final primaryKeys = await getCachedRecordKeys(key);
+    if (primaryKeys == null) {
+      return null;
+    }
+    final records =
+        await isar.collection<R>().getAll(primaryKeys.map(fastHash).toList());
+    if (records.contains(null)) {
+      return null;
+    }
+    return records.cast<R>();
+  }
+
+  /// Retrieves the rows that [query] finds among those of the list cached
+  /// under [key], in that list's order.
+  ///
+  /// Lets a filtered read (e.g. by an indexed foreign key) be answered from a
+  /// cached unfiltered list. Returns null if that list is not cached.
+  Future<List<R>?> getCachedRecordsWhere<R extends CacheRecord>(
+    String key,
+    Future<List<R>> Function(IsarCollection<R> collection) query,
+  ) async {
+    final primaryKeys = await getCachedRecordKeys(key);
+    if (primaryKeys == null) {
+      return null;
+    }
+    final positions = {
+      for (var i = 0; i < primaryKeys.length; i++) primaryKeys[i]: i,
+    };
+    final records = await query(isar.collection<R>());
+    return records
+        .where((record) => positions.containsKey(record.primaryKey))
+        .toList()
+      ..sort(
+        (a, b) => positions[a.primaryKey]!.compareTo(positions[b.primaryKey]!),
+      );
+  }
+
+  /// Retrieves the primary keys of a list cached under [key], or null if it
+  /// is not cached or expired.
+  Future<List<String>?> getCachedRecordKeys(String key) async {
+    final data = await getCachedHttpResponse(key);
+    if (data == null) {
+      return null;
+    }
+    return data.isEmpty ? [] : data.split(recordKeySeparator);
+  }
+
+  /// Stores [records] and caches their order under [key].
+  /// [cacheDuration]: Optional. Overrides the default HTTP cache duration.
+  Future<void> cacheRecords<R extends CacheRecord>({
+    required String key,
+    required List<R> records,
+    Duration? cacheDuration,
+  }) async {
+    await isar.writeTxn(() => isar.collection<R>().putAll(records));
+    await cacheHttpResponse(
+      key: key,
+      responseBody:
+          records.map((record) => record.primaryKey).join(recordKeySeparator),
+      cacheDuration: cacheDuration,
+    );
+  }
+
+  /// Retrieves the row with [primaryKey] if it was cached less than [maxAge]
+  /// ago, otherwise null.
+  Future<R?> getCachedRecord<R extends CacheRecord>(
+    String primaryKey, {
+    required Duration maxAge,
+  }) async {
+    final record = await isar.collection<R>().get(fastHash(primaryKey));
+    final threshold = DateTime.now().toUtc().subtract(maxAge);
+    if (record == null || record.cachedAt.isBefore(threshold)) {
+      return null;
+    }
+    return record;
+  }
+
+  /// Stores a single row, replacing any cached copy.
+  Future<void> cacheRecord<R extends CacheRecord>(R record) async {
+    await isar.writeTxn(() => isar.collection<R>().put(record));
+  }
+
+  /// Deletes the cached row with [primaryKey]. Cached lists that contain it
+  /// are treated as expired on their next read.
+  Future<void> deleteCachedRecord<R extends CacheRecord>(
+    String primaryKey,
+  ) async {
+    await isar.writeTxn(
+      () => isar.collection<R>().delete(fastHash(primaryKey)),
+    );
+  }
+}
@@ -0,0 +1,98 @@
+import 'dart:convert';
+
+import 'package:dio/dio.dart';
+import 'package:flutter/foundation.dart';
+import 'package:get_it/get_it.dart';
+
+import 'cache/cache.dart';
+import 'json_decode.dart';
+import 'request.dart';
+
+/// Default time a successful response stays in the HTTP response cache.
+const Duration defaultResponseCacheDuration = Duration(minutes: 60);
+
+/// Shared body of the generated repository methods.
+///
+/// Unless [forceRefresh] is set, returns the response cached under [cacheKey]
+/// (decoded with [decode]). Otherwise sends the request, caches the `data` of a
+/// successful response for [cacheDuration] and returns it decoded.
+///
+/// Requests go through [dio], or the app's shared client (see [createHttpClient])
+/// registered with GetIt.
+///
+/// With a [decodeThreshold], payloads of at least that many characters are
+/// decoded on a background isolate (see [decodeJsonInBackground]); [decode]
+/// must then be sendable to another isolate.
+///
+/// Throws the object returned by [failure] if the backend reports an error or
+/// the request fails.
+Future<T> cachedFetch<T>({
+  required CacheManager cacheManager,
+  required String cacheKey,
+  required String method,
+  required String apiEndpoint,
+  required String token,
+  required T Function(dynamic data) decode,
+  required Object Function() failure,
+  Map<String, dynamic>? payload,
+  bool forceRefresh = false,
+  Duration cacheDuration = defaultResponseCacheDuration,
+  Dio? dio,
+  int? decodeThreshold,
+}) async {
+  if (!forceRefresh) {
+    final cachedData = await cacheManager.getCachedHttpResponse(cacheKey);
+    if (cachedData != null) {
+      try {
+        if (decodeThreshold != null) {
+          return await decodeJsonInBackground(
+            cachedData,
+            decode,
+            threshold: decodeThreshold,
+          );
+        }
+        return decode(jsonDecode(cachedData));
+      } catch (e) {
+        debugPrint('Error decoding cached data for key $cacheKey: $e');
+      }
+    }
+  }
+
+  // No valid cache, or forceRefresh is true, fetch from API
+  try {
+    final response = await dioRequest(
+      dio: dio ?? GetIt.instance<Dio>(),
+      apiEndpoint: apiEndpoint,
+      method: method,
+      headers: {
+        'Authorization': 'Bearer $token',
+      },
+      payload: payload,
+    );
+    debugPrint('$method $apiEndpoint response: $response');
+    if (response['success'] != true) {
+      throw failure();
+    }
+
+    // Success
+    final dynamic jsonData = response['data'];
+    final String responseBody = jsonEncode(jsonData); // Encode to string for caching
+    await cacheManager.cacheHttpResponse(
+      key: cacheKey,
+      responseBody: responseBody,
+      cacheDuration: cacheDuration,
+    );
+    if (decodeThreshold != null && responseBody.length >= decodeThreshold) {
+      // Convert a copy on a background isolate instead of the decoded data
+      return await decodeJsonInBackground(
+        responseBody,
+        decode,
+        threshold: decodeThreshold,
+      );
+    }
+    return decode(jsonData);
+  } catch (e) {
+    debugPrint('Failure to $method $apiEndpoint: $e');
+    throw failure();
+  }
+}
@@ -0,0 +1,15 @@
+import 'package:dio/dio.dart';
+
+import 'http_client_adapter_stub.dart'
+    if (dart.library.io) 'http_client_adapter_io.dart';
+import 'http_client_config.dart';
+
+/// Creates the long-lived [Dio] that every repository shares.
+///
+/// Register one per app (see the generated `di_setup.dart`) so requests reuse
+/// pooled keep-alive connections instead of paying TCP/TLS setup per call.
+Dio createHttpClient([HttpClientConfig config = const HttpClientConfig()]) {
+  final dio = Dio(BaseOptions(connectTimeout: config.connectTimeout));
+  dio.httpClientAdapter = createHttpClientAdapter(config);
+  return dio;
+}
@@ -0,0 +1,15 @@
+import 'dart:io';
+
+import 'package:dio/dio.dart';
+import 'package:dio/io.dart';
+
+import 'http_client_config.dart';
+
+/// Pooled adapter for platforms with `dart:io`.
+HttpClientAdapter createHttpClientAdapter(HttpClientConfig config) =>
+    IOHttpClientAdapter(
+      createHttpClient: () => HttpClient()
+        ..idleTimeout = config.keepAlive
+        ..maxConnectionsPerHost = config.maxConnectionsPerHost
+        ..connectionTimeout = config.connectTimeout,
+    );
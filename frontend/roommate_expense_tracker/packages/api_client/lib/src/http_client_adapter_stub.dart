@@ -0,0 +1,8 @@
+import 'package:dio/dio.dart';
+
+import 'http_client_config.dart';
+
+/// Default adapter for platforms without `dart:io` (the web), where the
+/// browser pools connections itself.
+HttpClientAdapter createHttpClientAdapter(HttpClientConfig config) =>
+    HttpClientAdapter();
@@ -0,0 +1,18 @@
+/// Connection settings of the app's shared HTTP client (see [createHttpClient]).
+class HttpClientConfig {
+  /// Constructor for [HttpClientConfig].
+  const HttpClientConfig({
+    this.keepAlive = const Duration(seconds: 60),
+    this.maxConnectionsPerHost = 6,
+    this.connectTimeout = const Duration(seconds: 10),
+  });
+
+  /// How long an idle connection is kept open for reuse.
+  final Duration keepAlive;
+
+  /// Upper bound on concurrent connections to one host.
+  final int maxConnectionsPerHost;
+
+  /// How long to wait for a new connection to be established.
+  final Duration connectTimeout;
+}
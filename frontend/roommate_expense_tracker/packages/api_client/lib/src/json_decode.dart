@@ -0,0 +1,30 @@
+import 'dart:convert';
+
+import 'package:flutter/foundation.dart';
+
+/// Default payload length (in characters) from which JSON is decoded on a
+/// background isolate.
+const int defaultBackgroundDecodeThreshold = 64 * 1024;
+
+/// Decodes the JSON [source] and turns it into a [T] with [convert].
+///
+/// Payloads shorter than [threshold] are decoded on the calling isolate, where
+/// spawning an isolate would cost more than the decode itself. Larger ones are
+/// decoded and converted with [compute], so long lists do not block the UI
+/// isolate. [convert] must not capture state that cannot be sent to another
+/// isolate (the generated model converters are static). On web, [compute]
+/// runs on the calling thread.
+Future<T> decodeJsonInBackground<T>(
+  String source,
+  T Function(dynamic json) convert, {
+  int threshold = defaultBackgroundDecodeThreshold,
+}) async {
+  if (source.length < threshold) {
+    return convert(jsonDecode(source));
+  }
+  return compute(
+    (String payload) => convert(jsonDecode(payload)),
+    source,
+    debugLabel: 'decodeJsonInBackground',
+  );
+}
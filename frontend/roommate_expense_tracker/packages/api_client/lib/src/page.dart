@@ -0,0 +1,34 @@
+/// Default number of rows in a page of a keyset-paginated list.
+const int defaultPageSize = 25;
+
+/// One page of a keyset-paginated list.
+///
+/// Pages are ordered by `(created_at, primary key)`, so a page is found through
+/// an index no matter how deep into the list it is.
+class PageResult<T> {
+  const PageResult({
+    required this.items,
+    this.nextCursor,
+  });
+
+  final List<T> items;
+
+  /// Opaque cursor of the following page, or null if this is the last page.
+  final String? nextCursor;
+
+  bool get hasMore => nextCursor != null;
+}
+
+/// Query parameters requesting a page of [pageSize] rows after [cursor]
+/// (the first page if null), newest first unless [ascending].
+Map<String, dynamic> pageQuery({
+  required int pageSize,
+  String? cursor,
+  bool ascending = false,
+}) {
+  return {
+    'page_size': pageSize,
+    'sort_order': ascending ? 'asc' : 'desc',
+    if (cursor != null) 'cursor': cursor,
+  };
+}
@@ -1,5 +1,6 @@
 library expenses_repository;
 
+export 'package:api_client/api_client.dart' show PageResult, defaultPageSize;
 export 'src/failures.dart';
 export 'src/expenses_repository.dart';
 export 'src/models/expenses.dart';
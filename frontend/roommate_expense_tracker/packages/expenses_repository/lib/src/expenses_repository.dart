@@ -67,15 +67,28 @@ class ExpensesRepository {
   /// Constructor for ExpensesRepository.
   ExpensesRepository({
     CacheManager? cacheManager,
-  }) : _cacheManager = cacheManager ?? GetIt.instance<CacheManager>();
+    Dio? dio,
+  })  : _cacheManager = cacheManager ?? GetIt.instance<CacheManager>(),
+        _dio = dio ?? GetIt.instance<Dio>();
 
   final CacheManager _cacheManager;
+  final Dio _dio; // The app's shared, pooled HTTP client (see createHttpClient)
 
   Expenses _expenses = Expenses.empty;
   Expenses get expenses => _expenses;
 
   List<Expenses> _expensesList = [];
   List<Expenses> get expensesList => _expensesList;
+
+  // Recently read objects and lists, in front of the persistent cache
+  final _expensesMemory = MemoryCache<String, Expenses>(
+    maxEntries: Expenses.memoryCacheSize,
+    ttl: Expenses.cacheDuration,
+  );
+  final _expensesListMemory = MemoryCache<String, List<Expenses>>(
+    maxEntries: Expenses.memoryCacheSize,
+    ttl: Expenses.cacheDuration,
+  );
 }
 
 extension Create on ExpensesRepository {
@@ -88,11 +101,14 @@ extension Create on ExpensesRepository {
     required Map<String, dynamic> data,
     required String token,
   }) async {
+    // A new row changes the lists read so far
+    _expensesListMemory.clear();
+
     // No valid cache, or forceRefresh is true, fetch from API
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/expenses/',
         method: 'POST',
         headers: {
@@ -115,7 +131,7 @@ extension Create on ExpensesRepository {
           'expense_id': _expenses.expenseId!,
         }),
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
       return _expenses;
@@ -143,13 +159,25 @@ extension Read on ExpensesRepository {
       'object': 'expenses',
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _expensesListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _expensesList = cachedList;
+        return _expensesList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
         try {
-          final List<dynamic> jsonData = jsonDecode(cachedData);
-          _expensesList =
-              Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+          _expensesList = await decodeJsonInBackground(
+            cachedData,
+            (json) => Expenses.converter(
+                (json as List<dynamic>).cast<Map<String, dynamic>>()),
+          );
+          _expensesListMemory.put(cacheKey, _expensesList);
           return _expensesList;
         } catch (e) {
           debugPrint(
@@ -163,7 +191,7 @@ extension Read on ExpensesRepository {
       if (orderBy.isEmpty) orderBy = Expenses.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/expenses?sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
         headers: {
@@ -183,10 +211,18 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
-      _expensesList = Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+      // Large lists are converted on a background isolate
+      _expensesList = responseBody.length < defaultBackgroundDecodeThreshold
+          ? Expenses.converter(jsonData.cast<Map<String, dynamic>>())
+          : await decodeJsonInBackground(
+              responseBody,
+              (json) => Expenses.converter(
+                  (json as List<dynamic>).cast<Map<String, dynamic>>()),
+            );
+      _expensesListMemory.put(cacheKey, _expensesList);
       return _expensesList;
     } catch (e) {
       debugPrint('Failure to fetch all expenses: $e');
@@ -194,6 +230,44 @@ extension Read on ExpensesRepository {
     }
   }
 
+  /// Fetch a page of [Expenses] objects from Rds, newest first unless
+  /// [ascending].
+  ///
+  /// Pages are keyed on (created_at, expense_id): pass the
+  /// [PageResult.nextCursor] of a page as [cursor] to fetch the one after it.
+  /// Pages are not cached, as new rows shift every page after them.
+  Future<PageResult<Expenses>> fetchExpensesPage({
+    required String token,
+    int pageSize = defaultPageSize,
+    String? cursor,
+    bool ascending = false,
+  }) async {
+    try {
+      final response = await dioRequest(
+        dio: _dio,
+        apiEndpoint: '/expenses',
+        method: 'GET',
+        headers: {
+          'Authorization': 'Bearer $token',
+        },
+        payload: pageQuery(
+            pageSize: pageSize, cursor: cursor, ascending: ascending),
+      );
+      if (response['success'] != true) {
+        throw ExpensesFailure.fromGet();
+      }
+
+      final List<dynamic> jsonData = response['data']!;
+      return PageResult(
+        items: Expenses.converter(jsonData.cast<Map<String, dynamic>>()),
+        nextCursor: response['next_cursor'] as String?,
+      );
+    } catch (e) {
+      debugPrint('Failure to fetch a page of expenses: $e');
+      throw ExpensesFailure.fromGet();
+    }
+  }
+
   /// Fetch single() [Expenses] object from Rds.
   ///
   /// Return data if exists, or an empty instance of [Expenses].
@@ -204,6 +278,15 @@ extension Read on ExpensesRepository {
     required String token,
     bool forceRefresh = false,
   }) async {
+    // Serve an object read recently from memory
+    if (!forceRefresh) {
+      final cachedExpenses = _expensesMemory.get(expenseId);
+      if (cachedExpenses != null) {
+        _expenses = cachedExpenses;
+        return _expenses;
+      }
+    }
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'expenses',
@@ -216,6 +299,7 @@ extension Read on ExpensesRepository {
         try {
           final Map<String, dynamic> jsonData = jsonDecode(cachedData);
           _expenses = Expenses.converterSingle(jsonData);
+          _expensesMemory.put(expenseId, _expenses);
           return _expenses;
         } catch (e) {
           debugPrint(
@@ -228,7 +312,7 @@ extension Read on ExpensesRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/expenses/$expenseId',
         method: 'GET',
         headers: {
@@ -246,11 +330,12 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
       _expenses = Expenses.converterSingle(jsonData);
 
+      _expensesMemory.put(expenseId, _expenses);
       return _expenses;
     } catch (e) {
       debugPrint('Failure to fetch expenses with expenseId: $e');
@@ -278,13 +363,25 @@ extension Read on ExpensesRepository {
       'house_id': houseId,
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _expensesListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _expensesList = cachedList;
+        return _expensesList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
         try {
-          final List<dynamic> jsonData = jsonDecode(cachedData);
-          _expensesList =
-              Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+          _expensesList = await decodeJsonInBackground(
+            cachedData,
+            (json) => Expenses.converter(
+                (json as List<dynamic>).cast<Map<String, dynamic>>()),
+          );
+          _expensesListMemory.put(cacheKey, _expensesList);
           return _expensesList;
         } catch (e) {
           debugPrint(
@@ -298,7 +395,7 @@ extension Read on ExpensesRepository {
       if (orderBy.isEmpty) orderBy = Expenses.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/expenses?house_member_id=$houseMemberId&house_id=$houseId&sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
@@ -319,10 +416,18 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
-      _expensesList = Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+      // Large lists are converted on a background isolate
+      _expensesList = responseBody.length < defaultBackgroundDecodeThreshold
+          ? Expenses.converter(jsonData.cast<Map<String, dynamic>>())
+          : await decodeJsonInBackground(
+              responseBody,
+              (json) => Expenses.converter(
+                  (json as List<dynamic>).cast<Map<String, dynamic>>()),
+            );
+      _expensesListMemory.put(cacheKey, _expensesList);
       return _expensesList;
     } catch (e) {
       debugPrint('Failure to fetch all expenses: $e');
@@ -330,6 +435,47 @@ extension Read on ExpensesRepository {
     }
   }
 
+  /// Fetch a page of [Expenses] objects from Rds, newest first unless
+  /// [ascending].
+  ///
+  /// Requires the [houseMemberId] for lookup. Pass the [PageResult.nextCursor]
+  /// of a page as [cursor] to fetch the one after it.
+  Future<PageResult<Expenses>> fetchExpensesPageWithHouseMemberId({
+    required String houseMemberId,
+    required String token,
+    int pageSize = defaultPageSize,
+    String? cursor,
+    bool ascending = false,
+  }) async {
+    try {
+      final response = await dioRequest(
+        dio: _dio,
+        apiEndpoint: '/expenses',
+        method: 'GET',
+        headers: {
+          'Authorization': 'Bearer $token',
+        },
+        payload: {
+          'house_member_id': houseMemberId,
+          ...pageQuery(
+              pageSize: pageSize, cursor: cursor, ascending: ascending),
+        },
+      );
+      if (response['success'] != true) {
+        throw ExpensesFailure.fromGet();
+      }
+
+      final List<dynamic> jsonData = response['data']!;
+      return PageResult(
+        items: Expenses.converter(jsonData.cast<Map<String, dynamic>>()),
+        nextCursor: response['next_cursor'] as String?,
+      );
+    } catch (e) {
+      debugPrint('Failure to fetch a page of expenses with houseMemberId: $e');
+      throw ExpensesFailure.fromGet();
+    }
+  }
+
   /// Fetch list of all [Expenses] objects from Rds.
   ///
   /// Requires the [houseMemberId] for lookup
@@ -351,9 +497,11 @@ extension Read on ExpensesRepository {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
         try {
-          final List<dynamic> jsonData = jsonDecode(cachedData);
-          _expensesList =
-              Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+          _expensesList = await decodeJsonInBackground(
+            cachedData,
+            (json) => Expenses.converter(
+                (json as List<dynamic>).cast<Map<String, dynamic>>()),
+          );
           return _expensesList;
         } catch (e) {
           debugPrint(
@@ -365,7 +513,7 @@ extension Read on ExpensesRepository {
     // No valid cache, or forceRefresh is true, fetch from API
     try {
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/expenses/my-expenses?house_member_id=$houseMemberId&house_id=$houseId',
         method: 'GET',
@@ -386,10 +534,17 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
-      _expensesList = Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+      // Large lists are converted on a background isolate
+      _expensesList = responseBody.length < defaultBackgroundDecodeThreshold
+          ? Expenses.converter(jsonData.cast<Map<String, dynamic>>())
+          : await decodeJsonInBackground(
+              responseBody,
+              (json) => Expenses.converter(
+                  (json as List<dynamic>).cast<Map<String, dynamic>>()),
+            );
       return _expensesList;
     } catch (e) {
       debugPrint('Failure to fetch all expenses: $e');
@@ -433,7 +588,7 @@ extension Read on ExpensesRepository {
     // No valid cache, or forceRefresh is true, fetch from API
     try {
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/expenses/my-total-expenses?house_member_id=$houseMemberId&house_id=$houseId',
         method: 'GET',
@@ -459,7 +614,7 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
       return total;
@@ -509,13 +664,25 @@ extension Read on ExpensesRepository {
       'house_id': houseId,
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _expensesListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _expensesList = cachedList;
+        return _expensesList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
         try {
-          final List<dynamic> jsonData = jsonDecode(cachedData);
-          _expensesList =
-              Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+          _expensesList = await decodeJsonInBackground(
+            cachedData,
+            (json) => Expenses.converter(
+                (json as List<dynamic>).cast<Map<String, dynamic>>()),
+          );
+          _expensesListMemory.put(cacheKey, _expensesList);
           return _expensesList;
         } catch (e) {
           debugPrint(
@@ -529,7 +696,7 @@ extension Read on ExpensesRepository {
       if (orderBy.isEmpty) orderBy = Expenses.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/expenses?house_id=$houseId&sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
@@ -553,10 +720,18 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
-      _expensesList = Expenses.converter(jsonData.cast<Map<String, dynamic>>());
+      // Large lists are converted on a background isolate
+      _expensesList = responseBody.length < defaultBackgroundDecodeThreshold
+          ? Expenses.converter(jsonData.cast<Map<String, dynamic>>())
+          : await decodeJsonInBackground(
+              responseBody,
+              (json) => Expenses.converter(
+                  (json as List<dynamic>).cast<Map<String, dynamic>>()),
+            );
+      _expensesListMemory.put(cacheKey, _expensesList);
       return _expensesList;
     } catch (e) {
       debugPrint('Failure to fetch all expenses: $e');
@@ -564,6 +739,47 @@ extension Read on ExpensesRepository {
     }
   }
 
+  /// Fetch a page of [Expenses] objects from Rds, newest first unless
+  /// [ascending].
+  ///
+  /// Requires the [houseId] for lookup. Pass the [PageResult.nextCursor]
+  /// of a page as [cursor] to fetch the one after it.
+  Future<PageResult<Expenses>> fetchExpensesPageWithHouseId({
+    required String houseId,
+    required String token,
+    int pageSize = defaultPageSize,
+    String? cursor,
+    bool ascending = false,
+  }) async {
+    try {
+      final response = await dioRequest(
+        dio: _dio,
+        apiEndpoint: '/expenses',
+        method: 'GET',
+        headers: {
+          'Authorization': 'Bearer $token',
+        },
+        payload: {
+          'house_id': houseId,
+          ...pageQuery(
+              pageSize: pageSize, cursor: cursor, ascending: ascending),
+        },
+      );
+      if (response['success'] != true) {
+        throw ExpensesFailure.fromGet();
+      }
+
+      final List<dynamic> jsonData = response['data']!;
+      return PageResult(
+        items: Expenses.converter(jsonData.cast<Map<String, dynamic>>()),
+        nextCursor: response['next_cursor'] as String?,
+      );
+    } catch (e) {
+      debugPrint('Failure to fetch a page of expenses with houseId: $e');
+      throw ExpensesFailure.fromGet();
+    }
+  }
+
   /// Fetch list of all [Expenses] objects from Rds.
   Future<List<Map<String, dynamic>>> fetchWeeklyExpenseCategories({
     required String houseId,
@@ -595,7 +811,7 @@ extension Read on ExpensesRepository {
     // No valid cache, or forceRefresh is true, fetch from API
     try {
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/expenses/categories?house_member_id=$houseMemberId&house_id=$houseId',
         method: 'GET',
@@ -621,7 +837,7 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
       return jsonData.cast<Map<String, dynamic>>();
@@ -668,7 +884,7 @@ extension Read on ExpensesRepository {
     // No valid cache, or forceRefresh is true, fetch from API
     try {
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/expenses/this-week?house_member_id=$houseMemberId&house_id=$houseId',
         method: 'GET',
@@ -694,7 +910,7 @@ extension Read on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
       return jsonData.cast<Map<String, dynamic>>();
@@ -716,6 +932,10 @@ extension Update on ExpensesRepository {
     required Expenses newExpensesData,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _expensesMemory.remove(expenseId);
+    _expensesListMemory.clear();
+
     try {
       // Get cache key
       final cacheKey = generateCacheKey({
@@ -727,7 +947,7 @@ extension Update on ExpensesRepository {
 
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/expenses/$expenseId',
         method: 'PATCH',
         headers: {
@@ -749,7 +969,7 @@ extension Update on ExpensesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Expenses.cacheDuration,
       );
 
       // Update local object
@@ -774,10 +994,14 @@ extension Delete on ExpensesRepository {
     required String expenseId,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _expensesMemory.remove(expenseId);
+    _expensesListMemory.clear();
+
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/expenses/$expenseId',
         method: 'DELETE',
         headers: {
@@ -87,6 +87,10 @@ class Expenses extends Equatable {
   static String get createdAtConverter => 'created_at';
   static String get updatedAtConverter => 'updated_at';
 
+  // Cache policy for Expenses (utilities/data/cache_policy.json)
+  static const cacheDuration = Duration(minutes: 15);
+  static const memoryCacheSize = 32;
+
   // Defines the empty state for the Expenses
   static const empty = Expenses(
     houseId: '',
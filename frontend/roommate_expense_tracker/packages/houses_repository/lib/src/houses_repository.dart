@@ -10,15 +10,28 @@ class HousesRepository {
   /// Constructor for HousesRepository.
   HousesRepository({
     CacheManager? cacheManager,
-  }) : _cacheManager = cacheManager ?? GetIt.instance<CacheManager>();
+    Dio? dio,
+  })  : _cacheManager = cacheManager ?? GetIt.instance<CacheManager>(),
+        _dio = dio ?? GetIt.instance<Dio>();
 
   final CacheManager _cacheManager;
+  final Dio _dio; // The app's shared, pooled HTTP client (see createHttpClient)
 
   Houses _houses = Houses.empty;
   Houses get houses => _houses;
 
   List<Houses> _housesList = [];
   List<Houses> get housesList => _housesList;
+
+  // Recently read objects and lists, in front of the persistent cache
+  final _housesMemory = MemoryCache<String, Houses>(
+    maxEntries: Houses.memoryCacheSize,
+    ttl: Houses.cacheDuration,
+  );
+  final _housesListMemory = MemoryCache<String, List<Houses>>(
+    maxEntries: Houses.memoryCacheSize,
+    ttl: Houses.cacheDuration,
+  );
 }
 
 extension Create on HousesRepository {
@@ -33,6 +46,9 @@ extension Create on HousesRepository {
     required String userId,
     bool forceRefresh = true,
   }) async {
+    // A new row changes the lists read so far
+    _housesListMemory.clear();
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'houses',
@@ -58,7 +74,7 @@ extension Create on HousesRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/houses/',
         method: 'POST',
         headers: {
@@ -81,7 +97,7 @@ extension Create on HousesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Houses.cacheDuration,
       );
 
       _houses = Houses.converterSingle(jsonData);
@@ -110,12 +126,22 @@ extension Read on HousesRepository {
       'object': 'houses',
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _housesListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _housesList = cachedList;
+        return _housesList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
         try {
           final List<dynamic> jsonData = jsonDecode(cachedData);
           _housesList = Houses.converter(jsonData.cast<Map<String, dynamic>>());
+          _housesListMemory.put(cacheKey, _housesList);
           return _housesList;
         } catch (e) {
           debugPrint(
@@ -129,7 +155,7 @@ extension Read on HousesRepository {
       if (orderBy.isEmpty) orderBy = Houses.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/houses?sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
         headers: {
@@ -149,10 +175,11 @@ extension Read on HousesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Houses.cacheDuration,
       );
 
       _housesList = Houses.converter(jsonData.cast<Map<String, dynamic>>());
+      _housesListMemory.put(cacheKey, _housesList);
       return _housesList;
     } catch (e) {
       debugPrint('Failure to fetch all houses: $e');
@@ -170,6 +197,15 @@ extension Read on HousesRepository {
     required String token,
     bool forceRefresh = false, // Added parameter to force API call
   }) async {
+    // Serve an object read recently from memory
+    if (!forceRefresh) {
+      final cachedHouses = _housesMemory.get(houseId);
+      if (cachedHouses != null) {
+        _houses = cachedHouses;
+        return _houses;
+      }
+    }
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'houses',
@@ -182,6 +218,7 @@ extension Read on HousesRepository {
         try {
           final Map<String, dynamic> jsonData = jsonDecode(cachedData);
           _houses = Houses.converterSingle(jsonData);
+          _housesMemory.put(houseId, _houses);
           return _houses;
         } catch (e) {
           debugPrint('Error decoding cached houses data for key $cacheKey: $e');
@@ -193,7 +230,7 @@ extension Read on HousesRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/houses/$houseId',
         method: 'GET',
         headers: {
@@ -211,11 +248,12 @@ extension Read on HousesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Houses.cacheDuration,
       );
 
       _houses = Houses.converterSingle(jsonData);
 
+      _housesMemory.put(houseId, _houses);
       return _houses;
     } catch (e) {
       debugPrint('Failure to fetch houses with houseId: $e');
@@ -235,6 +273,10 @@ extension Update on HousesRepository {
     required Houses newHousesData,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _housesMemory.remove(houseId);
+    _housesListMemory.clear();
+
     try {
       // Get cache key
       final cacheKey = generateCacheKey({
@@ -246,7 +288,7 @@ extension Update on HousesRepository {
 
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/houses/$houseId',
         method: 'PATCH',
         headers: {
@@ -268,7 +310,7 @@ extension Update on HousesRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Houses.cacheDuration,
       );
 
       // Update local object
@@ -293,10 +335,14 @@ extension Delete on HousesRepository {
     required String houseId,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _housesMemory.remove(houseId);
+    _housesListMemory.clear();
+
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/houses/$houseId',
         method: 'DELETE',
         headers: {
@@ -56,6 +56,10 @@ class Houses extends Equatable {
   static String get createdAtConverter => 'created_at';
   static String get updatedAtConverter => 'updated_at';
 
+  // Cache policy for Houses (utilities/data/cache_policy.json)
+  static const cacheDuration = Duration(minutes: 120);
+  static const memoryCacheSize = 8;
+
   // Defines the empty state for the Houses
   static const empty = Houses(
     name: '',
@@ -87,6 +87,10 @@ class HouseMembers extends Equatable {
   static String get nicknameConverter => 'nickname';
   static String get isActiveConverter => 'is_active';
 
+  // Cache policy for HouseMembers (utilities/data/cache_policy.json)
+  static const cacheDuration = Duration(minutes: 60);
+  static const memoryCacheSize = 16;
+
   // Defines the empty state for the HouseMembers
   static const empty = HouseMembers(
     userId: '',
@@ -87,6 +87,10 @@ class Users extends Equatable {
   static String get createdAtConverter => 'created_at';
   static String get updatedAtConverter => 'updated_at';
 
+  // Cache policy for Users (utilities/data/cache_policy.json)
+  static const cacheDuration = Duration(minutes: 120);
+  static const memoryCacheSize = 16;
+
   // Defines the empty state for the Users
   static const empty = Users(
     email: '',
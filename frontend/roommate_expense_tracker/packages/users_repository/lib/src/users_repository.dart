@@ -107,10 +107,12 @@ class UsersRepository {
     Dio? dio,
   })  : _cacheManager = cacheManager ?? GetIt.instance<CacheManager>(),
         _googleSignIn = googleSignIn ?? GetIt.instance<GoogleSignIn>(),
-        _firebaseAuth = firebaseAuth ?? GetIt.instance<FirebaseAuth>();
+        _firebaseAuth = firebaseAuth ?? GetIt.instance<FirebaseAuth>(),
+        _dio = dio ?? GetIt.instance<Dio>();
   final GoogleSignIn _googleSignIn; // Instance of Google Sign In
   final CacheManager _cacheManager; // Instance of the CacheManager
   final FirebaseAuth _firebaseAuth;
+  final Dio _dio; // The app's shared, pooled HTTP client (see createHttpClient)
 
   GoogleSignInAccount? _currentUser;
   GoogleSignInAccount? get currentUser => _currentUser;
@@ -124,6 +126,17 @@ class UsersRepository {
 
   List<Users> _usersList = [];
   List<Users> get usersList => _usersList;
+
+  // Recently read objects and lists, in front of the persistent cache
+  final _usersMemory = MemoryCache<String, Users>(
+    maxEntries: Users.memoryCacheSize,
+    ttl: Users.cacheDuration,
+  );
+  final _usersListMemory = MemoryCache<String, List<Users>>(
+    maxEntries: Users.memoryCacheSize,
+    ttl: Users.cacheDuration,
+  );
+
   HouseMembers _houseMembers = HouseMembers.empty;
   HouseMembers get houseMembers => _houseMembers;
 
@@ -137,6 +150,16 @@ class UsersRepository {
   List<HouseMembers> _houseMembersList = [];
   List<HouseMembers> get houseMembersList => _houseMembersList;
 
+  // Recently read objects and lists, in front of the persistent cache
+  final _houseMembersMemory = MemoryCache<String, HouseMembers>(
+    maxEntries: HouseMembers.memoryCacheSize,
+    ttl: HouseMembers.cacheDuration,
+  );
+  final _houseMembersListMemory = MemoryCache<String, List<HouseMembers>>(
+    maxEntries: HouseMembers.memoryCacheSize,
+    ttl: HouseMembers.cacheDuration,
+  );
+
   List<UserHouseData> _userHousesList = [];
   List<UserHouseData> get userHousesList => _userHousesList;
 }
@@ -257,6 +280,9 @@ extension Create on UsersRepository {
     required String? photoUrl,
     bool forceRefresh = true,
   }) async {
+    // A new row changes the lists read so far
+    _usersListMemory.clear();
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'users',
@@ -281,7 +307,7 @@ extension Create on UsersRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/users',
         method: 'POST',
         headers: {
@@ -304,7 +330,7 @@ extension Create on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Users.cacheDuration,
       );
 
       _users = Users.converterSingle(jsonData);
@@ -331,6 +357,9 @@ extension Create on UsersRepository {
     required String token,
     bool forceRefresh = true,
   }) async {
+    // A new row changes the lists read so far
+    _houseMembersListMemory.clear();
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'house_members',
@@ -359,7 +388,7 @@ extension Create on UsersRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/house-members/',
         method: 'POST',
         headers: {
@@ -384,7 +413,7 @@ extension Create on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembers = HouseMembers.converterSingle(jsonData);
@@ -432,7 +461,7 @@ extension Read on UsersRepository {
     await _cacheManager.cacheHttpResponse(
       key: cacheKey,
       responseBody: responseBody,
-      cacheDuration: const Duration(minutes: 60),
+      cacheDuration: HouseMembers.cacheDuration,
     );
 
     _houseId = houseId;
@@ -474,7 +503,7 @@ extension Read on UsersRepository {
     await _cacheManager.cacheHttpResponse(
       key: cacheKey,
       responseBody: responseBody,
-      cacheDuration: const Duration(minutes: 60),
+      cacheDuration: HouseMembers.cacheDuration,
     );
 
     _memberId = memberId;
@@ -513,7 +542,7 @@ extension Read on UsersRepository {
     // No valid cache, or forceRefresh is true, fetch from API
     try {
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/user-houses/$userId',
         method: 'GET',
         headers: {
@@ -534,7 +563,7 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _userHousesList =
@@ -562,12 +591,22 @@ extension Read on UsersRepository {
       'object': 'users',
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _usersListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _usersList = cachedList;
+        return _usersList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
         try {
           final List<dynamic> jsonData = jsonDecode(cachedData);
           _usersList = Users.converter(jsonData.cast<Map<String, dynamic>>());
+          _usersListMemory.put(cacheKey, _usersList);
           return _usersList;
         } catch (e) {
           debugPrint(
@@ -581,7 +620,7 @@ extension Read on UsersRepository {
       if (orderBy.isEmpty) orderBy = Users.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/users?sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
         headers: {
@@ -601,10 +640,11 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Users.cacheDuration,
       );
 
       _usersList = Users.converter(jsonData.cast<Map<String, dynamic>>());
+      _usersListMemory.put(cacheKey, _usersList);
       return _usersList;
     } catch (e) {
       debugPrint('Failure to fetch all users: $e');
@@ -622,6 +662,15 @@ extension Read on UsersRepository {
     required String token,
     bool forceRefresh = false, // Added parameter to force API call
   }) async {
+    // Serve an object read recently from memory
+    if (!forceRefresh) {
+      final cachedUsers = _usersMemory.get(userId);
+      if (cachedUsers != null) {
+        _users = cachedUsers;
+        return _users;
+      }
+    }
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'users',
@@ -634,6 +683,7 @@ extension Read on UsersRepository {
         try {
           final Map<String, dynamic> jsonData = jsonDecode(cachedData);
           _users = Users.converterSingle(jsonData);
+          _usersMemory.put(userId, _users);
           return _users;
         } catch (e) {
           debugPrint('Error decoding cached users data for key $cacheKey: $e');
@@ -645,7 +695,7 @@ extension Read on UsersRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/users/$userId',
         method: 'GET',
         headers: {
@@ -663,11 +713,12 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Users.cacheDuration,
       );
 
       _users = Users.converterSingle(jsonData);
 
+      _usersMemory.put(userId, _users);
       return _users;
     } catch (e) {
       debugPrint('Failure to fetch users with userId: $e');
@@ -709,7 +760,7 @@ extension Read on UsersRepository {
       debugPrint('finding user with email $email');
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/users?email=$email',
         method: 'GET',
         headers: {
@@ -735,7 +786,7 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Users.cacheDuration,
       );
 
       _users = Users.converterSingle(jsonData);
@@ -763,6 +814,15 @@ extension Read on UsersRepository {
       'object': 'house_members',
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _houseMembersListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _houseMembersList = cachedList;
+        return _houseMembersList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
@@ -770,6 +830,7 @@ extension Read on UsersRepository {
           final List<dynamic> jsonData = jsonDecode(cachedData);
           _houseMembersList =
               HouseMembers.converter(jsonData.cast<Map<String, dynamic>>());
+          _houseMembersListMemory.put(cacheKey, _houseMembersList);
           return _houseMembersList;
         } catch (e) {
           debugPrint(
@@ -783,7 +844,7 @@ extension Read on UsersRepository {
       if (orderBy.isEmpty) orderBy = HouseMembers.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/house-members?sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
@@ -804,11 +865,12 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembersList =
           HouseMembers.converter(jsonData.cast<Map<String, dynamic>>());
+      _houseMembersListMemory.put(cacheKey, _houseMembersList);
       return _houseMembersList;
     } catch (e) {
       debugPrint('Failure to fetch all house_members: $e');
@@ -816,6 +878,44 @@ extension Read on UsersRepository {
     }
   }
 
+  /// Fetch a page of [HouseMembers] objects from Postgres, newest first unless
+  /// [ascending].
+  ///
+  /// Pages are keyed on (created_at, house_member_id): pass the
+  /// [PageResult.nextCursor] of a page as [cursor] to fetch the one after it.
+  /// Pages are not cached, as new rows shift every page after them.
+  Future<PageResult<HouseMembers>> fetchHouseMembersPage({
+    required String token,
+    int pageSize = defaultPageSize,
+    String? cursor,
+    bool ascending = false,
+  }) async {
+    try {
+      final response = await dioRequest(
+        dio: _dio,
+        apiEndpoint: '/house-members',
+        method: 'GET',
+        headers: {
+          'Authorization': 'Bearer $token',
+        },
+        payload: pageQuery(
+            pageSize: pageSize, cursor: cursor, ascending: ascending),
+      );
+      if (response['success'] != true) {
+        throw UsersFailure.fromGet();
+      }
+
+      final List<dynamic> jsonData = response['data']!;
+      return PageResult(
+        items: HouseMembers.converter(jsonData.cast<Map<String, dynamic>>()),
+        nextCursor: response['next_cursor'] as String?,
+      );
+    } catch (e) {
+      debugPrint('Failure to fetch a page of house_members: $e');
+      throw UsersFailure.fromGet();
+    }
+  }
+
   /// Fetch single() [HouseMembers] object from Postgres.
   ///
   /// Return data if exists, or an empty instance of [HouseMembers].
@@ -826,6 +926,15 @@ extension Read on UsersRepository {
     required String token,
     bool forceRefresh = false, // Added parameter to force API call
   }) async {
+    // Serve an object read recently from memory
+    if (!forceRefresh) {
+      final cachedHouseMembers = _houseMembersMemory.get(houseMemberId);
+      if (cachedHouseMembers != null) {
+        _houseMembers = cachedHouseMembers;
+        return _houseMembers;
+      }
+    }
+
     // Get cache key
     final cacheKey = generateCacheKey({
       'object': 'house_members',
@@ -838,6 +947,7 @@ extension Read on UsersRepository {
         try {
           final Map<String, dynamic> jsonData = jsonDecode(cachedData);
           _houseMembers = HouseMembers.converterSingle(jsonData);
+          _houseMembersMemory.put(houseMemberId, _houseMembers);
           return _houseMembers;
         } catch (e) {
           debugPrint(
@@ -850,7 +960,7 @@ extension Read on UsersRepository {
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/house-members/$houseMemberId',
         method: 'GET',
         headers: {
@@ -868,11 +978,12 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembers = HouseMembers.converterSingle(jsonData);
 
+      _houseMembersMemory.put(houseMemberId, _houseMembers);
       return _houseMembers;
     } catch (e) {
       debugPrint('Failure to fetch houseMembers with houseMemberId: $e');
@@ -898,6 +1009,15 @@ extension Read on UsersRepository {
       'user_id': userId,
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _houseMembersListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _houseMembersList = cachedList;
+        return _houseMembersList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
@@ -905,6 +1025,7 @@ extension Read on UsersRepository {
           final List<dynamic> jsonData = jsonDecode(cachedData);
           _houseMembersList =
               HouseMembers.converter(jsonData.cast<Map<String, dynamic>>());
+          _houseMembersListMemory.put(cacheKey, _houseMembersList);
           return _houseMembersList;
         } catch (e) {
           debugPrint(
@@ -918,7 +1039,7 @@ extension Read on UsersRepository {
       if (orderBy.isEmpty) orderBy = HouseMembers.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/house-members?user_id=$userId&sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
@@ -939,11 +1060,12 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembersList =
           HouseMembers.converter(jsonData.cast<Map<String, dynamic>>());
+      _houseMembersListMemory.put(cacheKey, _houseMembersList);
       return _houseMembersList;
     } catch (e) {
       debugPrint('Failure to fetch all house_members: $e');
@@ -951,6 +1073,47 @@ extension Read on UsersRepository {
     }
   }
 
+  /// Fetch a page of [HouseMembers] objects from Postgres, newest first unless
+  /// [ascending].
+  ///
+  /// Requires the [userId] for lookup. Pass the [PageResult.nextCursor]
+  /// of a page as [cursor] to fetch the one after it.
+  Future<PageResult<HouseMembers>> fetchHouseMembersPageWithUserId({
+    required String userId,
+    required String token,
+    int pageSize = defaultPageSize,
+    String? cursor,
+    bool ascending = false,
+  }) async {
+    try {
+      final response = await dioRequest(
+        dio: _dio,
+        apiEndpoint: '/house-members',
+        method: 'GET',
+        headers: {
+          'Authorization': 'Bearer $token',
+        },
+        payload: {
+          'user_id': userId,
+          ...pageQuery(
+              pageSize: pageSize, cursor: cursor, ascending: ascending),
+        },
+      );
+      if (response['success'] != true) {
+        throw UsersFailure.fromGet();
+      }
+
+      final List<dynamic> jsonData = response['data']!;
+      return PageResult(
+        items: HouseMembers.converter(jsonData.cast<Map<String, dynamic>>()),
+        nextCursor: response['next_cursor'] as String?,
+      );
+    } catch (e) {
+      debugPrint('Failure to fetch a page of house_members with userId: $e');
+      throw UsersFailure.fromGet();
+    }
+  }
+
   /// Fetch list of all [HouseMembers] objects from Postgres.
   ///
   /// Requires the [houseId] for lookup
@@ -969,6 +1132,15 @@ extension Read on UsersRepository {
       'house_id': houseId,
     });
 
+    // Serve a list read recently from memory
+    if (!forceRefresh) {
+      final cachedList = _houseMembersListMemory.get(cacheKey);
+      if (cachedList != null) {
+        _houseMembersList = cachedList;
+        return _houseMembersList;
+      }
+    }
+
     if (!forceRefresh) {
       final cachedData = await _cacheManager.getCachedHttpResponse(cacheKey);
       if (cachedData != null) {
@@ -976,6 +1148,7 @@ extension Read on UsersRepository {
           final List<dynamic> jsonData = jsonDecode(cachedData);
           _houseMembersList =
               HouseMembers.converter(jsonData.cast<Map<String, dynamic>>());
+          _houseMembersListMemory.put(cacheKey, _houseMembersList);
           return _houseMembersList;
         } catch (e) {
           debugPrint(
@@ -989,7 +1162,7 @@ extension Read on UsersRepository {
       if (orderBy.isEmpty) orderBy = HouseMembers.createdAtConverter;
       final ascendingQuery = ascending ? 'asc' : 'desc';
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/house-members?house_id=$houseId&sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
@@ -1010,11 +1183,12 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembersList =
           HouseMembers.converter(jsonData.cast<Map<String, dynamic>>());
+      _houseMembersListMemory.put(cacheKey, _houseMembersList);
       return _houseMembersList;
     } catch (e) {
       debugPrint('Failure to fetch all house_members: $e');
@@ -1022,6 +1196,47 @@ extension Read on UsersRepository {
     }
   }
 
+  /// Fetch a page of [HouseMembers] objects from Postgres, newest first unless
+  /// [ascending].
+  ///
+  /// Requires the [houseId] for lookup. Pass the [PageResult.nextCursor]
+  /// of a page as [cursor] to fetch the one after it.
+  Future<PageResult<HouseMembers>> fetchHouseMembersPageWithHouseId({
+    required String houseId,
+    required String token,
+    int pageSize = defaultPageSize,
+    String? cursor,
+    bool ascending = false,
+  }) async {
+    try {
+      final response = await dioRequest(
+        dio: _dio,
+        apiEndpoint: '/house-members',
+        method: 'GET',
+        headers: {
+          'Authorization': 'Bearer $token',
+        },
+        payload: {
+          'house_id': houseId,
+          ...pageQuery(
+              pageSize: pageSize, cursor: cursor, ascending: ascending),
+        },
+      );
+      if (response['success'] != true) {
+        throw UsersFailure.fromGet();
+      }
+
+      final List<dynamic> jsonData = response['data']!;
+      return PageResult(
+        items: HouseMembers.converter(jsonData.cast<Map<String, dynamic>>()),
+        nextCursor: response['next_cursor'] as String?,
+      );
+    } catch (e) {
+      debugPrint('Failure to fetch a page of house_members with houseId: $e');
+      throw UsersFailure.fromGet();
+    }
+  }
+
   /// Fetch single() [HouseMembers] object from Postgres.
   ///
   /// Return data if exists, or an empty instance of [HouseMembers].
@@ -1061,7 +1276,7 @@ extension Read on UsersRepository {
 
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/house-members?$queryString',
         method: 'GET',
         headers: {
@@ -1082,7 +1297,7 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembers = HouseMembers.converterSingle(jsonData);
@@ -1133,7 +1348,7 @@ extension Read on UsersRepository {
 
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/house-members?$queryString',
         method: 'GET',
         headers: {
@@ -1154,7 +1369,7 @@ extension Read on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       _houseMembers = HouseMembers.converterSingle(jsonData);
@@ -1178,6 +1393,10 @@ extension Update on UsersRepository {
     required Users newUsersData,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _usersMemory.remove(userId);
+    _usersListMemory.clear();
+
     try {
       // Get cache key
       final cacheKey = generateCacheKey({
@@ -1190,7 +1409,7 @@ extension Update on UsersRepository {
 
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/users/$userId',
         method: 'PATCH',
         headers: {
@@ -1212,7 +1431,7 @@ extension Update on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: Users.cacheDuration,
       );
 
       // Update local object
@@ -1238,6 +1457,10 @@ extension Update on UsersRepository {
     required HouseMembers newHouseMembersData,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _houseMembersMemory.remove(houseMemberId);
+    _houseMembersListMemory.clear();
+
     try {
       // Get cache key
       final cacheKey = generateCacheKey({
@@ -1249,7 +1472,7 @@ extension Update on UsersRepository {
 
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/house-members/$houseMemberId',
         method: 'PATCH',
         headers: {
@@ -1271,7 +1494,7 @@ extension Update on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
 
       // Update local object
@@ -1296,10 +1519,14 @@ extension Delete on UsersRepository {
     required String userId,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _usersMemory.remove(userId);
+    _usersListMemory.clear();
+
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/users/$userId',
         method: 'DELETE',
         headers: {
@@ -1327,10 +1554,14 @@ extension Delete on UsersRepository {
     required String houseMemberId,
     required String token,
   }) async {
+    // Drop the in-memory copies of the row being changed
+    _houseMembersMemory.remove(houseMemberId);
+    _houseMembersListMemory.clear();
+
     try {
       // Retrieve new row after inserting
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint: '/house-members/$houseMemberId',
         method: 'DELETE',
         headers: {
@@ -1385,7 +1616,7 @@ extension Delete on UsersRepository {
       final ascendingQuery = ascending ? 'asc' : 'desc';
 
       final response = await dioRequest(
-        dio: Dio(),
+        dio: _dio,
         apiEndpoint:
             '/house-members/$houseId/user-info?sort_by=$orderBy&sort_order=$ascendingQuery',
         method: 'GET',
@@ -1407,7 +1638,7 @@ extension Delete on UsersRepository {
       await _cacheManager.cacheHttpResponse(
         key: cacheKey,
         responseBody: responseBody,
-        cacheDuration: const Duration(minutes: 60),
+        cacheDuration: HouseMembers.cacheDuration,
       );
       return userList;
     } catch (e) {
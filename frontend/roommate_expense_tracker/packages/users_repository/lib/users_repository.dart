@@ -1,5 +1,6 @@
 library users_repository;
 
+export 'package:api_client/api_client.dart' show PageResult, defaultPageSize;
 export 'src/failures.dart';
 export 'src/users_repository.dart';
 export 'src/models/users.dart';
@@ -0,0 +1,220 @@
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, '..', 'common'))
+sys.path.append(os.path.join(current_dir, '..', 'generate'))
+
+import jinja2
+
+import utils
+from inputs import load_inputs
+from manifest import Manifest, MANIFEST_FILE_NAME
+from parallel import create_executor
+from formatter import DartFormatter
+
+# Importing the one-shot generator gives us the stage modules and their Jinja environments
+import generate
+import generate_repositories
+import generate_features
+import generate_lib
+from synthetic_schema import write_inputs, MIN_COLUMNS, MAX_COLUMNS
+
+# --- Benchmark Settings ---
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+RESULTS_FILE = Path("benchmark_results.json")
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Runs the generator stages against synthetic schemas of increasing size and "
+                    "writes wall time, peak traced memory, files written and bytes produced to JSON.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, metavar="TABLES", help=f"Table counts to benchmark (default: {' '.join(map(str, DEFAULT_SIZES))}).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic schemas (default: 0).")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Render worker processes (default: 1). Traced memory only covers this process.")
+    parser.add_argument("--shared-fetch", action="store_true", help="Render repositories against api_client's cachedFetch helper (generate.py --shared-fetch).")
+    parser.add_argument(
+        "--background-decode",
+        nargs="?",
+        const=generate.BACKGROUND_DECODE_THRESHOLD,
+        type=int,
+        metavar="CHARS",
+        help="Render list reads that decode large payloads on a background isolate (generate.py --background-decode).",
+    )
+    parser.add_argument("--typed-cache", action="store_true", help="Render models with Isar record collections and repositories that cache rows in them (generate.py --typed-cache).")
+    parser.add_argument("--format", action="store_true", help="Run 'dart format' on the outputs, as a real run does (requires dart).")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE, metavar="FILE", help=f"Where the JSON results are written (default: {RESULTS_FILE}).")
+    parser.add_argument("--baseline", type=Path, metavar="FILE", help="A previous results file to compare against.")
+    parser.add_argument("--verbose", action="store_true", help="Show the generator's progress output.")
+    return parser.parse_args()
+
+def git_commit() -> str | None:
+    """Returns the checked-out commit, so result files can be told apart across commits."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=current_dir)
+    except FileNotFoundError:
+        return None
+    return result.stdout.strip() or None
+
+def snapshot(root: Path) -> dict:
+    """Returns path -> (mtime, size) for every file under root."""
+    return {path: (path.stat().st_mtime_ns, path.stat().st_size) for path in root.rglob("*") if path.is_file()}
+
+def run_stage(name: str, root: Path, stage, verbose: bool) -> dict:
+    """
+    Runs one generator stage and measures it.
+
+    Returns:
+        dict: wall/CPU seconds, peak traced memory and the files and bytes the stage wrote.
+    """
+    before = snapshot(root)
+    tracemalloc.reset_peak()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with open(os.devnull, "w") as devnull, redirect_stdout(sys.stdout if verbose else devnull):
+        stage()
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    peak = tracemalloc.get_traced_memory()[1]
+    after = snapshot(root)
+    written = [path for path, stat in after.items() if before.get(path) != stat]
+    result = {
+        "wall_s": round(wall, 6),
+        "cpu_s": round(cpu, 6),
+        "peak_traced_bytes": peak,
+        "files_written": len(written),
+        "bytes_written": sum(after[path][1] for path in written),
+    }
+    print(f"  {name:<13} {wall:9.3f}s  {peak / 2**20:9.1f} MiB  {len(written):6d} files  {result['bytes_written'] / 2**20:9.2f} MiB")
+    return result
+
+def benchmark_size(table_count: int, args, work_dir: Path) -> dict:
+    """Synthesises a schema with table_count tables and runs every stage into a fresh output root."""
+    data_paths = write_inputs(work_dir / "data", table_count, args.seed)
+    root = work_dir / "app"
+    root.mkdir()
+
+    tracemalloc.reset_peak()
+    parse_start = time.perf_counter()
+    inputs = load_inputs(**data_paths)
+    parse_wall = time.perf_counter() - parse_start
+    columns = sum(len(fields) for fields in inputs.schema.values())
+    print(f"\n--- {table_count} tables, {columns} columns, {len(inputs.model_map)} repositories ---")
+
+    # A cold format cache per size, so --format measures the formatter itself
+    formatter = DartFormatter(root, enabled=args.format, cache_dir=work_dir / "format_cache")
+    manifest = Manifest(root / MANIFEST_FILE_NAME, formatter=formatter.version)
+    stages = {}
+    with create_executor(args.jobs) as executor:
+        stages["repositories"] = run_stage("repositories", root, lambda: generate_repositories.generate_all_repositories(
+            all_tables_schema=inputs.schema,
+            repo_model_mapping=inputs.model_map,
+            schema_key_mapping=inputs.table_keys,
+            output_dir=root / "packages",
+            manifest=manifest,
+            executor=executor,
+            formatter=formatter,
+            tables=inputs.tables,
+            shared_fetch=args.shared_fetch,
+            decode_threshold=args.background_decode,
+            typed_cache=args.typed_cache,
+        ), args.verbose)
+        stages["features"] = run_stage("features", root, lambda: generate_features.generate_all_features(
+            repo_model_mapping=inputs.model_map,
+            schema_key_mapping=inputs.table_keys,
+            output_dir=root / "lib" / "features",
+            manifest=manifest,
+            executor=executor,
+            formatter=formatter,
+            tables=inputs.tables,
+        ), args.verbose)
+    stages["lib"] = run_stage("lib", root, lambda: generate_lib.generate_all_lib_files(inputs.repositories, manifest, formatter, root_dir=root, typed_cache=args.typed_cache), args.verbose)
+    stages["manifest"] = run_stage("manifest", root, manifest.save, args.verbose)
+
+    return {
+        "tables": table_count,
+        "columns": columns,
+        "repositories": len(inputs.model_map),
+        "parse_inputs_s": round(parse_wall, 6),
+        "stages": stages,
+        "total": {
+            "wall_s": round(parse_wall + sum(stage["wall_s"] for stage in stages.values()), 6),
+            "peak_traced_bytes": max(stage["peak_traced_bytes"] for stage in stages.values()),
+            "files_written": sum(stage["files_written"] for stage in stages.values()),
+            "bytes_written": sum(stage["bytes_written"] for stage in stages.values()),
+        },
+    }
+
+def print_comparison(results: dict, baseline: dict):
+    """Prints the wall time and peak memory of each size relative to a baseline results file."""
+    print(f"\n--- Compared to {baseline.get('commit') or 'baseline'} ---")
+    previous = {str(size["tables"]): size for size in baseline["sizes"]}
+    for size in results["sizes"]:
+        old = previous.get(str(size["tables"]))
+        if old is None:
+            continue
+        for name, stage in {**size["stages"], "total": size["total"]}.items():
+            old_stage = old["total"] if name == "total" else old["stages"].get(name)
+            if not old_stage or not old_stage["wall_s"]:
+                continue
+            print(
+                f"  {size['tables']:>5} tables  {name:<13} wall x{stage['wall_s'] / old_stage['wall_s']:.2f}  "
+                f"memory x{stage['peak_traced_bytes'] / max(old_stage['peak_traced_bytes'], 1):.2f}"
+            )
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    args = parse_args()
+    utils.set_deterministic_headers(True) # Keeps output sizes comparable between runs
+    print("--- Generator Benchmark ---")
+    print(f"Sizes: {', '.join(map(str, args.sizes))} tables ({MIN_COLUMNS}-{MAX_COLUMNS} columns each)")
+    print(f"Jobs: {args.jobs}")
+    print(f"Dart format: {'on' if args.format else 'off'}")
+    print(f"Shared fetch helper: {'on' if args.shared_fetch else 'off'}")
+    print(f"Background decode: {args.background_decode if args.background_decode else 'off'}")
+    print(f"Typed cache: {'on' if args.typed_cache else 'off'}")
+    print("-" * 50)
+
+    try:
+        tracemalloc.start()
+        template_start = time.perf_counter()
+        generate.load_templates()
+        results = {
+            "generator_version": utils.GENERATOR_VERSION,
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+            "python": platform.python_version(),
+            "jinja2": jinja2.__version__,
+            "settings": {"seed": args.seed, "jobs": args.jobs, "format": args.format, "shared_fetch": args.shared_fetch, "background_decode": args.background_decode, "typed_cache": args.typed_cache},
+            "template_load_s": round(time.perf_counter() - template_start, 6),
+            "sizes": [],
+        }
+        for table_count in args.sizes:
+            with tempfile.TemporaryDirectory(prefix="generator_benchmark_") as work_dir:
+                results["sizes"].append(benchmark_size(table_count, args, Path(work_dir)))
+        try:
+            import resource
+            # Process-wide high-water mark (Linux reports KiB), reached by the largest size
+            results["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        except ImportError:
+            pass # Not available on Windows
+
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+        if args.baseline:
+            print_comparison(results, utils.read_json(args.baseline))
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred during the benchmark: {e}")
+        exit(1)
@@ -0,0 +1,100 @@
+import json
+import random
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(current_dir, '..', 'common'))
+
+from ir import SQL_TO_DART_TYPE
+
+# --- Synthetic Schema Settings ---
+MIN_COLUMNS = 5
+MAX_COLUMNS = 80
+# Tables per repository/feature (the app groups its 4 tables into 3 repositories)
+TABLES_PER_REPOSITORY = 4
+# Foreign keys per table, each referencing the primary key of an earlier table
+MAX_FOREIGN_KEYS = 2
+# How the parameterised SQL types are spelled in schema.txt
+TYPE_SPELLINGS = {
+    "VARCHAR": "VARCHAR(255)",
+    "DECIMAL": "DECIMAL(10, 2)",
+}
+
+def table_name(index: int) -> str:
+    return f"table_{index:05d}"
+
+def repository_name(index: int) -> str:
+    return f"domain_{index:04d}"
+
+def synthesize_inputs(table_count: int, seed: int = 0) -> dict:
+    """
+    Builds a deterministic synthetic schema in the shape of the generator inputs.
+
+    Every table has a UUID primary key, up to MAX_FOREIGN_KEYS foreign keys to earlier
+    tables and MIN_COLUMNS to MAX_COLUMNS columns in total. The remaining columns cycle
+    through every type in SQL_TO_DART_TYPE, so all of them are rendered.
+
+    Args:
+        table_count (int): Number of tables to generate.
+        seed (int): Seed for the column counts and key choices.
+
+    Returns:
+        dict: 'schema' (schema.txt rows as (table, column, type, key) tuples), 'table_keys',
+              'model_map' and 'repositories', as they appear in the input files.
+    """
+    rng = random.Random(seed)
+    sql_types = [TYPE_SPELLINGS.get(sql_type, sql_type) for sql_type in SQL_TO_DART_TYPE]
+    type_cursor = 0
+
+    rows = []
+    table_keys = {}
+    for index in range(table_count):
+        table = table_name(index)
+        primary_key = f"{table}_id"
+        foreign_keys = [f"{table_name(other)}_id" for other in rng.sample(range(index), min(index, rng.randint(0, MAX_FOREIGN_KEYS)))]
+        rows.append((table, primary_key, "UUID", "PK"))
+        rows.extend((table, foreign_key, "UUID", "FK") for foreign_key in foreign_keys)
+
+        columns = []
+        for column_index in range(rng.randint(MIN_COLUMNS, MAX_COLUMNS) - 1 - len(foreign_keys)):
+            sql_type = sql_types[type_cursor % len(sql_types)]
+            type_cursor += 1
+            column = f"{sql_type.split('(')[0].lower()}_{column_index}"
+            columns.append(column)
+            rows.append((table, column, sql_type, None))
+
+        table_keys[table] = {
+            "primary": [primary_key],
+            "foreign": foreign_keys,
+            "not_null": foreign_keys + columns[::4],
+            "unique": columns[:1],
+        }
+
+    model_map = {}
+    for start in range(0, table_count, TABLES_PER_REPOSITORY):
+        model_map[repository_name(start // TABLES_PER_REPOSITORY)] = [table_name(index) for index in range(start, min(start + TABLES_PER_REPOSITORY, table_count))]
+
+    return {"schema": rows, "table_keys": table_keys, "model_map": model_map, "repositories": list(model_map)}
+
+def write_inputs(data_dir: Path, table_count: int, seed: int = 0) -> dict:
+    """
+    Writes synthetic schema.txt, table_keys.json, model_map.json and repositories.txt to data_dir.
+
+    Returns:
+        dict: The paths of the written files, keyed like load_inputs' arguments.
+    """
+    inputs = synthesize_inputs(table_count, seed)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        "schema_file": data_dir / "schema.txt",
+        "table_keys_file": data_dir / "table_keys.json",
+        "model_map_file": data_dir / "model_map.json",
+        "repositories_file": data_dir / "repositories.txt",
+    }
+    paths["schema_file"].write_text("".join("\t".join(part for part in row if part) + "\n" for row in inputs["schema"]))
+    paths["table_keys_file"].write_text(json.dumps(inputs["table_keys"], indent=2) + "\n")
+    paths["model_map_file"].write_text(json.dumps(inputs["model_map"], indent=2) + "\n")
+    paths["repositories_file"].write_text("".join(f"{repository}\n" for repository in inputs["repositories"]))
+    return paths
@@ -0,0 +1,142 @@
+from functools import cache
+from pathlib import Path
+
+from jinja2 import Environment, meta
+
+from ir import cache_policy_for
+
+# --- Dependency Nodes ---
+# Outputs depend on three kinds of nodes, recorded per output in the manifest:
+#   template:<tree>/<name>   a template (and, transitively, everything it includes)
+#   table:<name>             a table's schema.txt rows, table_keys.json entry (or schema.sql table),
+#                            cache_policy.json policy and paginated_tables.json membership
+#   input:<file>             a whole input file (model_map.json, repositories.txt)
+
+# Template variables that come straight from an input file rather than from a table
+VARIABLE_INPUTS = {
+    "models_to_generate": "input:model_map.json",
+    "tables": "input:model_map.json",
+    "repositories": "input:repositories.txt",
+    "repository": "input:repositories.txt",
+}
+
+# Input files whose changes are tracked per table
+TABLE_INPUT_FILES = {"schema.txt", "table_keys.json", "schema.sql", "cache_policy.json", "paginated_tables.json"}
+
+def template_node(env: Environment, template_name: str) -> str:
+    """Returns the dependency node of a template, e.g. 'template:model_template/dart_model.dart.jinja'."""
+    template_dir, _ = env.template_tree
+    return f"template:{template_dir.name}/{template_name}"
+
+def table_nodes(tables) -> list:
+    return [f"table:{table}" for table in tables]
+
+@cache
+def _analyze(env: Environment, template_name: str, source: str) -> tuple:
+    # Keyed by source, so edited templates (watch mode) are analysed again
+    ast = env.parse(source)
+    references = frozenset(name for name in meta.find_referenced_templates(ast) if name)
+    return references, frozenset(meta.find_undeclared_variables(ast))
+
+def template_dependencies(env: Environment, template_name: str) -> set:
+    """
+    Returns the nodes a template depends on: itself, every template it includes,
+    imports or extends (transitively) and the input files behind its variables.
+
+    Dynamic references (a variable passed to include) cannot be resolved statically
+    and are ignored.
+    """
+    nodes = set()
+    pending = [template_name]
+    seen = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        source, _, _ = env.loader.get_source(env, name)
+        references, variables = _analyze(env, name, source)
+        nodes.add(template_node(env, name))
+        nodes.update(VARIABLE_INPUTS[variable] for variable in variables if variable in VARIABLE_INPUTS)
+        pending.extend(references)
+    return nodes
+
+def output_dependencies(env: Environment, template_name: str, tables=()) -> list:
+    """
+    Returns the sorted dependency nodes of an output rendered from template_name.
+
+    Args:
+        env (Environment): The environment the template belongs to.
+        template_name (str): The template the output is rendered from.
+        tables: Tables whose schema rows or keys were fed into the render.
+    """
+    return sorted(template_dependencies(env, template_name) | set(table_nodes(tables)))
+
+# --- Change Detection ---
+
+def changed_input_nodes(old_inputs, new_inputs) -> set:
+    """
+    Compares two parsed GeneratorInputs and returns the nodes that differ, per table
+    for schema.txt, table_keys.json, cache_policy.json and paginated_tables.json and per
+    file for the rest.
+    """
+    nodes = set()
+    for table in old_inputs.schema.keys() | new_inputs.schema.keys() | old_inputs.table_keys.keys() | new_inputs.table_keys.keys():
+        old_table = (
+            old_inputs.schema.get(table),
+            old_inputs.table_keys.get(table),
+            cache_policy_for(table, old_inputs.cache_policy),
+            table in old_inputs.paginated_tables,
+        )
+        new_table = (
+            new_inputs.schema.get(table),
+            new_inputs.table_keys.get(table),
+            cache_policy_for(table, new_inputs.cache_policy),
+            table in new_inputs.paginated_tables,
+        )
+        if old_table != new_table:
+            nodes.add(f"table:{table}")
+    if old_inputs.model_map != new_inputs.model_map:
+        nodes.add("input:model_map.json")
+    if old_inputs.repositories != new_inputs.repositories:
+        nodes.add("input:repositories.txt")
+    return nodes
+
+def nodes_for_paths(paths, inputs, template_envs) -> set:
+    """
+    Maps changed files to dependency nodes. Without a previous copy of the inputs,
+    a change to schema.txt, table_keys.json, cache_policy.json or paginated_tables.json is
+    treated as a change to every table.
+
+    Args:
+        paths: Changed data or template files.
+        inputs (GeneratorInputs): The current inputs (for the table list).
+        template_envs: The Jinja environments whose template trees may contain the paths.
+    """
+    nodes = set()
+    for path in paths:
+        path = Path(path).resolve()
+        if path.name in TABLE_INPUT_FILES:
+            nodes.update(table_nodes(inputs.schema.keys() | inputs.table_keys.keys()))
+            continue
+        if path.suffix in {".json", ".txt"}:
+            nodes.add(f"input:{path.name}")
+            continue
+        for env in template_envs:
+            template_dir, _ = env.template_tree
+            if template_dir.resolve() in path.parents:
+                nodes.add(template_node(env, path.relative_to(template_dir.resolve()).as_posix()))
+    return nodes
+
+def affected_outputs(manifest, nodes: set) -> list:
+    """
+    Returns the minimal set of outputs to re-render for a set of changed nodes.
+
+    Args:
+        manifest (Manifest): Holds the recorded dependencies of every output.
+        nodes (set): Changed dependency nodes.
+
+    Returns:
+        list: Sorted output paths (relative to the manifest) that depend on any of the nodes.
+    """
+    return sorted(output for output, dependencies in manifest.dependencies.items() if nodes.intersection(dependencies))
@@ -0,0 +1,197 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import profiling
+import utils
+
+FORMAT_CACHE_DIR = utils.CACHE_DIR / "format"
+
+# --- Format Cache ---
+
+class FormatCache:
+    """
+    Content-addressed store of 'dart format' results: the key is the sha256 of the
+    formatter version, the root's analysis options and the unformatted bytes, the
+    value is the formatted bytes. Entries never go stale (a different input is a
+    different key), so switching branches back and forth reuses them; the directory
+    is safe to delete at any time.
+    """
+
+    def __init__(self, cache_dir: Path, version: str, options: bytes = b""):
+        self.cache_dir = Path(cache_dir)
+        self._salt = hashlib.sha256(version.encode("utf-8") + b"\0" + options).digest()
+        self.hits = 0
+
+    def key(self, source: bytes) -> str:
+        return hashlib.sha256(self._salt + source).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            data = self._path(key).read_bytes()
+        except OSError:
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, formatted: bytes):
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(formatted)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not cache formatted output in '{self.cache_dir}': {e}")
+
+# --- Dart Formatter ---
+
+class DartFormatter:
+    """
+    Formats rendered Dart sources before they are written, so only formatted
+    bytes reach disk and write_if_changed compares like with like.
+
+    Each batch is staged in a temporary directory under `root` (so 'dart format'
+    resolves the same language version and analysis options as the real files)
+    and formatted by a single 'dart format' run, paying the Dart VM startup once
+    per batch instead of once per package. Sources formatted before (per the
+    FormatCache) skip the formatter entirely.
+
+    With a plan (generate.py --plan), dart is never run: the formatter version is
+    passed in (the one the manifest recorded), sources are only served from the
+    FormatCache, and those it misses are reported to the plan (Plan.mark_unformatted),
+    which then ignores layout-only differences for them.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        enabled: bool = True,
+        cache_dir: Path | None = FORMAT_CACHE_DIR,
+        plan=None,
+        version: str | None = None,
+    ):
+        self.root = Path(root)
+        self.plan = plan
+        if plan is not None:
+            self.version = version if enabled else None
+        else:
+            self.version = self._detect_version() if enabled else None
+        self.cache = None
+        if self.available and cache_dir is not None:
+            # Page width and language options can come from the root's analysis options
+            options_file = self.root / "analysis_options.yaml"
+            options = options_file.read_bytes() if options_file.exists() else b""
+            self.cache = FormatCache(cache_dir, self.version, options)
+
+    @staticmethod
+    def _detect_version() -> str | None:
+        try:
+            result = subprocess.run(["dart", "--version"], capture_output=True, text=True, check=True)
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            print("Warning: 'dart' command not found. Generated Dart files will be written unformatted.")
+            return None
+        return (result.stdout or result.stderr).strip()
+
+    @property
+    def available(self) -> bool:
+        return self.version is not None
+
+    def format_sources(self, sources: list, staged_files: list = ()) -> list:
+        """
+        Formats Dart sources (and staged files, in place) with one 'dart format' invocation.
+
+        Args:
+            sources (list): Dart source strings.
+            staged_files (list): Paths of streamed outputs (utils.stage_stream) to format in place.
+
+        Returns:
+            list: The formatted sources, in the same order. Sources that could not be
+                  formatted (or all of them, if dart is unavailable) are returned unchanged.
+        """
+        return self._format_sources(sources, staged_files)[0]
+
+    def _format_sources(self, sources: list, staged_files: list = ()) -> tuple:
+        """format_sources, also returning the indices of the sources left unformatted while planning."""
+        if not self.available or not (sources or staged_files):
+            return list(sources), list(range(len(sources)))
+
+        # Serve whatever was formatted before from the cache
+        encoded = [source.encode("utf-8") for source in sources]
+        formatted = list(encoded)
+        pending_sources = [] # (index into sources, cache key)
+        pending_staged = [] # (staged path, cache key)
+        for index, data in enumerate(encoded):
+            key = self.cache.key(data) if self.cache else None
+            cached = self.cache.get(key) if self.cache else None
+            if cached is None:
+                pending_sources.append((index, key))
+            else:
+                formatted[index] = cached
+        for staged_file in staged_files:
+            key = self.cache.key(Path(staged_file).read_bytes()) if self.cache else None
+            cached = self.cache.get(key) if self.cache else None
+            if cached is None:
+                pending_staged.append((Path(staged_file), key))
+            else:
+                Path(staged_file).write_bytes(cached)
+
+        cached_count = len(sources) + len(staged_files) - len(pending_sources) - len(pending_staged)
+        if cached_count:
+            print(f"{cached_count} Dart files already formatted (format cache).")
+        if self.plan is not None:
+            # Planning never runs the formatter: cache misses are planned as rendered
+            return [data.decode("utf-8") for data in formatted], [index for index, _ in pending_sources]
+        if not (pending_sources or pending_staged):
+            return [data.decode("utf-8") for data in formatted], []
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Not a dot-directory: 'dart format' skips hidden directories
+        staging_dir = Path(tempfile.mkdtemp(prefix="_generator_format_", dir=self.root))
+        try:
+            staged_paths = []
+            for index, _ in pending_sources:
+                staged_path = staging_dir / f"source_{index}.dart"
+                staged_path.write_bytes(encoded[index])
+                staged_paths.append(staged_path)
+
+            print(f"Formatting {len(staged_paths) + len(pending_staged)} Dart files...")
+            command = ["dart", "format", str(staging_dir), *(str(path) for path, _ in pending_staged)]
+            with profiling.phase("format"):
+                result = subprocess.run(command, capture_output=True, text=True)
+            succeeded = result.returncode == 0
+            if not succeeded:
+                print(f"Error formatting Dart files. Return code: {result.returncode}")
+                print(result.stderr.strip())
+            for (index, key), staged_path in zip(pending_sources, staged_paths):
+                formatted[index] = staged_path.read_bytes()
+                if self.cache and succeeded: # Partial failures are not cached
+                    self.cache.put(key, formatted[index])
+            if self.cache and succeeded:
+                for path, key in pending_staged:
+                    self.cache.put(key, path.read_bytes())
+            return [data.decode("utf-8") for data in formatted], []
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def format_files(self, files: list):
+        """Formats, in place, the content (or staged file) of every RenderedFile that targets a .dart file."""
+        dart_files = [rendered for rendered in files if rendered.path.suffix == ".dart" and rendered.staged is None]
+        staged_files = [rendered.staged for rendered in files if rendered.path.suffix == ".dart" and rendered.staged is not None]
+        sources = [
+            rendered.content.decode("utf-8") if isinstance(rendered.content, bytes) else rendered.content
+            for rendered in dart_files
+        ]
+        formatted_sources, unformatted = self._format_sources(sources, staged_files)
+        for rendered, formatted in zip(dart_files, formatted_sources):
+            rendered.content = formatted
+        if self.plan is not None:
+            for index in unformatted:
+                self.plan.mark_unformatted(dart_files[index].path)
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import utils
+from ir import build_tables
+from sql_schema import derive_schema, derive_table_keys, load_schema_sql
+
+# --- Generator Inputs ---
+
+@dataclass
+class GeneratorInputs:
+    """
+    In-memory model of every generator input, parsed once per run.
+
+    Attributes:
+        schema (dict): Table name -> list of (column, sql_type) tuples from schema.txt
+                       (or derived from schema.sql).
+        table_keys (dict): Table name -> primary/foreign/not_null/unique columns from
+                           table_keys.json (or derived from schema.sql).
+        model_map (dict): Repository/feature name -> list of table names from model_map.json.
+        repositories (list): Repository names from repositories.txt.
+        tables (dict): Table name -> ir.Table, built once from schema and table_keys and
+                       shared by every stage's templates.
+        cache_policy (dict): Table name (or 'default') -> TTL and in-memory cache size from
+                             cache_policy.json. Resolved per table into `tables`.
+        paginated_tables (list): Tables whose backend list endpoint is paginated, from
+                                 paginated_tables.json. Resolved per table into `tables`.
+    """
+    schema: dict
+    table_keys: dict
+    model_map: dict
+    repositories: list
+    tables: dict
+    cache_policy: dict
+    paginated_tables: list
+
+def load_cache_policy(cache_policy_file: Path | None) -> dict:
+    """Reads cache_policy.json; a missing file means every table gets the default policy."""
+    if cache_policy_file is None or not Path(cache_policy_file).exists():
+        return {}
+    return utils.read_json(cache_policy_file)
+
+def load_paginated_tables(paginated_tables_file: Path | None) -> list:
+    """Reads paginated_tables.json; a missing file means no list read is paginated."""
+    if paginated_tables_file is None or not Path(paginated_tables_file).exists():
+        return []
+    return utils.read_json(paginated_tables_file)
+
+def load_inputs(
+    schema_file: Path,
+    table_keys_file: Path,
+    model_map_file: Path,
+    repositories_file: Path,
+    cache_policy_file: Path | None = None,
+    paginated_tables_file: Path | None = None,
+) -> GeneratorInputs:
+    """
+    Parses schema.txt, table_keys.json, model_map.json, repositories.txt, cache_policy.json
+    and paginated_tables.json into a GeneratorInputs.
+    """
+    schema = utils.read_schema(schema_file)
+    table_keys = utils.read_json(table_keys_file)
+    cache_policy = load_cache_policy(cache_policy_file)
+    paginated_tables = load_paginated_tables(paginated_tables_file)
+    return GeneratorInputs(
+        schema=schema,
+        table_keys=table_keys,
+        model_map=utils.read_json(model_map_file),
+        repositories=utils.read_repositories(repositories_file),
+        tables=build_tables(schema, table_keys, cache_policy, paginated_tables),
+        cache_policy=cache_policy,
+        paginated_tables=paginated_tables,
+    )
+
+def load_inputs_from_sql(
+    schema_sql_file: Path,
+    model_map_file: Path,
+    repositories_file: Path,
+    cache_policy_file: Path | None = None,
+    paginated_tables_file: Path | None = None,
+) -> GeneratorInputs:
+    """
+    Like load_inputs, but derives the schema and key mapping from the backend's
+    schema.sql (parsed once per version of the file, see sql_schema.load_schema_sql)
+    instead of reading schema.txt and table_keys.json.
+    """
+    sql_tables = load_schema_sql(schema_sql_file)
+    schema = derive_schema(sql_tables)
+    table_keys = derive_table_keys(sql_tables)
+    cache_policy = load_cache_policy(cache_policy_file)
+    paginated_tables = load_paginated_tables(paginated_tables_file)
+    return GeneratorInputs(
+        schema=schema,
+        table_keys=table_keys,
+        model_map=utils.read_json(model_map_file),
+        repositories=utils.read_repositories(repositories_file),
+        tables=build_tables(schema, table_keys, cache_policy, paginated_tables),
+        cache_policy=cache_policy,
+        paginated_tables=paginated_tables,
+    )
@@ -0,0 +1,258 @@
+from dataclasses import dataclass
+
+import utils
+
+# --- SQL to Dart Type Mappings ---
+SQL_TO_DART_TYPE = {
+    'UUID': 'String?',
+    'VARCHAR': 'String',
+    'TEXT': 'String',
+    'BOOLEAN': 'bool',
+    'TIMESTAMP': 'DateTime?',
+    'DATE': 'DateTime?',
+    'DATETIME': 'DateTime?',
+    'INTEGER': 'int',
+    'INT': 'int',
+    'DECIMAL': 'double',
+    'ENUM': 'String',
+    'JSONB': 'Map<String, dynamic>',
+}
+
+DEFAULTS = {
+    'UUID': "''",
+    'VARCHAR': "''",
+    'TEXT': "''",
+    'BOOLEAN': 'false',
+    'TIMESTAMP': 'DateTime.now().toUtc()',
+    'DATE': 'DateTime.now().toUtc()',
+    'DATETIME': 'DateTime.now().toUtc()',
+    'INTEGER': '0',
+    'INT': '0',
+    'DECIMAL': '0.0',
+    'ENUM': "''",
+    'JSONB': 'const {}',
+}
+
+def map_sql_type(sql_type):
+    base = sql_type.split("(")[0]
+    return SQL_TO_DART_TYPE.get(base.upper(), "String")
+
+def default_value(sql_type):
+    base = sql_type.split("(")[0].upper()
+    return DEFAULTS.get(base, "''")
+
+# Column that orders keyset-paginated list reads (with the primary key as tiebreaker)
+KEYSET_COLUMN = 'created_at'
+
+# Cache policy of tables without an entry (or a "default" entry) in cache_policy.json
+DEFAULT_CACHE_POLICY_KEY = 'default'
+DEFAULT_CACHE_POLICY = {'ttl_minutes': 60, 'memory_entries': 16}
+
+# --- Intermediate Representation ---
+# Built once per run from schema.txt and table_keys.json and handed to every template,
+# so templates only emit precomputed strings instead of converting names per use.
+
+@dataclass(slots=True, frozen=True)
+class Key:
+    """A key column of a table (primary, foreign, not-null or unique), with its name forms."""
+    column: str # e.g. 'house_id'
+    camel: str # e.g. 'houseId'
+    pascal: str # e.g. 'HouseId'
+
+@dataclass(slots=True, frozen=True)
+class Column:
+    """A column of a table with everything the model template emits for it."""
+    column: str
+    camel_name: str
+    sql_type: str
+    dart_type: str # e.g. 'DateTime?'
+    dart_type_clean: str # dart_type without '?'
+    is_nullable: bool
+    default: str # Dart default value, e.g. "''"
+    default_value_part: str # ' = default' for non-nullable constructor parameters
+    default_value_part_colon: str # ': default' for the empty instance
+    json_parse_logic: str # Dart expression reading the column from `json`
+    default_value_json: str
+    is_primary_key: bool
+    is_foreign_key: bool
+    is_not_null: bool
+    is_unique_key: bool
+
+@dataclass(slots=True, frozen=True)
+class Table:
+    """
+    A table with its precomputed names, columns and key roles.
+
+    Attributes:
+        name (str): The snake_case table name, e.g. 'house_members'.
+        pascal (str): e.g. 'HouseMembers' (the model class name).
+        camel (str): e.g. 'houseMembers'.
+        dashed (str): e.g. 'house-members' (the API route).
+        columns (tuple): Column entries in schema.txt order (empty if the table is not in schema.txt).
+        primary, foreign, not_null, unique (tuple): Key entries per role, in table_keys.json order.
+        has_keys (bool): Whether table_keys.json has a (non-empty) entry for the table.
+        has_bool (bool): Whether any column maps to a Dart bool.
+        has_datetime (bool): Whether any column maps to a Dart DateTime.
+        paginated (bool): Whether list reads get keyset-paginated variants, ordered by
+                          (created_at, first primary key). Only for tables listed in
+                          paginated_tables.json (the backend pages their list endpoint),
+                          and needs both columns.
+        cacheable (bool): Whether the model gets an Isar record collection with --typed-cache;
+                          needs a string first primary key column (hashed into the Isar id).
+        cache_ttl_minutes (int): How long the model's rows stay cached, persistently and in memory.
+        memory_cache_size (int): Most objects (and lists) of the model a repository holds in memory.
+    """
+    name: str
+    pascal: str
+    camel: str
+    dashed: str
+    columns: tuple
+    primary: tuple
+    foreign: tuple
+    not_null: tuple
+    unique: tuple
+    has_keys: bool
+    has_bool: bool
+    has_datetime: bool
+    paginated: bool
+    cacheable: bool
+    cache_ttl_minutes: int
+    memory_cache_size: int
+
+@dataclass(slots=True, frozen=True)
+class Name:
+    """The name forms of an identifier (e.g. a repository) that templates emit."""
+    snake: str # e.g. 'house_members'
+    camel: str # e.g. 'houseMembers'
+    pascal: str # e.g. 'HouseMembers'
+    dashed: str # e.g. 'house-members'
+
+def naming_table(names) -> dict:
+    """
+    Returns name -> Name for every given identifier, for templates that loop over
+    plain names (e.g. `names[repo].pascal` instead of `repo | snake_to_pascal`).
+    """
+    return {
+        name: Name(snake=name, camel=utils.snake_to_camel(name), pascal=utils.snake_to_pascal(name), dashed=utils.dashed(name))
+        for name in names
+    }
+
+def table_signature(table: Table) -> list:
+    """
+    Returns the parts of a table the repository and feature templates read (name and key
+    roles), JSON-serialisable for hash_inputs. Columns only feed the model template.
+    """
+    return [
+        table.name,
+        table.has_keys,
+        table.paginated,
+        table.cacheable,
+        *([key.column for key in keys] for keys in (table.primary, table.foreign, table.not_null, table.unique)),
+    ]
+
+def build_key(column: str) -> Key:
+    return Key(column=column, camel=utils.snake_to_camel(column), pascal=utils.snake_to_pascal(column))
+
+def build_column(class_name: str, column: str, sql_type: str, table_keys: dict) -> Column:
+    """Derives the Dart type, defaults and JSON parse logic of a column of class_name."""
+    camel_name = utils.snake_to_camel(column)
+    dart_type = map_sql_type(sql_type)
+    is_nullable = dart_type.endswith('?')
+    default = default_value(sql_type)
+    needs_default_in_constructor = not is_nullable and default != ''
+
+    if dart_type.startswith("DateTime"):
+        json_parse_logic = (
+            f"json[{camel_name}Converter] != null\n"
+            f"          ? DateTime.tryParse(json[{camel_name}Converter].toString())?.toUtc() ?? {default}\n"
+            f"          : {default}"
+        )
+    elif dart_type == "int":
+        json_parse_logic = f"int.tryParse(json[{camel_name}Converter]?.toString() ?? '') ?? {default}"
+    elif dart_type == "double":
+        json_parse_logic = f"double.tryParse(json[{camel_name}Converter]?.toString() ?? '') ?? {default}"
+    elif dart_type == "bool":
+        json_parse_logic = f"{class_name}._parseBool(json[{camel_name}Converter])"
+    elif dart_type == "Map<String, dynamic>":
+        json_parse_logic = f"json[{camel_name}Converter] as Map<String, dynamic>? ?? {default}"
+    else: # String types
+        json_parse_logic = f"json[{camel_name}Converter]?.toString() ?? {default}"
+
+    return Column(
+        column=column,
+        camel_name=camel_name,
+        sql_type=sql_type,
+        dart_type=dart_type,
+        dart_type_clean=dart_type.replace('?', ''),
+        is_nullable=is_nullable,
+        default=default,
+        default_value_part=f" = {default}" if needs_default_in_constructor else '',
+        default_value_part_colon=f": {default}",
+        json_parse_logic=json_parse_logic,
+        default_value_json='null' if is_nullable and default == "''" else default,
+        is_primary_key=column in table_keys.get("primary", []),
+        is_foreign_key=column in table_keys.get("foreign", []),
+        is_not_null=column in table_keys.get("not_null", []),
+        is_unique_key=column in table_keys.get("unique", []),
+    )
+
+def cache_policy_for(name: str, cache_policy: dict | None) -> dict:
+    """Returns the cache policy of a table: its cache_policy.json entry over the default one."""
+    cache_policy = cache_policy or {}
+    return {**DEFAULT_CACHE_POLICY, **cache_policy.get(DEFAULT_CACHE_POLICY_KEY, {}), **cache_policy.get(name, {})}
+
+def build_table(
+    name: str,
+    fields: list,
+    table_keys: dict | None,
+    cache_policy: dict | None = None,
+    paginated_tables=(),
+) -> Table:
+    """
+    Builds the IR of one table.
+
+    Args:
+        name (str): The table name.
+        fields (list): (column, sql_type) tuples from schema.txt.
+        table_keys (dict | None): The table's table_keys.json entry.
+        cache_policy (dict | None): The whole cache_policy.json (table name or 'default' -> policy).
+        paginated_tables: Names of the tables whose backend list endpoint is paginated
+                          (paginated_tables.json).
+    """
+    keys = table_keys or {}
+    policy = cache_policy_for(name, cache_policy)
+    pascal = utils.snake_to_pascal(name)
+    columns = tuple(build_column(pascal, column, sql_type, keys) for column, sql_type in fields)
+    return Table(
+        name=name,
+        pascal=pascal,
+        camel=utils.snake_to_camel(name),
+        dashed=utils.dashed(name),
+        columns=columns,
+        primary=tuple(build_key(column) for column in keys.get("primary", [])),
+        foreign=tuple(build_key(column) for column in keys.get("foreign", [])),
+        not_null=tuple(build_key(column) for column in keys.get("not_null", [])),
+        unique=tuple(build_key(column) for column in keys.get("unique", [])),
+        has_keys=bool(table_keys),
+        has_bool=any(column.dart_type == "bool" for column in columns),
+        has_datetime=any(column.dart_type.startswith("DateTime") for column in columns),
+        paginated=name in paginated_tables and bool(keys.get("primary")) and any(
+            column.column == KEYSET_COLUMN for column in columns
+        ),
+        cacheable=bool(keys.get("primary")) and any(
+            column.column == keys["primary"][0] and column.dart_type_clean == "String" for column in columns
+        ),
+        cache_ttl_minutes=int(policy['ttl_minutes']),
+        memory_cache_size=int(policy['memory_entries']),
+    )
+
+def build_tables(schema: dict, table_keys: dict, cache_policy: dict | None = None, paginated_tables=()) -> dict:
+    """Builds the IR of every table in schema.txt or table_keys.json, keyed by table name."""
+    return {
+        name: build_table(name, schema.get(name, []), table_keys.get(name), cache_policy, paginated_tables)
+        for name in {**schema, **table_keys}
+    }
+
+def tables_for(tables: dict, names: list) -> list:
+    """Returns the IR of the named tables in order; tables with no schema or keys get an empty entry."""
+    return [tables.get(name) or build_table(name, [], None) for name in names]
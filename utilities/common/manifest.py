@@ -0,0 +1,118 @@
+import hashlib
+import json
+from pathlib import Path
+
+import utils
+
+MANIFEST_FILE_NAME = ".generator_manifest.json"
+
+# --- Input Hashing ---
+
+def hash_inputs(*parts) -> str:
+    """
+    Hashes everything an output depends on into a single digest.
+
+    Args:
+        *parts: JSON-serialisable inputs (schema rows, key entries, template source, ...).
+                The generator version is always mixed in.
+
+    Returns:
+        str: The hex sha256 digest of the inputs.
+    """
+    payload = json.dumps([utils.GENERATOR_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# --- Manifest ---
+
+class Manifest:
+    """
+    Records, per generated file, the hash of the inputs it was rendered from and
+    the dependency nodes (templates, tables, input files) it was rendered from.
+
+    A rerun only renders outputs whose recorded hash differs from the current one
+    (or that no longer exist on disk). A manifest without a path lives in memory only,
+    so every output is rendered and nothing is persisted. With force=True every output
+    is treated as stale, but entries for outputs that are not re-rendered are kept.
+    Outputs are also all stale when the Dart formatter differs from the one that
+    formatted them last time (unless check_formatter is False, e.g. for --plan,
+    which never runs the formatter).
+
+    A run can also be restricted to the outputs affected by a change (restrict_to,
+    used by watch mode): the dependency graph then decides what is re-rendered.
+    """
+
+    def __init__(self, path: Path | None = None, force: bool = False, formatter: str | None = None, check_formatter: bool = True):
+        self.path = path
+        self.root = path.parent if path else None
+        self.force = force
+        self.formatter = formatter
+        self.entries = {}
+        self.dependencies = {}
+        self.only = None # Outputs a restricted run re-renders (see restrict_to)
+        if path and path.exists():
+            try:
+                data = utils.read_json(path)
+                self.entries = data.get("outputs", {})
+                self.dependencies = data.get("dependencies", {})
+                if not check_formatter:
+                    self.formatter = data.get("formatter")
+                elif self.entries and data.get("formatter") != formatter:
+                    print("Dart formatter changed since the last run. Every output will be re-rendered.")
+                    self.force = True
+            except (json.JSONDecodeError, AttributeError):
+                print(f"Warning: Ignoring unreadable manifest '{path}'.")
+                self.entries = {}
+                self.dependencies = {}
+
+    def _key(self, output_path: Path) -> str:
+        if self.root is None:
+            return str(output_path)
+        return Path(output_path).resolve().relative_to(self.root.resolve()).as_posix()
+
+    def restrict_to(self, outputs):
+        """
+        Limits the following renders to the given outputs (relative paths, e.g. from
+        depgraph.affected_outputs): every other existing output with recorded dependencies
+        is current whatever its digest. Outputs the graph does not know yet are still
+        checked by digest. None lifts the restriction.
+        """
+        self.only = None if outputs is None else set(outputs)
+
+    def is_current(self, output_path: Path, digest: str) -> bool:
+        """Returns True if the output exists and was rendered from inputs with this digest."""
+        if self.force:
+            return False
+        key = self._key(output_path)
+        if not Path(output_path).exists():
+            return False
+        if self.only is not None and key in self.dependencies:
+            return key not in self.only
+        return self.entries.get(key) == digest
+
+    def records(self, output_path: Path) -> bool:
+        """Returns True if the output was written by an earlier run."""
+        return self._key(output_path) in self.entries
+
+    def record(self, output_path: Path, digest: str, depends_on: list | None = None):
+        """Stores the input digest (and dependency nodes) for an output that was just written."""
+        key = self._key(output_path)
+        self.entries[key] = digest
+        if depends_on is not None:
+            self.dependencies[key] = sorted(depends_on)
+
+    def forget(self, output_path: Path):
+        """Drops an output that no longer exists."""
+        self.entries.pop(self._key(output_path), None)
+        self.dependencies.pop(self._key(output_path), None)
+
+    def save(self):
+        """Writes the manifest next to the outputs (no-op for in-memory manifests)."""
+        if self.path is None:
+            return
+        data = {
+            "generator_version": utils.GENERATOR_VERSION,
+            "formatter": self.formatter,
+            "outputs": dict(sorted(self.entries.items())),
+            "dependencies": dict(sorted(self.dependencies.items())),
+        }
+        utils.write_if_changed(self.path, json.dumps(data, indent=2) + "\n")
@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import profiling
+import utils
+
+# --- Rendered Output ---
+
+@dataclass
+class RenderedFile:
+    """
+    A generated file that has been rendered but not yet written.
+
+    Attributes:
+        path (Path): Where the file is written.
+        content (str | bytes | None): The rendered text, or raw bytes for static files
+                                      (None when the content was streamed to `staged`).
+        digest (str | None): Input hash recorded in the manifest (None for static files).
+        label (str | None): Progress label (e.g. 'model: Users.dart'); unlabelled files are written silently.
+        depends_on (list | None): Dependency nodes recorded in the manifest (see depgraph).
+        staged (Path | None): Temp file next to path holding streamed content (utils.stage_stream).
+    """
+    path: Path
+    content: str | bytes
+    digest: str | None = None
+    label: str | None = None
+    depends_on: list | None = None
+    staged: Path | None = None
+
+def discard_staged(files: list):
+    """Removes the staged temp files of RenderedFile entries that will not be written."""
+    for rendered in files:
+        if rendered.staged is not None:
+            rendered.staged.unlink(missing_ok=True)
+
+def write_rendered_files(files: list, manifest) -> list:
+    """
+    Writes rendered files in order, skipping those whose bytes are unchanged,
+    and records their input hashes in the manifest.
+
+    Args:
+        files (list): RenderedFile entries to write.
+        manifest (Manifest): Input hashes of generated files.
+
+    Returns:
+        list: Paths of the files whose contents changed on disk.
+    """
+    written_paths = []
+    for index, rendered in enumerate(files):
+        try:
+            with profiling.phase("write", output=str(rendered.path)):
+                if rendered.staged is not None:
+                    written = utils.replace_if_changed(rendered.staged, rendered.path)
+                else:
+                    written = utils.write_if_changed(rendered.path, rendered.content)
+        except BaseException:
+            discard_staged(files[index:])
+            raise
+        if rendered.digest:
+            manifest.record(rendered.path, rendered.digest, rendered.depends_on)
+        if written:
+            written_paths.append(rendered.path)
+        if rendered.label:
+            print(f"    - {'Generated/Overwrote' if written else 'Unchanged'} {rendered.label}")
+    return written_paths
+
+def swap_package(files: list, manifest, package_path: Path, staging_dir: Path | None = None, deletions: list = ()) -> list:
+    """
+    Writes the rendered files of one package all-or-nothing. Every changed file is
+    staged before anything in the package is touched, so a failure while staging
+    leaves the package as it was.
+
+    A new package is built in staging_dir (utils.make_staging_dir) and renamed into
+    place in one step. In an existing package only the changed files are staged, next
+    to their targets, and then renamed over them; deletions run last. While planning,
+    files go through write_rendered_files (and the Plan) as usual.
+
+    Args:
+        files (list): RenderedFile entries of the package. Streamed or copied files of a
+                      new package must be staged inside staging_dir.
+        manifest (Manifest): Input hashes of generated files.
+        package_path (Path): The package directory.
+        staging_dir (Path | None): Scratch copy of a new package; None for an existing one.
+        deletions (list): Generated files of the package that are no longer produced.
+
+    Returns:
+        list: Paths of the files whose contents changed on disk.
+    """
+    if utils.is_planning():
+        written_paths = write_rendered_files(files, manifest)
+        for path in deletions:
+            utils.delete_file(path)
+            manifest.forget(path)
+        return written_paths
+
+    package_path = Path(package_path)
+    swaps = [] # (staged temp or None if unchanged, RenderedFile)
+    index = 0
+    try:
+        with profiling.phase("stage", output=str(package_path)):
+            for index, rendered in enumerate(files):
+                if staging_dir is not None:
+                    target = staging_dir / rendered.path.relative_to(package_path)
+                    if rendered.staged is None:
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        data = rendered.content.encode("utf-8") if isinstance(rendered.content, str) else rendered.content
+                        target.write_bytes(data)
+                    else:
+                        utils.install_staged(rendered.staged, target)
+                    swaps.append((None, rendered))
+                elif rendered.staged is not None:
+                    changed = not utils.same_content(rendered.staged, rendered.path)
+                    if not changed:
+                        rendered.staged.unlink()
+                    swaps.append((rendered.staged if changed else None, rendered))
+                else:
+                    data = rendered.content.encode("utf-8") if isinstance(rendered.content, str) else rendered.content
+                    try:
+                        changed = rendered.path.read_bytes() != data
+                    except FileNotFoundError:
+                        changed = True
+                    swaps.append((utils.stage_bytes(rendered.path, data) if changed else None, rendered))
+    except BaseException:
+        discard_staged(files[index:])
+        for staged, _ in swaps:
+            if staged is not None:
+                staged.unlink(missing_ok=True)
+        utils.remove_staging_dir(staging_dir)
+        raise
+
+    written_paths = []
+    with profiling.phase("swap", output=str(package_path)):
+        if staging_dir is not None:
+            try:
+                staging_dir.rename(package_path)
+            except BaseException:
+                utils.remove_staging_dir(staging_dir)
+                raise
+        for index, (staged, rendered) in enumerate(swaps):
+            if staged is not None:
+                try:
+                    utils.install_staged(staged, rendered.path)
+                except BaseException:
+                    # Temp files must not linger in the package, where the analyzer would see them
+                    for pending, _ in swaps[index:]:
+                        if pending is not None:
+                            pending.unlink(missing_ok=True)
+                    raise
+            written = staging_dir is not None or staged is not None
+            if rendered.digest:
+                manifest.record(rendered.path, rendered.digest, rendered.depends_on)
+            if written:
+                written_paths.append(rendered.path)
+            if rendered.label:
+                print(f"    - {'Generated/Overwrote' if written else 'Unchanged'} {rendered.label}")
+        for path in deletions:
+            utils.delete_file(path)
+            manifest.forget(path)
+            print(f"    - Deleted: {Path(path).name}")
+    return written_paths
@@ -0,0 +1,113 @@
+import re
+from pathlib import Path
+
+# --- Layout Comparison ---
+
+def dart_layout_key(data: bytes) -> bytes:
+    """
+    Strips what 'dart format' changes (whitespace and trailing commas) from Dart source,
+    so an unformatted render can be compared with the formatted file on disk.
+    """
+    return re.sub(rb",([)\]}])", rb"\1", re.sub(rb"\s+", b"", data))
+
+# --- Plan (virtual filesystem) ---
+
+class Plan:
+    """
+    An in-memory overlay of the output tree used by --plan.
+
+    While a plan is active (utils.set_plan), writes, directory creation and deletions
+    are recorded here instead of reaching disk. Reads still see the real tree, so the
+    recorded changes are exactly what a real run would do. Dart files the format cache
+    could not serve are planned unformatted (mark_unformatted), and differences in their
+    layout alone are not counted as changes.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self.files = {} # Relative path -> planned bytes (None for deleted files)
+        self.changes = {} # Relative path -> (status, bytes before, bytes after)
+        self.unformatted = set() # Relative paths of Dart files planned as rendered
+
+    def _key(self, path: Path) -> str:
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def read_bytes(self, path: Path) -> bytes | None:
+        """Returns the planned content of path, falling back to the real file (None if neither exists)."""
+        key = self._key(path)
+        if key in self.files:
+            return self.files[key]
+        try:
+            return Path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def mark_unformatted(self, path: Path):
+        """Records that the next write of a Dart file is unformatted (see DartFormatter)."""
+        self.unformatted.add(self._key(path))
+
+    def write(self, path: Path, data: bytes) -> bool:
+        """Records a write. Returns True if it would change the file, like write_if_changed."""
+        current = self.read_bytes(path)
+        if current == data:
+            return False
+        key = self._key(path)
+        if key in self.unformatted and current is not None and dart_layout_key(current) == dart_layout_key(data):
+            return False # Only 'dart format' would tell them apart
+        before = self.changes.get(key, (None, len(current or b""), None))[1]
+        on_disk = Path(path).exists()
+        self.files[key] = data
+        self.changes[key] = ("changed" if on_disk else "created", before, len(data))
+        return True
+
+    def delete(self, path: Path):
+        """Records the deletion of a file."""
+        key = self._key(path)
+        current = self.read_bytes(path)
+        if current is None:
+            return
+        before = self.changes.get(key, (None, len(current), None))[1]
+        self.files[key] = None
+        if key in self.changes and self.changes[key][0] == "created":
+            del self.changes[key] # Created and deleted within the plan: no change
+        else:
+            self.changes[key] = ("deleted", before, 0)
+
+    def report(self, known_outputs=()) -> dict:
+        """
+        Summarises the plan.
+
+        Args:
+            known_outputs: Relative paths of every previously generated output (the manifest
+                           entries); those the plan did not touch are reported as unchanged.
+
+        Returns:
+            dict: 'created', 'changed' and 'deleted' map paths to byte deltas; 'unchanged'
+                  lists the untouched outputs; 'net_bytes' is the total delta.
+        """
+        report = {"created": {}, "changed": {}, "deleted": {}, "unchanged": [], "net_bytes": 0}
+        for key, (status, before, after) in sorted(self.changes.items()):
+            report[status][key] = after - before
+            report["net_bytes"] += after - before
+        report["unchanged"] = sorted(set(known_outputs) - set(self.changes))
+        return report
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changes)
+
+def print_plan(report: dict):
+    """Prints a plan report, one line per created/changed/deleted file."""
+    print("\n--- Plan ---")
+    for status, marker in (("created", "+"), ("changed", "~"), ("deleted", "-")):
+        for path, delta in report[status].items():
+            print(f"  {marker} {status:<8} {path} ({delta:+d} bytes)")
+    print(
+        f"{len(report['created'])} created, {len(report['changed'])} changed, "
+        f"{len(report['deleted'])} deleted, {len(report['unchanged'])} unchanged "
+        f"(net {report['net_bytes']:+d} bytes)."
+    )
@@ -0,0 +1,137 @@
+import cProfile
+import json
+import platform
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from pathlib import Path
+
+import utils
+
+# Profiling is off unless enable() is called (generate.py --profile), so the
+# phase() markers below cost a function call and nothing else.
+_enabled = False
+_started = None
+_phases = {}
+_outputs = {}
+_stack = []
+_peak = 0
+_cprofile = None
+
+# --- Phase Recording ---
+
+def enable(cprofile: bool = False):
+    """
+    Starts recording phase timings (and optionally a cProfile trace) for this process.
+
+    Args:
+        cprofile (bool): Also collect a cProfile trace, written by write_report.
+    """
+    global _enabled, _started, _cprofile
+    _enabled = True
+    _started = (time.perf_counter(), time.process_time())
+    tracemalloc.start()
+    if cprofile:
+        _cprofile = cProfile.Profile()
+        _cprofile.enable()
+
+def is_enabled() -> bool:
+    return _enabled
+
+@contextmanager
+def _record(name: str, output: str | None):
+    global _peak
+    # Peak memory is tracked per phase; tracemalloc only keeps one peak, so a parent's
+    # running peak is folded in before a child resets it, and the child's after it ends.
+    if _stack:
+        _stack[-1]["peak"] = max(_stack[-1]["peak"], tracemalloc.get_traced_memory()[1])
+    tracemalloc.reset_peak()
+    frame = {"peak": 0}
+    _stack.append(frame)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+        _stack.pop()
+        _peak = max(_peak, peak)
+        if _stack:
+            _stack[-1]["peak"] = max(_stack[-1]["peak"], peak)
+
+        stats = _phases.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_memory_bytes": 0})
+        stats["calls"] += 1
+        stats["wall_s"] += wall
+        stats["cpu_s"] += cpu
+        stats["peak_memory_bytes"] = max(stats["peak_memory_bytes"], peak)
+        if output is not None:
+            output_stats = _outputs.setdefault(output, {})
+            output_stats[f"{name}_wall_s"] = output_stats.get(f"{name}_wall_s", 0.0) + wall
+
+def phase(name: str, output: str | None = None):
+    """
+    Times a block of generator work under a phase name.
+
+    Args:
+        name (str): The phase (e.g. 'parse_inputs', 'render', 'write', 'format', 'pub_get').
+        output (str | None): The output path the work belongs to, for per-output timings.
+
+    Returns:
+        A context manager; a no-op when profiling is disabled.
+    """
+    if not _enabled:
+        return nullcontext()
+    return _record(name, output)
+
+# --- Report ---
+
+def build_report(**run_info) -> dict:
+    """Returns the recorded timings as a JSON-serialisable report."""
+    wall_start, cpu_start = _started
+    report = {
+        "generator_version": utils.GENERATOR_VERSION,
+        "created_at": datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        "python": platform.python_version(),
+        "run": run_info,
+        "total": {
+            "wall_s": round(time.perf_counter() - wall_start, 6),
+            "cpu_s": round(time.process_time() - cpu_start, 6),
+            "peak_memory_bytes": max(_peak, tracemalloc.get_traced_memory()[1]),
+        },
+        "phases": {
+            name: {**stats, "wall_s": round(stats["wall_s"], 6), "cpu_s": round(stats["cpu_s"], 6)}
+            for name, stats in _phases.items()
+        },
+        "outputs": {
+            output: {key: round(value, 6) for key, value in stats.items()}
+            for output, stats in sorted(_outputs.items())
+        },
+    }
+    try:
+        import resource
+        # Includes children, so 'dart format' and 'flutter pub get' are accounted for
+        report["total"]["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        report["total"]["children_max_rss_kb"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    except ImportError:
+        pass # Not available on Windows
+    return report
+
+def write_report(report_path: Path, cprofile_path: Path | None = None, **run_info):
+    """
+    Writes the JSON report and, if it was collected, the cProfile trace (readable with pstats/snakeviz).
+
+    Args:
+        report_path (Path): Where the JSON report is written.
+        cprofile_path (Path | None): Where the cProfile trace is dumped.
+        **run_info: Run settings recorded in the report (jobs, force, ...).
+    """
+    if _cprofile is not None:
+        _cprofile.disable()
+        if cprofile_path:
+            _cprofile.dump_stats(str(cprofile_path))
+            print(f"cProfile trace written to {cprofile_path}")
+    report = build_report(**run_info)
+    utils.write_if_changed(Path(report_path), json.dumps(report, indent=2) + "\n")
+    print(f"Profile report written to {report_path}")
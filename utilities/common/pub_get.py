@@ -0,0 +1,155 @@
+import argparse
+import re
+import subprocess
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+# Resolving is mostly network and disk bound, so a few packages at a time is plenty
+DEFAULT_JOBS = 4
+
+# Directories that never contain packages we own
+SKIPPED_DIRS = {"build", "Pods", "node_modules"}
+
+PATH_PATTERN = re.compile(r"^\s+path:\s*['\"]?([^'\"\s#]+)", re.MULTILINE)
+
+# --- Package Discovery ---
+
+def find_pubspecs(root: Path) -> list:
+    """Finds every pubspec.yaml under root, skipping hidden and build directories."""
+    pubspecs = []
+    for current_root, dirs, files in Path(root).walk():
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in SKIPPED_DIRS)
+        if "pubspec.yaml" in files:
+            pubspecs.append(current_root / "pubspec.yaml")
+    return pubspecs
+
+def read_local_dependencies(pubspec_path: Path) -> set:
+    """
+    Reads the local path dependencies of a package.
+
+    Only 'path:' entries are needed, so the pubspec is scanned with a regex
+    instead of pulling in a YAML parser.
+
+    Returns:
+        set: Resolved directories of the packages this package depends on by path.
+    """
+    content = pubspec_path.read_text(encoding="utf-8")
+    return {(pubspec_path.parent / match).resolve() for match in PATH_PATTERN.findall(content)}
+
+def build_dependency_graph(root: Path) -> dict:
+    """
+    Builds the local path-dependency graph of every package under root.
+
+    Returns:
+        dict: Package directory -> set of package directories it depends on. Dependencies
+              outside root (or without a pubspec) are left out.
+    """
+    packages = {pubspec.parent.resolve(): pubspec for pubspec in find_pubspecs(root)}
+    return {
+        package_dir: {dep for dep in read_local_dependencies(pubspec) if dep in packages and dep != package_dir}
+        for package_dir, pubspec in packages.items()
+    }
+
+def is_fresh(package_dir: Path) -> bool:
+    """Returns True if pubspec.lock and .dart_tool/package_config.json are newer than pubspec.yaml."""
+    pubspec = package_dir / "pubspec.yaml"
+    outputs = [package_dir / "pubspec.lock", package_dir / ".dart_tool" / "package_config.json"]
+    if not all(output.exists() for output in outputs):
+        return False
+    pubspec_mtime = pubspec.stat().st_mtime
+    return all(output.stat().st_mtime > pubspec_mtime for output in outputs)
+
+# --- Resolution ---
+
+def flutter_pub_get(package_dir: Path) -> tuple:
+    """
+    Runs 'flutter pub get' in a package.
+
+    Returns:
+        tuple: (succeeded, message) for the package.
+    """
+    try:
+        subprocess.run(["flutter", "pub", "get"], cwd=package_dir, capture_output=True, text=True, check=True)
+        return True, "flutter pub get completed successfully."
+    except subprocess.CalledProcessError as e:
+        return False, f"Error running 'flutter pub get'. Return code: {e.returncode}\n{e.stderr.strip()}"
+    except FileNotFoundError:
+        return False, "Error: 'flutter' command not found. Ensure Flutter SDK is in PATH."
+
+def run_pub_get(root: Path, jobs: int = DEFAULT_JOBS, force: bool = False) -> bool:
+    """
+    Resolves every package under root in dependency order (app_core and api_client
+    before the repositories, the repositories before the app).
+
+    Packages whose dependencies are resolved run concurrently, at most `jobs` at a time.
+    A package is skipped when it is fresh and none of its local dependencies were
+    resolved in this run. Dependents of a package that failed are not attempted.
+
+    Args:
+        root (Path): The directory to search for pubspec.yaml files.
+        jobs (int): Maximum number of concurrent 'flutter pub get' runs.
+        force (bool): Resolve every package, even fresh ones.
+
+    Returns:
+        bool: True if every package is resolved.
+    """
+    root = Path(root).resolve()
+    graph = build_dependency_graph(root)
+    print(f"Resolving {len(graph)} packages under {root} ({jobs} at a time)...")
+
+    def label(package_dir: Path) -> str:
+        return str(package_dir.relative_to(root)) if package_dir != root else root.name
+
+    remaining = dict(graph)
+    resolved = set() # Packages whose 'flutter pub get' ran in this run
+    done = set()
+    failed = set()
+    running = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while remaining or running:
+            # Start (or skip) every package whose dependencies are finished. Skipping
+            # a package can unblock its dependents, so repeat until nothing changes.
+            scheduled = True
+            while scheduled:
+                scheduled = False
+                for package_dir in sorted(remaining):
+                    dependencies = remaining[package_dir]
+                    if not dependencies <= done:
+                        continue
+                    del remaining[package_dir]
+                    scheduled = True
+                    if dependencies & failed:
+                        print(f"Skipping '{label(package_dir)}': a local dependency failed to resolve.")
+                        failed.add(package_dir)
+                        done.add(package_dir)
+                    elif not force and is_fresh(package_dir) and not dependencies & resolved:
+                        print(f"Up to date: '{label(package_dir)}'.")
+                        done.add(package_dir)
+                    else:
+                        print(f"Running 'flutter pub get' in '{label(package_dir)}'...")
+                        running[executor.submit(flutter_pub_get, package_dir)] = package_dir
+
+            if not running:
+                if remaining: # Only a dependency cycle leaves packages unreachable
+                    print(f"Error: Circular path dependencies between {', '.join(label(p) for p in sorted(remaining))}.")
+                    failed.update(remaining)
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                package_dir = running.pop(future)
+                succeeded, message = future.result()
+                print(f"  {label(package_dir)}: {message}")
+                done.add(package_dir)
+                (resolved if succeeded else failed).add(package_dir)
+
+    return not failed
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Runs 'flutter pub get' for every package, in dependency order.")
+    parser.add_argument("root", nargs="?", default=".", help="Directory to search for pubspec.yaml files (default: .).")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, metavar="N", help="Packages resolved concurrently.")
+    parser.add_argument("--force", action="store_true", help="Resolve packages even if their lock files are fresh.")
+    args = parser.parse_args()
+    exit(0 if run_pub_get(Path(args.root), jobs=args.jobs, force=args.force) else 1)
@@ -0,0 +1,95 @@
+import fnmatch
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import utils
+
+# --- Generated Code Size Budgets ---
+# Budgets are read from a JSON file mapping output path globs (relative to the app root)
+# to {"lines": N, "bytes": N}; the first matching glob applies, then "default".
+# Either limit may be left out (or null) to leave it unbounded.
+
+DEFAULT_BUDGET_KEY = "default"
+# Largest files listed after every run
+TOP_FILES = 5
+
+@dataclass
+class FileSize:
+    """The size of a generated file and the budget it was checked against."""
+    path: str # Relative to the app root
+    lines: int
+    bytes: int
+    budget: str | None # The glob whose budget applies (None if no budget matched)
+    max_lines: int | None
+    max_bytes: int | None
+
+    @property
+    def over_budget(self) -> bool:
+        return (self.max_lines is not None and self.lines > self.max_lines) or (self.max_bytes is not None and self.bytes > self.max_bytes)
+
+def load_budgets(budget_file: Path) -> dict:
+    """Reads the budgets file; a missing file means no budgets."""
+    if not Path(budget_file).exists():
+        return {}
+    return utils.read_json(budget_file)
+
+def budget_for(relative_path: str, budgets: dict) -> tuple:
+    """Returns (glob, budget) for a path: the first matching glob, else the default (or (None, {}))."""
+    for pattern, budget in budgets.items():
+        if pattern != DEFAULT_BUDGET_KEY and fnmatch.fnmatchcase(relative_path, pattern):
+            return pattern, budget or {}
+    if DEFAULT_BUDGET_KEY in budgets:
+        return DEFAULT_BUDGET_KEY, budgets[DEFAULT_BUDGET_KEY] or {}
+    return None, {}
+
+def measure_outputs(root: Path, outputs, budgets: dict) -> list:
+    """
+    Measures generated files on disk.
+
+    Args:
+        root (Path): The app root the output paths are relative to (the manifest's root).
+        outputs: Relative output paths, e.g. the manifest's entries.
+        budgets (dict): Glob -> budget, as load_budgets returns it.
+
+    Returns:
+        list: FileSize entries, largest (in bytes) first. Missing files are skipped.
+    """
+    sizes = []
+    for relative_path in outputs:
+        try:
+            data = (Path(root) / relative_path).read_bytes()
+        except FileNotFoundError:
+            continue
+        lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+        pattern, budget = budget_for(relative_path, budgets)
+        sizes.append(FileSize(relative_path, lines, len(data), pattern, budget.get("lines"), budget.get("bytes")))
+    sizes.sort(key=lambda size: (-size.bytes, size.path))
+    return sizes
+
+def print_size_report(sizes: list):
+    """Prints the totals, the largest files and every file over its budget."""
+    over_budget = [size for size in sizes if size.over_budget]
+    print("\n--- Generated Code Size ---")
+    print(f"{len(sizes)} generated files, {sum(size.lines for size in sizes)} lines, {sum(size.bytes for size in sizes) / 1024:.1f} KiB")
+    for size in sizes[:TOP_FILES]:
+        print(f"  {size.lines:7d} lines  {size.bytes / 1024:8.1f} KiB  {size.path}")
+    if over_budget:
+        print(f"{len(over_budget)} files over budget:")
+        for size in over_budget:
+            print(
+                f"  ! {size.path}: {size.lines} lines (max {size.max_lines if size.max_lines is not None else '-'}), "
+                f"{size.bytes} bytes (max {size.max_bytes if size.max_bytes is not None else '-'}) [{size.budget}]"
+            )
+
+def write_size_report(report_file: Path, sizes: list):
+    """Writes every measured file, with its budget, to a JSON report."""
+    report = {
+        "files": len(sizes),
+        "lines": sum(size.lines for size in sizes),
+        "bytes": sum(size.bytes for size in sizes),
+        "over_budget": [size.path for size in sizes if size.over_budget],
+        "outputs": [asdict(size) for size in sizes],
+    }
+    Path(report_file).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Size report written to {report_file}")
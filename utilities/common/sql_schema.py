@@ -0,0 +1,394 @@
+import bisect
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import utils
+
+# --- schema.sql Parser ---
+# Reads the CREATE TABLE statements of the backend's DDL (backend/node/src/db/schema.sql)
+# directly, so schema.txt and table_keys.json can be derived from it instead of drifting.
+
+# Bump whenever the parser or the IR below changes, so cached schemas are parsed again
+PARSER_VERSION = "1"
+SCHEMA_CACHE_DIR = utils.CACHE_DIR / "schema"
+
+# Words that end a column's type and start its constraints
+COLUMN_CONSTRAINT_WORDS = {
+    "CONSTRAINT", "PRIMARY", "UNIQUE", "NOT", "NULL", "DEFAULT",
+    "CHECK", "REFERENCES", "COLLATE", "GENERATED",
+}
+# Type modifiers that schema.txt (and the type maps in ir.py) leave out
+TYPE_SUFFIXES = re.compile(r"\s+WITH(?:OUT)?\s+TIME\s+ZONE$", re.IGNORECASE)
+
+TOKEN_PATTERN = re.compile(r"""
+    (?P<string>'(?:[^']|'')*')
+  | (?P<quoted>"(?:[^"]|"")*")
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<symbol>::|<=|>=|<>|!=|[(),;.=<>+\-*/%])
+""", re.VERBOSE)
+CREATE_TABLE_PATTERN = re.compile(
+    r"CREATE\s+(?:(?:GLOBAL\s+|LOCAL\s+)?(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"
+    r"(?P<name>(?:\"[^\"]+\"|[A-Za-z_][A-Za-z0-9_$]*)(?:\.(?:\"[^\"]+\"|[A-Za-z_][A-Za-z0-9_$]*))?)\s*\(",
+    re.IGNORECASE,
+)
+
+class SchemaSyntaxError(ValueError):
+    """Raised when a CREATE TABLE statement in schema.sql cannot be parsed."""
+
+@dataclass(slots=True, frozen=True)
+class SqlForeignKey:
+    """A FOREIGN KEY (or inline REFERENCES) constraint."""
+    columns: tuple # e.g. ('house_id',)
+    references: str # The referenced table, e.g. 'houses'
+    referenced_columns: tuple # e.g. ('house_id',); empty means the referenced primary key
+    on_delete: str | None # e.g. 'CASCADE'
+    on_update: str | None
+
+@dataclass(slots=True, frozen=True)
+class SqlColumn:
+    """A column definition, with the constraints written on the column itself."""
+    name: str
+    sql_type: str # As written, e.g. 'TIMESTAMP WITH TIME ZONE' or 'DECIMAL(10, 2)'
+    not_null: bool
+    default: str | None # The DEFAULT expression as written, e.g. 'gen_random_uuid()'
+    checks: tuple # CHECK expressions written on the column
+
+@dataclass(slots=True, frozen=True)
+class SqlTable:
+    """
+    A CREATE TABLE statement. Column and table constraints are merged, so a column's
+    PRIMARY KEY, UNIQUE and REFERENCES show up in primary_key, unique and foreign_keys.
+
+    Attributes:
+        name (str): The table name, without schema qualifier or quotes.
+        columns (tuple): SqlColumn entries in declaration order.
+        primary_key (tuple): The primary key columns (composite keys have several).
+        unique (tuple): One tuple of columns per UNIQUE constraint, in declaration order.
+        foreign_keys (tuple): SqlForeignKey entries in declaration order.
+        checks (tuple): Table-level CHECK expressions.
+    """
+    name: str
+    columns: tuple
+    primary_key: tuple
+    unique: tuple
+    foreign_keys: tuple
+    checks: tuple
+
+def strip_comments(sql: str) -> str:
+    """Blanks out -- and /* */ comments (outside string literals), keeping offsets intact."""
+    result = []
+    index = 0
+    while index < len(sql):
+        char = sql[index]
+        if char in "'\"":
+            end = index + 1
+            while end < len(sql):
+                if sql[end] == char:
+                    if end + 1 < len(sql) and sql[end + 1] == char:
+                        end += 2 # Escaped quote
+                        continue
+                    break
+                end += 1
+            result.append(sql[index:end + 1])
+            index = end + 1
+        elif sql.startswith("--", index):
+            end = sql.find("\n", index)
+            end = len(sql) if end == -1 else end
+            result.append(" " * (end - index))
+            index = end
+        elif sql.startswith("/*", index):
+            end = sql.find("*/", index + 2)
+            end = len(sql) if end == -1 else end + 2
+            result.append(re.sub(r"[^\n]", " ", sql[index:end]))
+            index = end
+        else:
+            result.append(char)
+            index += 1
+    return "".join(result)
+
+def tokenize(text: str) -> list:
+    """Splits SQL into (kind, value, start, end) tokens; unknown characters are skipped."""
+    return [(match.lastgroup, match.group(), match.start(), match.end()) for match in TOKEN_PATTERN.finditer(text)]
+
+def unquote(identifier: str) -> str:
+    if identifier.startswith('"'):
+        return identifier[1:-1].replace('""', '"')
+    return identifier.lower()
+
+def split_top_level(tokens: list) -> list:
+    """Splits tokens on the commas that are not nested in parentheses."""
+    items, current, depth = [], [], 0
+    for token in tokens:
+        value = token[1]
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+        if value == "," and depth == 0:
+            items.append(current)
+            current = []
+        else:
+            current.append(token)
+    if current:
+        items.append(current)
+    return items
+
+def matching_paren(tokens: list, start: int) -> int:
+    """Returns the index of the ')' closing the '(' at tokens[start]."""
+    depth = 0
+    for index in range(start, len(tokens)):
+        if tokens[index][1] == "(":
+            depth += 1
+        elif tokens[index][1] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise SchemaSyntaxError(f"Unbalanced parentheses near '{tokens[start][1]}'")
+
+def is_word(token, *words) -> bool:
+    return token[0] == "word" and token[1].upper() in words
+
+def column_list(tokens: list, start: int) -> tuple:
+    """Parses '(a, b)' at tokens[start]; returns (columns, index after the ')')."""
+    end = matching_paren(tokens, start)
+    columns = tuple(unquote(token[1]) for token in tokens[start + 1:end] if token[0] in ("word", "quoted"))
+    return columns, end + 1
+
+def parse_references(tokens: list, index: int, columns: tuple) -> tuple:
+    """Parses 'REFERENCES table [(columns)] [ON DELETE|UPDATE action]...' starting after REFERENCES."""
+    references = unquote(tokens[index][1])
+    index += 1
+    if index + 1 < len(tokens) and tokens[index][1] == ".":
+        references = unquote(tokens[index + 1][1]) # Drop the schema qualifier
+        index += 2
+    referenced_columns = ()
+    if index < len(tokens) and tokens[index][1] == "(":
+        referenced_columns, index = column_list(tokens, index)
+    actions = {}
+    while index + 2 < len(tokens) and is_word(tokens[index], "ON") and is_word(tokens[index + 1], "DELETE", "UPDATE"):
+        event = tokens[index + 1][1].upper()
+        index += 2
+        action = [tokens[index][1].upper()]
+        index += 1
+        if action[0] in ("SET", "NO") and index < len(tokens):
+            action.append(tokens[index][1].upper()) # SET NULL, SET DEFAULT, NO ACTION
+            index += 1
+        actions[event] = " ".join(action)
+    while index < len(tokens) and is_word(tokens[index], "MATCH", "FULL", "PARTIAL", "SIMPLE", "DEFERRABLE", "NOT", "INITIALLY", "DEFERRED", "IMMEDIATE"):
+        index += 1
+    foreign_key = SqlForeignKey(columns, references, referenced_columns, actions.get("DELETE"), actions.get("UPDATE"))
+    return foreign_key, index
+
+def expression_end(tokens: list, index: int) -> int:
+    """Returns where an expression starting at index ends: before the next top-level constraint word."""
+    depth = 0
+    while index < len(tokens):
+        value = tokens[index][1]
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+        elif depth == 0 and tokens[index][0] == "word" and value.upper() in COLUMN_CONSTRAINT_WORDS:
+            break
+        index += 1
+    return index
+
+def parse_column(text: str, tokens: list, table: dict):
+    """Parses a column definition, adding column-level keys to the table under construction."""
+    name = unquote(tokens[0][1])
+    index = 1
+    type_end = expression_end(tokens, index)
+    if type_end == index:
+        raise SchemaSyntaxError(f"Column '{name}' of table '{table['name']}' has no type")
+    sql_type = text[tokens[index][2]:tokens[type_end - 1][3]]
+    sql_type = re.sub(r"\s+", " ", sql_type)
+    index = type_end
+
+    not_null = False
+    default = None
+    checks = []
+    while index < len(tokens):
+        token = tokens[index]
+        if is_word(token, "CONSTRAINT"):
+            index += 2 # The constraint's name
+        elif is_word(token, "PRIMARY"):
+            table["primary_key"].append(name)
+            not_null = True
+            index += 2
+        elif is_word(token, "UNIQUE"):
+            table["unique"].append((name,))
+            index += 1
+        elif is_word(token, "NOT") and index + 1 < len(tokens) and is_word(tokens[index + 1], "NULL"):
+            not_null = True
+            index += 2
+        elif is_word(token, "NULL"):
+            index += 1
+        elif is_word(token, "DEFAULT"):
+            end = expression_end(tokens, index + 1)
+            default = text[tokens[index + 1][2]:tokens[end - 1][3]]
+            index = end
+        elif is_word(token, "CHECK"):
+            end = matching_paren(tokens, index + 1)
+            checks.append(text[tokens[index + 2][2]:tokens[end - 1][3]])
+            index = end + 1
+        elif is_word(token, "REFERENCES"):
+            foreign_key, index = parse_references(tokens, index + 1, (name,))
+            table["foreign_keys"].append(foreign_key)
+        else:
+            index = expression_end(tokens, index + 1) # COLLATE, GENERATED ... (not modelled)
+    table["columns"].append(SqlColumn(name, sql_type, not_null, default, tuple(checks)))
+
+def parse_table_constraint(text: str, tokens: list, table: dict) -> bool:
+    """Parses a table constraint into the table under construction. Returns False if tokens are not one."""
+    index = 0
+    if is_word(tokens[index], "CONSTRAINT"):
+        index += 2
+    token = tokens[index]
+    if is_word(token, "PRIMARY"):
+        columns, _ = column_list(tokens, index + 2)
+        table["primary_key"].extend(columns)
+    elif is_word(token, "UNIQUE"):
+        columns, _ = column_list(tokens, index + 1)
+        table["unique"].append(columns)
+    elif is_word(token, "FOREIGN"):
+        columns, index = column_list(tokens, index + 2)
+        if not is_word(tokens[index], "REFERENCES"):
+            raise SchemaSyntaxError(f"FOREIGN KEY {columns} of table '{table['name']}' has no REFERENCES")
+        foreign_key, _ = parse_references(tokens, index + 1, columns)
+        table["foreign_keys"].append(foreign_key)
+    elif is_word(token, "CHECK"):
+        end = matching_paren(tokens, index + 1)
+        table["checks"].append(text[tokens[index + 2][2]:tokens[end - 1][3]])
+    elif is_word(token, "EXCLUDE", "LIKE"):
+        pass # Not modelled
+    else:
+        return False
+    return True
+
+def parse_schema_sql(sql: str) -> dict:
+    """
+    Parses every CREATE TABLE statement of a DDL script. Other statements
+    (indexes, extensions, triggers, ...) are ignored.
+
+    Returns:
+        dict: Table name -> SqlTable, in declaration order.
+
+    Raises:
+        SchemaSyntaxError: If a CREATE TABLE statement is malformed.
+    """
+    text = strip_comments(sql)
+    # Tokenized once; each table body is then walked from its opening parenthesis
+    all_tokens = tokenize(text)
+    starts = [token[2] for token in all_tokens]
+    tables = {}
+    for match in CREATE_TABLE_PATTERN.finditer(text):
+        name = unquote(match.group("name").split(".")[-1])
+        open_paren = bisect.bisect_left(starts, match.end() - 1)
+        if open_paren == len(all_tokens) or starts[open_paren] != match.end() - 1:
+            continue # The match lies inside a string literal or quoted identifier
+        tokens = all_tokens[open_paren + 1:matching_paren(all_tokens, open_paren)]
+
+        table = {"name": name, "columns": [], "primary_key": [], "unique": [], "foreign_keys": [], "checks": []}
+        for item in split_top_level(tokens):
+            if not item:
+                continue
+            if not parse_table_constraint(text, item, table):
+                parse_column(text, item, table)
+
+        tables[name] = SqlTable(
+            name=name,
+            columns=tuple(table["columns"]),
+            primary_key=tuple(table["primary_key"]),
+            unique=tuple(table["unique"]),
+            foreign_keys=tuple(table["foreign_keys"]),
+            checks=tuple(table["checks"]),
+        )
+    return tables
+
+def load_schema_sql(schema_sql_file: Path, cache_dir: Path = SCHEMA_CACHE_DIR) -> dict:
+    """
+    Returns the parsed tables of schema.sql, from a cache keyed by the file's hash when
+    it has been parsed before. The cache is not written while planning (generate.py --plan).
+
+    Args:
+        schema_sql_file (Path): The DDL script.
+        cache_dir (Path): Where parsed schemas are cached (one file per schema.sql version).
+
+    Returns:
+        dict: Table name -> SqlTable, as parse_schema_sql returns it.
+    """
+    source = Path(schema_sql_file).read_bytes()
+    digest = hashlib.sha256(PARSER_VERSION.encode() + b"\0" + source).hexdigest()
+    cache_file = Path(cache_dir) / f"{digest}.pickle"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass # Not cached yet, or written by an incompatible generator
+
+    tables = parse_schema_sql(source.decode("utf-8"))
+    if not utils.is_planning():
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+            for stale in cache_file.parent.glob("*.pickle"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True) # Only the current schema is worth keeping
+        except OSError as e:
+            print(f"Warning: could not cache the parsed schema in '{cache_dir}': {e}")
+    return tables
+
+# --- Derived Inputs ---
+
+def schema_txt_type(sql_type: str) -> str:
+    """Returns a column type as schema.txt spells it, e.g. 'TIMESTAMP WITH TIME ZONE' -> 'TIMESTAMP'."""
+    return TYPE_SUFFIXES.sub("", sql_type)
+
+def derive_schema(tables: dict) -> dict:
+    """Returns table name -> list of (column, sql_type) tuples, in the shape utils.read_schema returns."""
+    return {name: [(column.name, schema_txt_type(column.sql_type)) for column in table.columns] for name, table in tables.items()}
+
+def column_key(table: SqlTable, column: str) -> str | None:
+    """Returns the key marker schema.txt shows for a column: PK, FK or UNIQUE (single-column)."""
+    if column in table.primary_key:
+        return "PK"
+    if any(column in foreign_key.columns for foreign_key in table.foreign_keys):
+        return "FK"
+    if (column,) in table.unique:
+        return "UNIQUE"
+    return None
+
+def derive_schema_rows(tables: dict) -> list:
+    """Returns the rows of schema.txt as (table, column, sql_type, key) tuples; key may be None."""
+    return [
+        (name, column.name, schema_txt_type(column.sql_type), column_key(table, column.name))
+        for name, table in tables.items()
+        for column in table.columns
+    ]
+
+def unique_in_order(values) -> list:
+    return list(dict.fromkeys(values))
+
+def derive_table_keys(tables: dict) -> dict:
+    """
+    Returns the table_keys.json mapping: primary key columns, foreign key columns,
+    NOT NULL columns (other than the primary key) and the columns of every UNIQUE constraint.
+    """
+    return {
+        name: {
+            "primary": list(table.primary_key),
+            "foreign": unique_in_order(column for foreign_key in table.foreign_keys for column in foreign_key.columns),
+            "not_null": [column.name for column in table.columns if column.not_null and column.name not in table.primary_key],
+            "unique": unique_in_order(column for columns in table.unique for column in columns),
+        }
+        for name, table in tables.items()
+    }
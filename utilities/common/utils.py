@@ -0,0 +1,544 @@
+import filecmp
+import re
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from pathlib import Path
+import subprocess
+
+from datetime import datetime
+import jinja2
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, ModuleLoader
+
+# Bump whenever generator logic changes in a way that affects rendered output,
+# so incremental runs re-render everything once.
+GENERATOR_VERSION = "1.1.0"
+
+# Generator caches (Jinja bytecode, precompiled templates); safe to delete at any time
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+JINJA_BYTECODE_DIR = CACHE_DIR / "jinja"
+TEMPLATE_BUNDLE_DIR = CACHE_DIR / "templates"
+BUNDLE_INFO_FILE = "bundle.json"
+
+# Options every template environment is created with (create_environment can override them)
+ENVIRONMENT_OPTIONS = {"trim_blocks": True, "lstrip_blocks": True, "keep_trailing_newline": True}
+
+# Dev dependency in a repository package's pubspec.yaml that marks it as generated with
+# typed cache records (generate.py --typed-cache)
+TYPED_CACHE_DEPENDENCY = "isar_generator"
+
+# Distinct identifiers remembered by the naming helpers (tables, columns, repositories)
+NAME_CACHE_SIZE = 4096
+
+# When True, headers are stamped with the output's input hash instead of the
+# wall-clock time, so unchanged inputs render byte-identical files.
+_deterministic_headers = False
+
+# When set (generate.py --plan), file writes and deletions are recorded in this
+# in-memory Plan instead of touching disk.
+_plan = None
+
+# --- Utility Functions ---
+
+def set_deterministic_headers(enabled: bool):
+    """Switches generated headers between the UTC timestamp and the per-output input hash."""
+    global _deterministic_headers
+    _deterministic_headers = enabled
+    generate_header.cache_clear()
+    generate_pound_header.cache_clear()
+
+def set_plan(plan):
+    """Routes write_if_changed, make_dirs and delete_file into a Plan (or back to disk with None)."""
+    global _plan
+    _plan = plan
+
+def is_planning() -> bool:
+    return _plan is not None
+
+@cache
+def _run_timestamp():
+    # One timestamp per run, shared by every header
+    return datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+
+def _header_stamp(input_digest: str | None) -> str:
+    if _deterministic_headers and input_digest:
+        return f"Input hash: {input_digest[:16]}"
+    return f"Generated on: {_run_timestamp()}"
+
+# Line every generated header carries; files without it were written by hand
+GENERATED_MARKER = "THIS FILE IS AUTO-GENERATED. DO NOT EDIT MANUALLY."
+
+def has_generated_header(path: Path) -> bool:
+    """Returns True if the file starts with a generator header (it may follow the imports)."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return GENERATED_MARKER in f.read(4096)
+    except OSError:
+        return False
+
+@cache
+def generate_header(input_digest: str | None = None):
+    stamp = _header_stamp(input_digest)
+    header = f"""\
+////////////////////////////////////////////////////////////////////////////
+//                                                                        //
+//                           PERFECT LINE LLC                             //
+//                                                                        //
+//           {GENERATED_MARKER}           //
+//                                                                        //
+//  Any changes to this file will be overwritten the next time the code   //
+//  is regenerated. If you need to modify behavior, update the source     //
+//                         template instead.                              //
+//                                                                        //
+//                {stamp:<56}//
+//                                                                        //
+////////////////////////////////////////////////////////////////////////////
+
+"""
+    return header
+
+@cache
+def generate_pound_header(input_digest: str | None = None):
+    stamp = _header_stamp(input_digest)
+    header = f"""\
+############################################################################
+##                                                                        ##
+##                           PERFECT LINE LLC                             ##
+##                                                                        ##
+##           {GENERATED_MARKER}           ##
+##                                                                        ##
+##  Any changes to this file will be overwritten the next time the code   ##
+##  is regenerated. If you need to modify behavior, update the source     ##
+##                         template instead.                              ##
+##                                                                        ##
+##                {stamp:<56}##
+##                                                                        ##
+############################################################################
+
+"""
+    return header
+
+
+# The naming helpers double as Jinja filters and are called with the same few
+# identifiers over and over, so their results are memoized.
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def snake_to_camel(snake_str):
+    parts = snake_str.split('_')
+    return parts[0] + ''.join(word.capitalize() for word in parts[1:])
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def snake_to_pascal(snake_str):
+    """Converts snake_case to PascalCase (e.g., 'user_name' -> 'UserName')."""
+    return ''.join(word.capitalize() for word in snake_str.split('_'))
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def dashed(snake_str):
+    """Converts snake_case to dashed-case (e.g., 'user_name' -> 'user-name')."""
+    return snake_str.replace('_', '-')
+
+class BundledLoader(ModuleLoader):
+    """
+    Loads templates precompiled by compile_template_bundle, skipping the lexer and parser.
+
+    Template sources (hashed into output digests) and the template listing are
+    still served from the template tree.
+    """
+
+    def __init__(self, bundle_dir: Path, template_dir: Path):
+        super().__init__(str(bundle_dir))
+        self.source_loader = FileSystemLoader(str(template_dir))
+
+    def get_source(self, environment: Environment, template: str):
+        return self.source_loader.get_source(environment, template)
+
+    def list_templates(self) -> list:
+        return self.source_loader.list_templates()
+
+def option_signature(value) -> str:
+    """
+    Returns a representation of an environment option that is stable across processes.
+    Callables (e.g. select_autoescape(...)) are described by their name and closure values
+    rather than their default repr, which includes a memory address.
+    """
+    if callable(value):
+        closure = [cell.cell_contents for cell in getattr(value, "__closure__", None) or ()]
+        return f"{value.__module__}.{value.__qualname__}{closure!r}"
+    return repr(value)
+
+def template_tree_hash(template_dir: Path, options: dict) -> str:
+    """Hashes every template in a tree, plus the Jinja version and environment options (names and values) they compile with."""
+    signature = sorted((name, option_signature(value)) for name, value in options.items())
+    digest = hashlib.sha256(f"{jinja2.__version__}:{signature}".encode("utf-8"))
+    for template_path in sorted(Path(template_dir).rglob("*.jinja")):
+        digest.update(template_path.relative_to(template_dir).as_posix().encode("utf-8"))
+        digest.update(template_path.read_bytes())
+    return digest.hexdigest()
+
+def template_bundle_dir(template_dir: Path) -> Path:
+    """Returns where the precompiled bundle of a template tree is stored."""
+    return TEMPLATE_BUNDLE_DIR / Path(template_dir).name
+
+def create_environment(template_dir: Path, **options) -> Environment:
+    """
+    Creates a Jinja environment for a template tree with the shared naming filters registered.
+
+    Templates are loaded from the precompiled bundle when it matches the current tree,
+    otherwise from source through an on-disk bytecode cache (keyed by template checksum),
+    so a cold start only lexes and parses templates that changed.
+    """
+    options = {**ENVIRONMENT_OPTIONS, **options}
+    bundle_dir = template_bundle_dir(template_dir)
+    loader = FileSystemLoader(str(template_dir))
+    try:
+        if read_json(bundle_dir / BUNDLE_INFO_FILE).get("tree_hash") == template_tree_hash(template_dir, options):
+            loader = BundledLoader(bundle_dir, template_dir)
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        pass # No usable bundle; compile from source
+
+    JINJA_BYTECODE_DIR.mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=loader,
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_BYTECODE_DIR)),
+        **options,
+    )
+    env.filters['dashed'] = dashed
+    env.filters['snake_to_pascal'] = snake_to_pascal
+    env.filters['snake_to_camel'] = snake_to_camel
+    env.template_tree = (Path(template_dir), options) # Read by compile_template_bundle
+    return env
+
+def compile_template_bundle(env: Environment) -> Path:
+    """
+    Precompiles every template of an environment's tree into a bundle loaded by BundledLoader.
+
+    Args:
+        env (Environment): An environment created by create_environment.
+
+    Returns:
+        Path: The bundle directory.
+    """
+    template_dir, options = env.template_tree
+    bundle_dir = template_bundle_dir(template_dir)
+    shutil.rmtree(bundle_dir, ignore_errors=True) # Drop modules of renamed or deleted templates
+    env.compile_templates(
+        str(bundle_dir),
+        filter_func=lambda name: name.endswith(".jinja"),
+        zip=None,
+        ignore_errors=False,
+    )
+    info = {"jinja": jinja2.__version__, "tree_hash": template_tree_hash(template_dir, options)}
+    write_if_changed(bundle_dir / BUNDLE_INFO_FILE, json.dumps(info, indent=2) + "\n")
+    return bundle_dir
+
+# --- Template Tree Scan ---
+
+@dataclass(frozen=True)
+class TemplateEntry:
+    """
+    A file of a template tree and where it lands in a generated package.
+
+    Attributes:
+        source (Path): The file in the template tree.
+        template (str): Its path relative to the tree (the Jinja template name).
+        pattern (str): The output path relative to the package, with str.format
+                       placeholders for render context values (e.g. '{feature}.dart').
+        is_static (bool): Copied verbatim instead of rendered (not a .jinja file).
+    """
+    source: Path
+    template: str
+    pattern: str
+    is_static: bool
+
+def placeholder_pattern(component: str) -> str:
+    """Turns '{{ key }}' in a path component into a '{key}' format placeholder, escaping other braces."""
+    parts = re.split(r"\{\{\s*(\w+)\s*\}\}", component)
+    return "".join(
+        "{" + part + "}" if index % 2 else part.replace("{", "{{").replace("}", "}}")
+        for index, part in enumerate(parts)
+    )
+
+@cache
+def scan_template_tree(template_dir: Path, path_pattern) -> tuple:
+    """
+    Scans a template tree once per run into TemplateEntry records, in a stable
+    (sorted, top-down) order. Watch mode clears the cache when templates change.
+
+    Args:
+        template_dir (Path): The template tree.
+        path_pattern: Maps a path relative to the tree to its output path pattern.
+
+    Returns:
+        tuple: TemplateEntry records of every file in the tree.
+    """
+    entries = []
+    for root, dirs, files in Path(template_dir).walk():
+        dirs.sort()
+        for file_name in sorted(files):
+            source = root / file_name
+            relative_path = source.relative_to(template_dir)
+            entries.append(TemplateEntry(
+                source=source,
+                template=relative_path.as_posix(),
+                pattern=path_pattern(relative_path),
+                is_static=not file_name.endswith(".jinja"),
+            ))
+    return tuple(entries)
+
+def template_source(env: Environment, template_name: str) -> str:
+    """Returns the raw source of a template, used to hash templates into output digests."""
+    source, _, _ = env.loader.get_source(env, template_name)
+    return source
+
+def read_json(file_path):
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+def read_schema(file_path):
+    tables = defaultdict(list)
+    with open(file_path, 'r') as f:
+        for line in f:
+            parts = line.strip().split('\t')
+            if len(parts) == 3:
+              table, column, col_type = parts
+              tables[table].append((column, col_type))
+            elif len(parts) == 4:
+              table, column, col_type, key = parts
+              tables[table].append((column, col_type))
+            else:
+              continue
+    return tables
+
+def read_repositories(filepath):
+    """Reads repository names from a text file, one per line."""
+    try:
+        with open(filepath, 'r') as f:
+            return [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        print(f"Error: Repository source file not found at {filepath}")
+        return []
+
+def uses_typed_cache(package_dir: Path, default: bool = False) -> bool:
+    """
+    Returns whether a repository package caches its models as Isar records, per its
+    pubspec.yaml. Packages that do not exist yet (or are only planned) get the default.
+    """
+    pubspec_file = package_dir / "pubspec.yaml"
+    if not pubspec_file.exists():
+        return default
+    return TYPED_CACHE_DEPENDENCY in pubspec_file.read_text()
+
+def write_if_changed(path: Path, content: str | bytes) -> bool:
+    """
+    Writes content to path only if the bytes on disk differ, replacing the file atomically.
+
+    Unchanged files keep their mtime, so the Dart analyzer, build_runner and Flutter
+    incremental compilation caches stay warm across regenerations.
+
+    Args:
+        path (Path): The file to write.
+        content (str | bytes): The new file content (str is encoded as UTF-8).
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date.
+    """
+    path = Path(path)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if _plan is not None:
+        return _plan.write(path, data)
+    try:
+        if path.read_bytes() == data:
+            return False
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file in the same directory, then rename over the target
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return True
+
+def stage_stream(path: Path, chunks) -> Path:
+    """
+    Streams text chunks (e.g. Template.stream()) into a temp file next to path, so a
+    large output is never held in memory. The temp file keeps path's suffix, so tools
+    like 'dart format' accept it, and is moved into place by replace_if_changed.
+
+    Args:
+        path (Path): The file the content is destined for.
+        chunks: An iterable of str chunks.
+
+    Returns:
+        Path: The staged temp file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=f".tmp{path.suffix}")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            for chunk in chunks:
+                f.write(chunk)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return Path(tmp_path)
+
+# Linux ioctl that clones a file's extents copy-on-write (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+def stage_copy(source_path: Path, path: Path) -> Path:
+    """
+    Stages a copy of a static file in a temp file next to path, to be moved into place
+    by replace_if_changed. The copy is a reflink (sharing the source's blocks until
+    either side is written) where the filesystem supports it, otherwise a plain copy.
+
+    Returns:
+        Path: The staged temp file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=f".tmp{path.suffix}")
+    try:
+        with os.fdopen(fd, "wb") as target, open(source_path, "rb") as source:
+            try:
+                import fcntl
+                fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+            except (ImportError, OSError):
+                shutil.copyfileobj(source, target) # No fcntl (Windows) or no reflink support
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return Path(tmp_path)
+
+def stage_bytes(path: Path, data: bytes) -> Path:
+    """Stages bytes in a temp file next to path, like stage_stream."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=f".tmp{path.suffix}")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return Path(tmp_path)
+
+def same_content(staged_path: Path, path: Path) -> bool:
+    """Returns True if path exists and has the same bytes as the staged file."""
+    try:
+        return filecmp.cmp(staged_path, path, shallow=False)
+    except FileNotFoundError:
+        return False
+
+def install_staged(staged_path: Path, path: Path):
+    """Atomically moves a staged file over path, keeping path's permissions (0o644 for new files)."""
+    try:
+        mode = stat.S_IMODE(Path(path).stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    os.chmod(staged_path, mode)
+    os.replace(staged_path, path)
+
+def replace_if_changed(staged_path: Path, path: Path) -> bool:
+    """
+    Atomically moves a staged file over path, unless path already has identical bytes
+    (then the staged file is discarded and path keeps its mtime).
+
+    Returns:
+        bool: True if path was replaced.
+    """
+    staged_path, path = Path(staged_path), Path(path)
+    if same_content(staged_path, path):
+        staged_path.unlink()
+        return False
+    install_staged(staged_path, path)
+    return True
+
+# Scratch copies of new packages are built next to them, as '.<package>.staging-<pid>'
+STAGING_DIR_MARKER = ".staging-"
+
+def make_staging_dir(path: Path) -> Path:
+    """
+    Creates an empty scratch directory next to path (so it is on the same filesystem)
+    in which a new package is built before it is renamed to path. Scratch directories
+    left behind by an interrupted run are removed first.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    for stale in path.parent.glob(f".{path.name}{STAGING_DIR_MARKER}*"):
+        shutil.rmtree(stale, ignore_errors=True)
+    staging_dir = path.parent / f".{path.name}{STAGING_DIR_MARKER}{os.getpid()}"
+    staging_dir.mkdir()
+    return staging_dir
+
+def remove_staging_dir(staging_dir: Path | None):
+    """Removes a scratch directory whose package will not be swapped in."""
+    if staging_dir is not None:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+def make_dirs(path: Path):
+    """Creates a directory and its parents (recorded, not created, while planning)."""
+    if _plan is None:
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+def delete_file(path: Path):
+    """Deletes a generated file (recorded, not deleted, while planning)."""
+    if _plan is not None:
+        _plan.delete(path)
+    else:
+        Path(path).unlink(missing_ok=True)
+
+def run_command(command: list, cwd: Path | None = None, check: bool = True, capture_output: bool = False) -> subprocess.CompletedProcess:
+    """
+    Runs an external command using subprocess.
+
+    Args:
+        command (list[]): The command and its arguments as a list of strings.
+        cwd (Path | None): The current working directory for the command.
+                           If None, the current process's working directory is used.
+        check (bool): If True, raise a CalledProcessError if the command returns a non-zero exit code.
+        capture_output (bool): If True, capture stdout and stderr in the returned object.
+
+    Returns:
+        subprocess.CompletedProcess: An object containing information about the completed process.
+
+    Raises:
+        subprocess.CalledProcessError: If check is True and the command returns a non-zero exit code.
+        FileNotFoundError: If the command (first item in 'command') is not found.
+    """
+    print(f"Executing command: {' '.join(command)}")
+    try:
+        result = subprocess.run(
+            command,
+            cwd=cwd if cwd else None,
+            capture_output=capture_output,
+            text=True, # Decode stdout/stderr as text
+            check=check
+        )
+        if capture_output:
+            print(f"STDOUT:\n{result.stdout}")
+            if result.stderr:
+                print(f"STDERR:\n{result.stderr}")
+        return result
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Command not found: '{command[0]}'. Please ensure it's installed and in your system's PATH.")
+    except subprocess.CalledProcessError as e:
+        print(f"Command '{' '.join(command)}' failed with exit code {e.returncode}")
+        if e.stdout:
+            print(f"STDOUT:\n{e.stdout}")
+        if e.stderr:
+            print(f"STDERR:\n{e.stderr}")
+        raise # Re-raise the exception after printing details
\ No newline at end of file
@@ -0,0 +1,139 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Editor swap/backup files that should never trigger a regeneration
+IGNORED_SUFFIXES = (".swp", ".swx", ".tmp", "~")
+
+def _is_ignored(path: Path) -> bool:
+    return path.name.startswith(".") or path.name.endswith(IGNORED_SUFFIXES)
+
+# --- Watchers ---
+
+class PollingWatcher:
+    """Detects changes by comparing file mtimes and sizes on every poll. Works everywhere."""
+
+    def __init__(self, roots: list, interval: float = 0.25):
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> dict:
+        snapshot = {}
+        for root in self.roots:
+            for path in root.rglob("*"):
+                if path.is_file() and not _is_ignored(path):
+                    stat = path.stat()
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> set:
+        """Blocks up to timeout seconds and returns the paths that changed (empty on timeout)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {path for path in current.keys() | self.snapshot.keys() if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed or time.monotonic() >= deadline:
+                return changed
+            time.sleep(min(self.interval, max(0.0, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+class InotifyWatcher:
+    """Linux inotify watcher over every directory under the roots, through libc via ctypes."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct("iIII") # wd, mask, cookie, name length
+
+    def __init__(self, roots: list):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {} # Watch descriptor -> directory
+        for root in roots:
+            for directory in [Path(root), *(path for path in Path(root).rglob("*") if path.is_dir())]:
+                self._add_watch(directory)
+
+    def _add_watch(self, directory: Path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self.watches[wd] = directory
+
+    def poll(self, timeout: float) -> set:
+        """Blocks up to timeout seconds and returns the paths that changed (empty on timeout)."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        changed = set()
+        data = os.read(self.fd, 64 * 1024)
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += name_length
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._add_watch(path) # New template subdirectories are watched too
+                continue
+            if not _is_ignored(path):
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+def create_watcher(roots: list, force_polling: bool = False):
+    """
+    Watches the given directories with inotify on Linux, falling back to polling.
+
+    Args:
+        roots (list): Directories to watch recursively.
+        force_polling (bool): Skip inotify (e.g. on network or container-mounted volumes).
+
+    Returns:
+        InotifyWatcher | PollingWatcher: An object with poll(timeout) -> set and close().
+    """
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError) as e:
+            print(f"Warning: inotify unavailable ({e}). Falling back to polling.")
+    return PollingWatcher(roots)
+
+def wait_for_changes(watcher, debounce: float) -> set:
+    """
+    Blocks until something changes, then keeps collecting changes until none arrive
+    for `debounce` seconds, so a burst of saves triggers a single regeneration.
+
+    Returns:
+        set: Every path that changed during the burst.
+    """
+    changed = set()
+    while not changed:
+        changed = watcher.poll(timeout=3600)
+    while True:
+        more = watcher.poll(timeout=debounce)
+        if not more:
+            return changed
+        changed |= more
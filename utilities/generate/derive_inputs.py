@@ -0,0 +1,87 @@
+import argparse
+import json
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils
+from sql_schema import SchemaSyntaxError, derive_schema, derive_schema_rows, derive_table_keys, load_schema_sql
+
+# --- Configuration Paths ---
+SCHEMA_SQL_FILE = Path("../../backend/node/src/db/schema.sql")
+SCHEMA_FILE = Path("../data/schema.txt")
+SCHEMA_KEY_MAPPING_FILE = Path("../data/table_keys.json")
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Derives schema.txt and table_keys.json from the backend's schema.sql, "
+                    "so the generator inputs cannot drift from the database.",
+    )
+    parser.add_argument("--schema-sql", type=Path, default=SCHEMA_SQL_FILE, metavar="FILE", help=f"The DDL to read (default: {SCHEMA_SQL_FILE}).")
+    parser.add_argument("--check", action="store_true", help="Only report where the data files differ from schema.sql. Exits with 1 if they do.")
+    return parser.parse_args()
+
+def schema_txt(rows: list) -> str:
+    """Renders schema.txt: one tab-separated 'table, column, type[, key]' row per column."""
+    return "".join("\t".join(part for part in row if part) + "\n" for row in rows)
+
+def report_drift(derived_schema: dict, derived_keys: dict) -> list:
+    """Returns a line per table whose schema.txt rows or table_keys.json entry differ from schema.sql."""
+    current_schema = utils.read_schema(SCHEMA_FILE) if SCHEMA_FILE.exists() else {}
+    current_keys = utils.read_json(SCHEMA_KEY_MAPPING_FILE) if SCHEMA_KEY_MAPPING_FILE.exists() else {}
+    drift = []
+    for table in sorted(derived_schema.keys() | current_schema.keys() | derived_keys.keys() | current_keys.keys()):
+        if current_schema.get(table) != derived_schema.get(table):
+            drift.append(f"  {table}: columns differ in {SCHEMA_FILE.name}")
+        current, derived = current_keys.get(table) or {}, derived_keys.get(table) or {}
+        for role in sorted(current.keys() | derived.keys()):
+            if current.get(role) != derived.get(role):
+                drift.append(f"  {table}.{role}: {current.get(role)} in {SCHEMA_KEY_MAPPING_FILE.name}, {derived.get(role)} in schema.sql")
+    return drift
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    args = parse_args()
+    print("--- Derive Generator Inputs ---")
+    print(f"Schema SQL: {args.schema_sql.resolve()}")
+    print("-" * 50)
+
+    try:
+        tables = load_schema_sql(args.schema_sql)
+        if not tables:
+            print(f"No CREATE TABLE statements found in '{args.schema_sql}'. Exiting.")
+            exit(1)
+        derived_keys = derive_table_keys(tables)
+        print(f"Parsed {len(tables)} tables with {sum(len(table.columns) for table in tables.values())} columns.")
+
+        if args.check:
+            drift = report_drift(derive_schema(tables), derived_keys)
+            if drift:
+                print(f"\n{len(drift)} differences from schema.sql:")
+                print("\n".join(drift))
+                exit(1)
+            print("\nschema.txt and table_keys.json match schema.sql.")
+            exit(0)
+
+        for path, content in (
+            (SCHEMA_FILE, schema_txt(derive_schema_rows(tables))),
+            (SCHEMA_KEY_MAPPING_FILE, json.dumps(derived_keys, indent=2) + "\n"),
+        ):
+            if utils.write_if_changed(path, content):
+                print(f"  Updated {path}")
+            else:
+                print(f"  Unchanged {path}")
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        exit(1)
+    except SchemaSyntaxError as e:
+        print(f"Error parsing schema.sql: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        exit(1)
@@ -0,0 +1,374 @@
+import argparse
+import json
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils
+from inputs import load_inputs, load_inputs_from_sql
+from sql_schema import SchemaSyntaxError
+from manifest import Manifest, MANIFEST_FILE_NAME
+from parallel import create_executor, PARALLEL_MIN_TABLES
+from formatter import DartFormatter
+from pub_get import run_pub_get
+import profiling
+from plan import Plan, print_plan
+from depgraph import affected_outputs, nodes_for_paths
+from size_report import load_budgets, measure_outputs, print_size_report, write_size_report
+
+# The stage modules build their Jinja environments once at import, so every
+# stage below shares the same environments (and template caches) in this process.
+import generate_repositories
+import generate_features
+import generate_lib
+
+# --- Configuration Paths ---
+ROOT_DIR = generate_lib.ROOT_DIR
+SCHEMA_FILE = generate_repositories.SCHEMA_FILE
+SCHEMA_KEY_MAPPING_FILE = generate_repositories.SCHEMA_KEY_MAPPING_FILE
+REPO_MODEL_MAPPING_FILE = generate_repositories.REPO_MODEL_MAPPING_FILE
+CACHE_POLICY_FILE = generate_repositories.CACHE_POLICY_FILE
+PAGINATED_TABLES_FILE = generate_repositories.PAGINATED_TABLES_FILE
+REPOSITORY_SOURCE = generate_lib.REPOSITORY_SOURCE
+SCHEMA_SQL_FILE = Path("../../backend/node/src/db/schema.sql")
+MANIFEST_FILE = ROOT_DIR / MANIFEST_FILE_NAME
+PROFILE_REPORT_FILE = Path("generator_profile.json")
+SIZE_BUDGET_FILE = Path("../data/size_budgets.json")
+SIZE_REPORT_FILE = Path("generator_sizes.json")
+# Matches api_client's defaultBackgroundDecodeThreshold
+BACKGROUND_DECODE_THRESHOLD = 64 * 1024
+
+# Every template environment used by the stages
+TEMPLATE_ENVS = (
+    generate_repositories.repo_env,
+    generate_repositories.model_env,
+    generate_features.feature_env,
+    generate_lib.lib_env,
+)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generates the Dart repositories, models, features and lib files.")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and re-render every output.")
+    parser.add_argument(
+        "--deterministic-header",
+        action="store_true",
+        help="Stamp generated headers with each output's input hash instead of the current time.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Render repositories, models and features in N worker processes (default: 1, in-process). "
+             f"Schemas under {PARALLEL_MIN_TABLES} tables always render in-process.",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Run the whole pipeline against an in-memory copy of the output tree and report which files "
+             "would be created, changed, deleted or left unchanged. Nothing is written and neither dart "
+             "nor flutter is run. Exits with 1 if anything would change. Use with --deterministic-header, "
+             "otherwise every re-rendered file differs by its timestamp.",
+    )
+    parser.add_argument(
+        "--affected-by",
+        nargs="+",
+        type=Path,
+        metavar="PATH",
+        help="Print the outputs that depend on the given data or template files (per the dependency "
+             "graph recorded in the manifest by the last run, as watch mode re-renders them) and exit.",
+    )
+    parser.add_argument(
+        "--schema-sql",
+        nargs="?",
+        const=SCHEMA_SQL_FILE,
+        type=Path,
+        metavar="FILE",
+        help=f"Read the tables and keys from the backend DDL (default: {SCHEMA_SQL_FILE}) instead of "
+             f"schema.txt and table_keys.json. The parsed schema is cached per version of the file.",
+    )
+    parser.add_argument(
+        "--shared-fetch",
+        action="store_true",
+        help="Render the cached reads and writes of new repository packages as calls to api_client's "
+             "cachedFetch helper instead of inlining the cache/request/encode body into every method.",
+    )
+    parser.add_argument(
+        "--background-decode",
+        nargs="?",
+        const=BACKGROUND_DECODE_THRESHOLD,
+        type=int,
+        metavar="CHARS",
+        help=f"Render the list reads (fetchAll*) of new repository packages to decode and convert "
+             f"payloads of at least CHARS characters (default: {BACKGROUND_DECODE_THRESHOLD}) on a "
+             f"background isolate, for cache hits and network responses alike.",
+    )
+    parser.add_argument(
+        "--typed-cache",
+        action="store_true",
+        help="Give the models of new repository packages Isar record collections (indexed on their "
+             "foreign keys) and cache rows decoded in them instead of as JSON strings. Requires "
+             "'dart run build_runner build' in those packages. Not combinable with --shared-fetch "
+             "or --background-decode.",
+    )
+    parser.add_argument(
+        "--size-report",
+        nargs="?",
+        const=SIZE_REPORT_FILE,
+        type=Path,
+        metavar="REPORT",
+        help=f"Write the lines and bytes of every generated file, checked against {SIZE_BUDGET_FILE}, "
+             f"to a JSON report (default: {SIZE_REPORT_FILE}). A summary is printed after every run.",
+    )
+    parser.add_argument(
+        "--compile-templates",
+        action="store_true",
+        help="Precompile every template tree into utilities/.cache/templates and exit. "
+             "Later runs load the bundle instead of parsing templates until a template changes.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=PROFILE_REPORT_FILE,
+        type=Path,
+        metavar="REPORT",
+        help=f"Record wall/CPU time and peak memory per phase and write a JSON report "
+             f"(default: {PROFILE_REPORT_FILE}). Per-output render timings need --jobs 1.",
+    )
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        metavar="FILE",
+        help="With --profile, also dump a cProfile trace of the run to FILE.",
+    )
+    args = parser.parse_args()
+    if args.typed_cache and (args.shared_fetch or args.background_decode):
+        parser.error("--typed-cache cannot be combined with --shared-fetch or --background-decode")
+    return args
+
+def compile_templates():
+    """Precompiles the repository, model, feature and lib template trees."""
+    for env in TEMPLATE_ENVS:
+        bundle_dir = utils.compile_template_bundle(env)
+        print(f"Compiled {len(env.list_templates(filter_func=lambda name: name.endswith('.jinja')))} templates into {bundle_dir}")
+
+def check_inputs(inputs, schema_file: Path = SCHEMA_FILE) -> str | None:
+    """Returns why the parsed inputs cannot be generated from, or None if they are usable."""
+    if not inputs.schema:
+        return f"No tables found in '{schema_file}'."
+    if not inputs.model_map:
+        return f"No repository-model mapping found in '{REPO_MODEL_MAPPING_FILE}'."
+    if not inputs.table_keys:
+        return f"No schema key mapping found in '{SCHEMA_KEY_MAPPING_FILE}'."
+    return None
+
+def load_templates():
+    """Loads (and compiles, if not cached) every template of every stage."""
+    with profiling.phase("template_load"):
+        for env in TEMPLATE_ENVS:
+            for template_name in env.list_templates(filter_func=lambda name: name.endswith(".jinja")):
+                env.get_template(template_name)
+
+def render_all(
+    inputs,
+    manifest: Manifest,
+    formatter: DartFormatter,
+    jobs: int = 1,
+    shared_fetch: bool = False,
+    decode_threshold: int | None = None,
+    typed_cache: bool = False,
+) -> list:
+    """
+    Runs the repository, feature and lib stages and saves the manifest. Outputs whose
+    inputs are unchanged (per the manifest) are skipped.
+
+    Args:
+        inputs (GeneratorInputs): The parsed generator inputs.
+        manifest (Manifest): Input hashes of previously generated files.
+        formatter (DartFormatter): Formats rendered Dart files before they are written.
+        jobs (int): Number of render worker processes.
+        shared_fetch (bool): Render new repositories against api_client's cachedFetch helper.
+        decode_threshold (int | None): Payload length from which new repositories decode list
+                                       reads on a background isolate (None: never).
+        typed_cache (bool): Cache the models of new repositories as Isar records.
+
+    Returns:
+        list: Paths of the repository packages that were created or updated.
+    """
+    # Workers only render; every file is written from this process in a fixed order
+    with create_executor(jobs, len(inputs.tables)) as executor:
+        # --- Repository + Model Stage ---
+        print("\n--- Repositories and Models ---")
+        with profiling.phase("repositories_stage"):
+            repo_paths = generate_repositories.generate_all_repositories(
+                all_tables_schema=inputs.schema,
+                repo_model_mapping=inputs.model_map,
+                schema_key_mapping=inputs.table_keys,
+                manifest=manifest,
+                executor=executor,
+                formatter=formatter,
+                tables=inputs.tables,
+                shared_fetch=shared_fetch,
+                decode_threshold=decode_threshold,
+                typed_cache=typed_cache,
+            )
+
+        # --- Feature Stage ---
+        print("\n--- Features ---")
+        with profiling.phase("features_stage"):
+            generate_features.generate_all_features(
+                repo_model_mapping=inputs.model_map,
+                schema_key_mapping=inputs.table_keys,
+                manifest=manifest,
+                executor=executor,
+                formatter=formatter,
+                tables=inputs.tables,
+            )
+
+    # --- Lib Stage ---
+    print("\n--- Lib Files ---")
+    if inputs.repositories:
+        with profiling.phase("lib_stage"):
+            generate_lib.generate_all_lib_files(inputs.repositories, manifest, formatter, typed_cache=typed_cache)
+    else:
+        print(f"No repositories found in '{REPOSITORY_SOURCE}' for lib updates. Skipping lib file generation.")
+
+    manifest.save()
+    return repo_paths
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    args = parse_args()
+    if args.compile_templates:
+        compile_templates()
+        exit(0)
+    if args.profile:
+        profiling.enable(cprofile=args.cprofile is not None)
+    utils.set_deterministic_headers(args.deterministic_header)
+    plan = None
+    if args.plan:
+        plan = Plan(ROOT_DIR)
+        utils.set_plan(plan)
+        for env in TEMPLATE_ENVS:
+            env.bytecode_cache = None # Planning leaves the template caches untouched too
+    print("--- Dart Code Generator ---")
+    if args.schema_sql:
+        print(f"Schema file: {args.schema_sql.resolve()} (tables and keys)")
+    else:
+        print(f"Schema file: {SCHEMA_FILE.resolve()}")
+    print(f"Mapping file: {REPO_MODEL_MAPPING_FILE.resolve()}")
+    if not args.schema_sql:
+        print(f"Schema Key Mapping file: {SCHEMA_KEY_MAPPING_FILE.resolve()}")
+    print(f"Repository source: {REPOSITORY_SOURCE.resolve()}")
+    print(f"Cache policy file: {CACHE_POLICY_FILE.resolve()}")
+    print(f"Paginated tables file: {PAGINATED_TABLES_FILE.resolve()}")
+    print(f"Output root: {ROOT_DIR.resolve()}")
+    print(f"Jobs: {args.jobs}")
+    if plan:
+        print("Plan only: nothing will be written, formatted or resolved (formatting comes from the format cache).")
+    print(f"Manifest: {MANIFEST_FILE.resolve()}{' (ignored, --force)' if args.force else ''}")
+    print("-" * 50)
+
+    try:
+        # --- Parse every input once ---
+        with profiling.phase("parse_inputs"):
+            if args.schema_sql:
+                inputs = load_inputs_from_sql(
+                    args.schema_sql, REPO_MODEL_MAPPING_FILE, REPOSITORY_SOURCE, CACHE_POLICY_FILE, PAGINATED_TABLES_FILE,
+                )
+            else:
+                inputs = load_inputs(
+                    SCHEMA_FILE, SCHEMA_KEY_MAPPING_FILE, REPO_MODEL_MAPPING_FILE, REPOSITORY_SOURCE,
+                    CACHE_POLICY_FILE, PAGINATED_TABLES_FILE,
+                )
+        error = check_inputs(inputs, args.schema_sql or SCHEMA_FILE)
+        if error:
+            print(f"{error} Exiting.")
+            exit(1)
+
+        if args.affected_by:
+            nodes = nodes_for_paths(args.affected_by, inputs, TEMPLATE_ENVS)
+            outputs = affected_outputs(Manifest(MANIFEST_FILE, check_formatter=False), nodes)
+            print(f"\n{len(outputs)} outputs depend on {', '.join(sorted(nodes)) or 'nothing known'}:")
+            for output in outputs:
+                print(f"  {output}")
+            exit(0)
+        print(f"Loaded schema with {len(inputs.schema)} tables, "
+              f"mapping for {len(inputs.model_map)} repositories, "
+              f"key mapping for {len(inputs.table_keys)} tables and "
+              f"{len(inputs.repositories)} repositories for lib updates.")
+
+        # Load every template up front. In-process renders and forked workers (Linux) then start
+        # with warm template caches; spawned workers (macOS, Windows) load their own from the
+        # bytecode cache or precompiled bundle.
+        load_templates()
+
+        # Rendered Dart files are formatted before they are written, one batch per stage
+        if plan:
+            # Planning never runs dart: the format cache is keyed by the version the manifest recorded
+            manifest = Manifest(MANIFEST_FILE, force=args.force, check_formatter=False)
+            formatter = DartFormatter(ROOT_DIR, plan=plan, version=manifest.formatter)
+        else:
+            formatter = DartFormatter(ROOT_DIR)
+            manifest = Manifest(MANIFEST_FILE, force=args.force, formatter=formatter.version)
+        render_all(
+            inputs,
+            manifest,
+            formatter,
+            args.jobs,
+            shared_fetch=args.shared_fetch,
+            decode_threshold=args.background_decode,
+            typed_cache=args.typed_cache,
+        )
+
+        if plan:
+            report = plan.report(known_outputs=manifest.entries)
+            print_plan(report)
+            if args.profile:
+                profiling.write_report(args.profile, args.cprofile, jobs=args.jobs, force=args.force, plan=True)
+            exit(1 if plan.has_changes else 0)
+
+        # --- Generated Code Size ---
+        sizes = measure_outputs(ROOT_DIR, manifest.entries, load_budgets(SIZE_BUDGET_FILE))
+        print_size_report(sizes)
+        if args.size_report:
+            write_size_report(args.size_report, sizes)
+
+        # --- Post-Creation Steps ---
+        print("\n--- Post-Creation Steps ---")
+        # Resolves the packages and the app in dependency order, skipping fresh ones
+        with profiling.phase("pub_get"):
+            run_pub_get(ROOT_DIR)
+        # The Isar record collections of typed models are generated into part files
+        for repository in generate_lib.typed_cache_repositories(list(inputs.model_map), ROOT_DIR):
+            print(f"Typed cache: run 'dart run build_runner build' in packages/{repository}_repository "
+                  f"after model changes to generate its Isar record collections.")
+
+        if args.profile:
+            profiling.write_report(
+                args.profile,
+                args.cprofile,
+                jobs=args.jobs,
+                force=args.force,
+                tables=len(inputs.schema),
+                repositories=len(inputs.model_map),
+            )
+
+        print("\n--- All operations complete! ---")
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing JSON mapping file: {e}")
+        exit(1)
+    except SchemaSyntaxError as e:
+        print(f"Error parsing schema.sql: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred during execution: {e}")
+        exit(1)
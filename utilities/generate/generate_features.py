@@ -0,0 +1,399 @@
+import json
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from pathlib import Path
+import sys
+import os
+
+# Adjust sys.path to find utils.py in the common directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils # Assuming utils.py contains snake_to_pascal, snake_to_camel, read_schema, read_json
+from manifest import Manifest, hash_inputs, MANIFEST_FILE_NAME
+from parallel import SerialExecutor
+from output import RenderedFile, swap_package
+from formatter import DartFormatter
+from pub_get import run_pub_get
+import profiling
+from depgraph import output_dependencies
+from ir import build_tables, table_signature, tables_for
+from inputs import load_paginated_tables
+
+# --- Configuration Paths ---
+ROOT_DIR = Path("../../frontend/roommate_expense_tracker")
+
+# Input data files (reusing from repository script)
+SCHEMA_FILE = Path("../data/schema.txt")
+PAGINATED_TABLES_FILE = Path("../data/paginated_tables.json")
+REPO_MODEL_MAPPING_FILE = Path("../data/model_map.json")
+SCHEMA_KEY_MAPPING_FILE = Path("../data/table_keys.json")
+
+# Feature template directory (as shown in your screenshot)
+FEATURE_TEMPLATE_DIR = Path("../templates/feature_template")
+
+# Output root for all generated packages (reusing from repository script)
+OUTPUT_PACKAGES_ROOT = ROOT_DIR / "lib" / "features"
+
+# Records the input hash of every generated file for incremental regeneration
+MANIFEST_FILE = ROOT_DIR / MANIFEST_FILE_NAME
+
+# --- Jinja2 Environment Setup ---
+feature_env = utils.create_environment(FEATURE_TEMPLATE_DIR)
+
+def load_tables(schema_key_mapping: dict) -> dict:
+    """
+    Builds the IR of every table from schema.txt, the key mapping and paginated_tables.json,
+    as generate.py does. The columns matter to features too: list reads are only paginated
+    for tables with created_at.
+    """
+    return build_tables(
+        utils.read_schema(SCHEMA_FILE), schema_key_mapping, paginated_tables=load_paginated_tables(PAGINATED_TABLES_FILE),
+    )
+
+# --- Feature Rendering (runs in worker processes when --jobs > 1) ---
+def feature_render_context(feature_base_name: str, tables: list) -> dict:
+    """Builds the template variables shared by every file of a feature from the IR of its tables."""
+    feature_object_name = utils.snake_to_pascal(feature_base_name) # e.g., 'CustomerFeature'
+
+    # Determine if this feature needs 'wineryId' based on its associated models
+    needs_winery_id = False
+
+    return {
+        "feature": feature_base_name,
+        "feature_pascal": feature_object_name,
+        "feature_camel": utils.snake_to_camel(feature_base_name),
+        "full_feature_folder_name": feature_base_name, # e.g., 'customer_feature'
+        "object_name": feature_object_name,
+        "tables": tables,
+        "needs_winery_id": needs_winery_id,
+    }
+
+def render_feature_templates(feature_base_name: str, tables: list, templates: list) -> list:
+    """
+    Renders the given feature templates without touching disk.
+
+    Args:
+        feature_base_name (str): The base name of the feature (e.g., 'customer').
+        tables (list): IR Table entries of the feature's models, in mapping order.
+        templates (list): (template_path, output_path, header) tuples to render.
+
+    Returns:
+        list: The rendered contents, in the order of templates.
+    """
+    context = feature_render_context(feature_base_name, tables)
+    rendered = []
+    for template_path, output_path, header in templates:
+        with profiling.phase("template_load"):
+            template = feature_env.get_template(template_path)
+        with profiling.phase("render", output=str(output_path)):
+            rendered.append(template.render(context, header=header))
+    return rendered
+
+# --- Feature Generation Function ---
+def feature_path_pattern(relative_path: Path) -> str:
+    """Maps a path in the feature template tree to its output path pattern in a feature."""
+    processed_components = []
+    for component in relative_path.parts:
+        if component == "_feature_name_": # For the root lib file or pubspec.yaml if named that way
+            processed_components.append("{feature}")
+        elif component == "pubspec.yaml.jinja": # Handle explicit pubspec.yaml template
+            processed_components.append("pubspec.yaml")
+        elif component.endswith(".jinja"): # General case for .jinja files
+            processed_components.append(utils.placeholder_pattern(component.removesuffix(".jinja")))
+        else: # Folder names with jinja vars, or plain names
+            processed_components.append(utils.placeholder_pattern(component))
+    return Path(*processed_components).as_posix()
+
+@dataclass
+class PendingFeature:
+    """A feature whose templates have been submitted to an executor but not yet written."""
+    name: str
+    path: Path
+    static_files: list # RenderedFile entries for files copied verbatim from the template
+    outputs: list # (kind, target_path, digest, depends_on) tuples, in the order they were submitted
+    rendered: Future | None
+    is_new: bool
+    staging_dir: Path | None = None # Scratch copy a new feature is built in
+
+def submit_feature(
+    feature_base_name: str,
+    output_dir: Path,
+    models_for_feature: list,
+    schema_key_mapping: dict,
+    manifest: Manifest,
+    executor: Executor,
+    tables: dict,
+) -> PendingFeature:
+    """
+    Stages the static files of a new feature in a scratch copy and submits every
+    out-of-date template of the feature to the executor as a single unit.
+    """
+    full_feature_folder_name = feature_base_name # e.g., 'customer_feature'
+    target_feature_path = output_dir / full_feature_folder_name
+
+    # Feature templates only read the IR of the feature's own models
+    feature_keys = {model: schema_key_mapping.get(model) for model in models_for_feature}
+    feature_tables = tables_for(tables, models_for_feature)
+    render_context = feature_render_context(feature_base_name, feature_tables)
+
+    def feature_digest(template_path: str) -> str:
+        return hash_inputs(
+            template_path,
+            utils.template_source(feature_env, template_path),
+            feature_base_name,
+            models_for_feature,
+            feature_keys,
+            [table_signature(table) for table in feature_tables], # e.g. whether list reads are paginated
+        )
+
+    static_files = []
+    outputs = []
+    templates = []
+    staging_dir = None
+    is_new = not target_feature_path.exists()
+    if not is_new:
+        print(f"\n--- Feature '{full_feature_folder_name}' already exists. Skipping structure generation. ---")
+        # Ensure subdirectories exist for rendering templates in place
+        utils.make_dirs(target_feature_path / "cubit")
+        utils.make_dirs(target_feature_path / "page_data")
+        utils.make_dirs(target_feature_path / "pages")
+        utils.make_dirs(target_feature_path / "widgets")
+    else:
+        print(f"\n--- Creating new Feature: '{full_feature_folder_name}' ---")
+        # The feature is built in a scratch copy and renamed into place once complete
+        staging_dir = None if utils.is_planning() else utils.make_staging_dir(target_feature_path)
+        try:
+            # The feature template tree is scanned once per run; static files are copied
+            # here, templates are rendered by the executor
+            for entry in utils.scan_template_tree(FEATURE_TEMPLATE_DIR, feature_path_pattern):
+                relative_path = entry.pattern.format_map(render_context)
+                target_file_path = target_feature_path / relative_path
+
+                if not entry.is_static:
+                    digest = feature_digest(entry.template)
+                    depends_on = output_dependencies(feature_env, entry.template, tables=models_for_feature)
+                    outputs.append((None, target_file_path, digest, depends_on))
+                    templates.append((entry.template, target_file_path, utils.generate_header(digest)))
+                elif staging_dir is None:
+                    static_files.append(RenderedFile(target_file_path, entry.source.read_bytes()))
+                else:
+                    # Static files are written verbatim (after formatting), from a clone of the template
+                    static_files.append(RenderedFile(target_file_path, None, staged=utils.stage_copy(entry.source, staging_dir / relative_path)))
+        except BaseException:
+            utils.remove_staging_dir(staging_dir)
+            raise
+
+    # Regenerate cubit and state whenever their inputs changed
+    print(f"  Regenerating cubit and state for '{full_feature_folder_name}':")
+    for kind in ("cubit", "state"):
+        template_path = f"cubit/{{{{ feature }}}}_{kind}.dart.jinja"
+        output_path = target_feature_path / "cubit" / f"{feature_base_name}_{kind}.dart"
+        if any(queued_path == output_path for _, queued_path, _, _ in outputs):
+            continue # Already rendered as part of the new feature structure
+        digest = feature_digest(template_path)
+        if manifest.is_current(output_path, digest):
+            print(f"    - Unchanged {kind}: {output_path.name}")
+            continue
+        outputs.append((kind, output_path, digest, output_dependencies(feature_env, template_path, tables=models_for_feature)))
+        templates.append((template_path, output_path, utils.generate_header(digest))) # Rendered here: workers don't share header settings
+
+    rendered = None
+    if templates:
+        rendered = executor.submit(render_feature_templates, feature_base_name, feature_tables, templates)
+    return PendingFeature(
+        name=full_feature_folder_name,
+        path=target_feature_path,
+        static_files=static_files,
+        outputs=outputs,
+        rendered=rendered,
+        is_new=is_new,
+        staging_dir=staging_dir,
+    )
+
+def collect_feature(pending: PendingFeature) -> list:
+    """Waits for the renders of a submitted feature and returns them as RenderedFile entries."""
+    contents = pending.rendered.result() if pending.rendered else []
+    rendered_files = list(pending.static_files)
+    for (kind, output_path, digest, depends_on), content in zip(pending.outputs, contents):
+        label = f"{kind}: {output_path.name}" if kind else None
+        rendered_files.append(RenderedFile(output_path, content, digest, label, depends_on))
+    return rendered_files
+
+def write_feature(pending: PendingFeature, rendered_files: list, manifest: Manifest) -> Path:
+    """Swaps the collected (and formatted) files of a feature into place in a fixed order."""
+    swap_package(rendered_files, manifest, pending.path, pending.staging_dir)
+    if pending.is_new:
+        print(f"  Base feature structure created for '{pending.name}'.")
+    print(f"  Finished cubit and state generation for '{pending.name}'.")
+    return pending.path
+
+def create_dart_feature_from_template(
+    feature_base_name: str,
+    output_dir: Path,
+    models_for_feature: list,
+    schema_key_mapping: dict,
+    manifest: Manifest | None = None,
+    executor: Executor | None = None,
+    formatter: DartFormatter | None = None,
+    tables: dict | None = None,
+):
+    """
+    Creates a new Dart feature package and generates its associated cubits and states.
+    The cubit and state are only re-rendered when their inputs changed (per the manifest).
+
+    Args:
+        feature_base_name (str): The base name for the new feature (e.g., 'customer').
+        output_dir (Path): The root directory where the new feature package will be created.
+        models_for_feature (list): A list of table names (strings) that are relevant
+                                   to this specific feature's cubit and state.
+        schema_key_mapping (dict): The dictionary containing primary and foreign keys for all tables.
+        manifest (Manifest | None): Input hashes of previously generated files. If None,
+                                    the cubit and state are always regenerated.
+        executor (Executor | None): Where the templates are rendered. If None, they are
+                                    rendered in this process.
+        formatter (DartFormatter | None): Formats the rendered Dart files before they are
+                                          written. If None, they are written as rendered.
+        tables (dict | None): The IR of every table (ir.build_tables). Built from schema.txt
+                              and the key mapping if None.
+    """
+    manifest = manifest or Manifest()
+    executor = executor or SerialExecutor()
+    tables = tables or load_tables(schema_key_mapping)
+    pending = submit_feature(feature_base_name, output_dir, models_for_feature, schema_key_mapping, manifest, executor, tables)
+    rendered_files = collect_feature(pending)
+    if formatter:
+        formatter.format_files(rendered_files)
+    return write_feature(pending, rendered_files, manifest)
+
+# --- Feature Stage ---
+def generate_all_features(
+    repo_model_mapping: dict,
+    schema_key_mapping: dict,
+    output_dir: Path = OUTPUT_PACKAGES_ROOT,
+    manifest: Manifest | None = None,
+    executor: Executor | None = None,
+    formatter: DartFormatter | None = None,
+    tables: dict | None = None,
+) -> list:
+    """
+    Creates every feature listed in the model mapping.
+    Assumes each repository corresponds to a feature of the same base name.
+
+    Every feature is submitted to the executor first, then formatted in a single
+    batch and written in mapping order, so the output does not depend on which
+    worker finishes first.
+
+    Args:
+        repo_model_mapping (dict): Feature name -> list of table names from model_map.json.
+        schema_key_mapping (dict): The dictionary containing primary and foreign keys for all tables.
+        output_dir (Path): The root directory where features are created.
+        manifest (Manifest | None): Input hashes of previously generated files.
+        executor (Executor | None): Where features are rendered. If None, they are
+                                    rendered in this process.
+        formatter (DartFormatter | None): Formats every rendered Dart file in one batch
+                                          before writing. If None, files are written as rendered.
+        tables (dict | None): The IR of every table (ir.build_tables), shared with the other
+                              stages. Built from schema.txt and the key mapping if None.
+
+    Returns:
+        list: Paths of the features that were created or updated.
+    """
+    manifest = manifest or Manifest()
+    executor = executor or SerialExecutor()
+    tables = tables or load_tables(schema_key_mapping)
+    utils.make_dirs(output_dir)
+    print(f"Ensured output directory '{output_dir}' exists.")
+
+    pending_features = []
+    for feature_base_name, models_for_feature in repo_model_mapping.items():
+        try:
+            print(f"Processing feature '{feature_base_name}'...")
+            pending_features.append(submit_feature(
+                feature_base_name,
+                output_dir,
+                models_for_feature,
+                schema_key_mapping,
+                manifest,
+                executor,
+                tables,
+            ))
+        except Exception as e:
+            print(f"Error processing feature '{feature_base_name}': {e}")
+
+    collected_features = []
+    for pending in pending_features:
+        try:
+            collected_features.append((pending, collect_feature(pending)))
+        except Exception as e:
+            utils.remove_staging_dir(pending.staging_dir)
+            print(f"Error processing feature '{pending.name}': {e}")
+
+    if formatter:
+        formatter.format_files([rendered for _, rendered_files in collected_features for rendered in rendered_files])
+
+    created_feature_paths = []
+    for pending, rendered_files in collected_features:
+        try:
+            created_feature_paths.append(write_feature(pending, rendered_files, manifest))
+        except Exception as e:
+            utils.remove_staging_dir(pending.staging_dir)
+            print(f"Error processing feature '{pending.name}': {e}")
+    return created_feature_paths
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    print("--- Dart Feature Generator ---")
+    print(f"Schema file: {SCHEMA_FILE.resolve()}")
+    print(f"Repository-Model mapping file: {REPO_MODEL_MAPPING_FILE.resolve()}")
+    print(f"Schema Key Mapping file: {SCHEMA_KEY_MAPPING_FILE.resolve()}")
+    print(f"Paginated tables file: {PAGINATED_TABLES_FILE.resolve()}")
+    print(f"Feature template: {FEATURE_TEMPLATE_DIR.resolve()}")
+    print(f"Output root for packages: {OUTPUT_PACKAGES_ROOT.resolve()}")
+    print("-" * 50)
+
+    try:
+        repo_model_mapping = utils.read_json(REPO_MODEL_MAPPING_FILE)
+        if not repo_model_mapping:
+            print(f"No repository-model mapping found in '{REPO_MODEL_MAPPING_FILE}'. Exiting.")
+            exit(1)
+        print(f"Loaded mapping for {len(repo_model_mapping)} repositories/features.")
+
+        schema_key_mapping = utils.read_json(SCHEMA_KEY_MAPPING_FILE)
+        if not schema_key_mapping:
+            print(f"No schema key mapping found in '{SCHEMA_KEY_MAPPING_FILE}'. Exiting.")
+            exit(1)
+        print(f"Loaded schema key mapping for {len(schema_key_mapping)} tables.")
+
+        formatter = DartFormatter(ROOT_DIR)
+        manifest = Manifest(MANIFEST_FILE, formatter=formatter.version)
+        created_feature_paths = generate_all_features(
+            repo_model_mapping=repo_model_mapping,
+            schema_key_mapping=schema_key_mapping,
+            manifest=manifest,
+            formatter=formatter,
+            tables=load_tables(schema_key_mapping),
+        )
+        manifest.save()
+
+        print("\n--- Post-Creation Steps ---")
+        if created_feature_paths:
+            # Features live inside the app package, which is resolved with its local dependencies
+            run_pub_get(ROOT_DIR)
+        else:
+            print("No new features were created/processed.")
+
+        print("\n--- All operations complete! ---")
+        print(f"Features created in: {OUTPUT_PACKAGES_ROOT}")
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing JSON mapping file: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred during execution: {e}")
+        exit(1)
+
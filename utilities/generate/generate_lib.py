@@ -0,0 +1,178 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils
+from manifest import Manifest, hash_inputs, MANIFEST_FILE_NAME
+from output import RenderedFile, swap_package
+from formatter import DartFormatter
+from pub_get import run_pub_get
+import profiling
+from depgraph import output_dependencies
+from ir import naming_table
+
+# --- Configuration Paths ---
+ROOT_DIR = Path("../../frontend/roommate_expense_tracker")
+REPOSITORY_SOURCE = Path("../data/repositories.txt")
+# Lib paths
+LIB_DIR = ROOT_DIR / "lib"
+APP_FILE = LIB_DIR / "app" / "view" / "app.dart"
+MAIN_FILE = LIB_DIR / "main.dart"
+DI_SETUP_FILE = LIB_DIR / "config" / "di_setup.dart"
+ROOT_PUBSPEC_FILE = ROOT_DIR / "pubspec.yaml"
+FAILURE_DIR = LIB_DIR / "features" / "failures"
+LIB_UPDATE_TEMPLATE_DIR = Path("../templates/lib_templates")
+# Records the input hash of every generated file for incremental regeneration
+MANIFEST_FILE = ROOT_DIR / MANIFEST_FILE_NAME
+
+# New Jinja environment for lib file updates
+lib_env = utils.create_environment(LIB_UPDATE_TEMPLATE_DIR)
+
+def display_path(path: Path, base: Path = ROOT_DIR) -> Path:
+    """Returns path relative to base (the app root) for progress output, unchanged if it lies elsewhere."""
+    try:
+        return path.relative_to(base)
+    except ValueError:
+        return path
+
+def render_lib_file(
+    template_name: str,
+    output_path: Path,
+    manifest: Manifest | None = None,
+    pound_header: bool = False,
+    names: dict | None = None,
+    **context,
+) -> RenderedFile | None:
+    """
+    Renders a lib template for output_path unless its inputs are unchanged since the last run.
+
+    Args:
+        template_name (str): The template within lib_templates to render.
+        output_path (Path): Where the rendered file is written.
+        manifest (Manifest | None): Input hashes of previously generated files.
+        pound_header (bool): Use the '#' comment header (for YAML) instead of the '//' one.
+        names (dict | None): Naming table (ir.naming_table) of the repositories. Derived from
+                             the context, so it is not part of the digest.
+        **context: Template variables. The header is added here.
+
+    Returns:
+        RenderedFile | None: The rendered file, or None if it is up to date.
+    """
+    manifest = manifest or Manifest()
+    digest = hash_inputs(template_name, utils.template_source(lib_env, template_name), context, pound_header)
+    if manifest.is_current(output_path, digest):
+        print(f"Unchanged: {display_path(output_path)}")
+        return None
+    header = utils.generate_pound_header(digest) if pound_header else utils.generate_header(digest)
+    with profiling.phase("template_load"):
+        template = lib_env.get_template(template_name)
+    with profiling.phase("render", output=str(output_path)):
+        content = template.render(header=header, names=names or {}, **context)
+    return RenderedFile(output_path, content, digest, depends_on=output_dependencies(lib_env, template_name))
+
+def write_lib_files(rendered_files: list, manifest: Manifest | None = None, formatter: DartFormatter | None = None, root_dir: Path = ROOT_DIR):
+    """
+    Formats the rendered lib files in one batch and writes the ones that changed,
+    all-or-nothing (output.swap_package), so app.dart, main.dart, di_setup.dart, the
+    failures and the root pubspec.yaml are never left half-updated.
+    """
+    manifest = manifest or Manifest()
+    rendered_files = [rendered for rendered in rendered_files if rendered]
+    if formatter:
+        formatter.format_files(rendered_files)
+    written_paths = swap_package(rendered_files, manifest, root_dir)
+    for rendered in rendered_files:
+        status = "Generated" if rendered.path in written_paths else "Unchanged"
+        print(f"{status}: {display_path(rendered.path)}")
+
+def render_failure_files(repositories: list, output_dir: Path, manifest: Manifest | None = None) -> list:
+    """Renders individual failure files for each repository."""
+    print(f"\n--- Generating failure files in {display_path(output_dir, LIB_DIR)} ---")
+    names = naming_table(repositories)
+    rendered_files = []
+    for repository in repositories:
+        failure_file_name = f'{repository}_failures.dart' # e.g., customer_failures.dart
+        failure_file_path = output_dir / failure_file_name
+        rendered_files.append(render_lib_file('failures.dart.jinja', failure_file_path, manifest, names=names, repository=repository))
+    return rendered_files
+
+def typed_cache_repositories(repositories: list, root_dir: Path = ROOT_DIR, typed_cache: bool = False) -> list:
+    """
+    Returns the repositories whose packages cache their models as Isar records, so main.dart
+    opens their collections. Packages not on disk (e.g. while planning) follow typed_cache.
+    """
+    return [
+        repository for repository in repositories
+        if utils.uses_typed_cache(root_dir / "packages" / f"{repository}_repository", typed_cache)
+    ]
+
+# --- Lib Stage ---
+def generate_all_lib_files(
+    repositories: list,
+    manifest: Manifest | None = None,
+    formatter: DartFormatter | None = None,
+    root_dir: Path = ROOT_DIR,
+    typed_cache: bool = False,
+):
+    """
+    Generates app.dart, main.dart, di_setup.dart, the failure files and the root pubspec.yaml.
+    Every lib file is rendered first so the Dart files are formatted in a single batch
+    and swapped into place together.
+
+    Args:
+        root_dir (Path): The Flutter app the lib files belong to (the benchmark points this at a temp root).
+        typed_cache (bool): Whether repository packages that are not on disk use typed cache records.
+    """
+    manifest = manifest or Manifest()
+    failure_dir = root_dir / FAILURE_DIR.relative_to(ROOT_DIR)
+    names = naming_table(repositories)
+    typed_repositories = typed_cache_repositories(repositories, root_dir, typed_cache)
+    utils.make_dirs(failure_dir) # Ensure the failure directory exists
+    rendered_files = [
+        render_lib_file('app.dart.jinja', root_dir / APP_FILE.relative_to(ROOT_DIR), manifest, names=names, repositories=repositories),
+        render_lib_file('main.dart.jinja', root_dir / MAIN_FILE.relative_to(ROOT_DIR), manifest, names=names, repositories=repositories, typed_repositories=typed_repositories),
+        render_lib_file('di_setup.dart.jinja', root_dir / DI_SETUP_FILE.relative_to(ROOT_DIR), manifest, names=names, repositories=repositories),
+        *render_failure_files(repositories, failure_dir, manifest),
+        render_lib_file('pubspec.yaml.jinja', root_dir / ROOT_PUBSPEC_FILE.relative_to(ROOT_DIR), manifest, pound_header=True, repositories=repositories),
+    ]
+    write_lib_files(rendered_files, manifest, formatter, root_dir)
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    print("\n" + "="*50)
+    print("--- Dart Lib File Updates ---")
+    print(f"Repository source: {REPOSITORY_SOURCE.resolve()}")
+    print(f"App file target: {APP_FILE.resolve()}")
+    print(f"Main file target: {MAIN_FILE.resolve()}")
+    print(f"DI Setup file target: {DI_SETUP_FILE.resolve()}")
+    print(f"Failure directory target: {FAILURE_DIR.resolve()}")
+    print("="*50)
+    try:
+        # --- Part 2: Update Lib Files ---
+        updated_repos = utils.read_repositories(REPOSITORY_SOURCE)
+        if not updated_repos:
+            print(f"No repositories found in '{REPOSITORY_SOURCE}' for lib updates. Skipping lib file generation.")
+        else:
+            print(f"Loaded {len(updated_repos)} repositories for lib updates: {', '.join(updated_repos)}")
+            formatter = DartFormatter(ROOT_DIR)
+            manifest = Manifest(MANIFEST_FILE, formatter=formatter.version)
+            generate_all_lib_files(updated_repos, manifest, formatter)
+            manifest.save()
+            print("\n--- All lib file updates complete! ---")
+            run_pub_get(ROOT_DIR)
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing JSON mapping file: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred during execution: {e}")
+        exit(1)
\ No newline at end of file
@@ -0,0 +1,509 @@
+import json
+from collections import defaultdict
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from jinja2 import select_autoescape
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils
+from manifest import Manifest, hash_inputs, MANIFEST_FILE_NAME
+from parallel import SerialExecutor
+from output import RenderedFile, swap_package
+from formatter import DartFormatter
+from pub_get import run_pub_get
+import profiling
+from depgraph import output_dependencies
+from ir import Table, build_tables, table_signature, tables_for
+from inputs import load_cache_policy, load_paginated_tables
+
+# --- Configuration Paths ---
+ROOT_DIR = Path("../../frontend/roommate_expense_tracker")
+
+SCHEMA_FILE = Path("../data/schema.txt")
+REPO_MODEL_MAPPING_FILE = Path("../data/model_map.json")
+SCHEMA_KEY_MAPPING_FILE = Path("../data/table_keys.json")
+# Per-model cache TTLs and in-memory cache sizes
+CACHE_POLICY_FILE = Path("../data/cache_policy.json")
+PAGINATED_TABLES_FILE = Path("../data/paginated_tables.json")
+REPOSITORY_SOURCE = Path("../data/repositories.txt")
+REPO_TEMPLATE_DIR = Path("../templates/repository_template")
+MODEL_TEMPLATE_DIR = Path("../templates/model_template")
+MODEL_TEMPLATE_NAME = "dart_model.dart.jinja"
+# Records the input hash of every generated file for incremental regeneration
+MANIFEST_FILE = ROOT_DIR / MANIFEST_FILE_NAME
+# Output root for all generated packages
+OUTPUT_PACKAGES_ROOT = ROOT_DIR / "packages"
+# Template chunks buffered per write when streaming large repository files
+STREAM_BUFFER_CHUNKS = 64
+
+# --- Jinja2 Environment Setup ---
+# Environment for repository templates
+repo_env = utils.create_environment(REPO_TEMPLATE_DIR)
+
+# Environment for model templates
+model_env = utils.create_environment(MODEL_TEMPLATE_DIR, autoescape=select_autoescape(['html', 'xml']))
+
+# --- Model Generation Function (Leverages model_env) ---
+def generate_dart_class_with_jinja(table: Table, import_prefix: str, header: str | None = None, typed_cache: bool = False):
+    """
+    Renders the Dart model class of a table from its IR. With typed_cache, cacheable
+    tables also get an Isar record collection (generated by build_runner into a part file).
+    """
+    header = header or utils.generate_header()
+    with profiling.phase("template_load"):
+        template = model_env.get_template(MODEL_TEMPLATE_NAME)
+    return template.render(
+        table=table,
+        import_prefix=import_prefix,
+        header=header,
+        typed_cache=typed_cache,
+    )
+
+# --- Repository Rendering (runs in worker processes when --jobs > 1) ---
+def repo_path_pattern(relative_path: Path) -> str:
+    """Maps a path in the repository template tree to its output path pattern in a package."""
+    processed_components = []
+    for component in relative_path.parts:
+        if component == "_repository_name_":
+            processed_components.append("{full_repository_folder_name}")
+        elif component == "_repository_name_.dart.jinja":
+            processed_components.append("{full_repository_folder_name}.dart")
+        else:
+            processed_components.append(utils.placeholder_pattern(component))
+
+    final_relative_path = Path(*processed_components)
+    if final_relative_path.suffix == '.jinja':
+        final_relative_path = final_relative_path.with_suffix('')
+    return final_relative_path.as_posix()
+
+def render_repository_structure(
+    base_repo_name: str,
+    target_repository_path: Path,
+    tables: list,
+    staging_dir: Path | None = None,
+    shared_fetch: bool = False,
+    decode_threshold: int | None = None,
+    typed_cache: bool = False,
+) -> list:
+    """
+    Renders the repository template tree for a new package.
+
+    The repository file grows with every model and key (four CRUD extensions each), so
+    with a staging_dir Dart templates are streamed in chunks into temp files in the
+    package's scratch copy instead of being built in memory. Nothing else touches disk;
+    the staged files are formatted and swapped into place by the writing process.
+
+    Args:
+        base_repo_name (str): The base name of the repository (e.g., 'customer').
+        target_repository_path (Path): Where the package is created.
+        tables (list): IR Table entries of the repository's models, in mapping order.
+        staging_dir (Path | None): Scratch copy of the package (utils.make_staging_dir) to
+                                   stream Dart templates and copy static files into. If None,
+                                   everything is held in memory.
+        shared_fetch (bool): Render repository methods as calls to api_client's cachedFetch.
+        decode_threshold (int | None): Payload length from which the list reads decode and
+                                       convert JSON on a background isolate. None decodes inline.
+        typed_cache (bool): Cache the rows of cacheable tables as Isar records instead of JSON strings.
+
+    Returns:
+        list: RenderedFile entries in template order. Static files have no digest and
+              are staged copies (reflinks where supported) with a staging_dir, raw bytes otherwise.
+    """
+    full_repo_folder_name = f'{base_repo_name}_repository' # e.g., 'customer_repository'
+    repo_render_context = {
+        "repository_name": base_repo_name,
+        "full_repository_folder_name": full_repo_folder_name,
+        "object_name": utils.snake_to_pascal(base_repo_name), # e.g., 'Customer'
+        "tables": tables,
+        "needs_winery_id": base_repo_name != 'winery',
+        "shared_fetch": shared_fetch,
+        "decode_threshold": decode_threshold,
+        "typed_cache": typed_cache,
+    }
+    # Digests cover what the templates read of each table, not the whole IR
+    digest_context = {**repo_render_context, "tables": [table_signature(table) for table in tables]}
+
+    rendered_files = []
+    # The tree is scanned once per run; a new package is a format over its entries
+    for entry in utils.scan_template_tree(REPO_TEMPLATE_DIR, repo_path_pattern):
+        # Skip models directory in template, as models are generated separately
+        if "lib/src/models" in entry.template:
+            continue
+
+        relative_path = entry.pattern.format_map(repo_render_context)
+        target_file_path = target_repository_path / relative_path
+        if entry.is_static:
+            if staging_dir is not None:
+                rendered_files.append(RenderedFile(target_file_path, None, staged=utils.stage_copy(entry.source, staging_dir / relative_path)))
+            else:
+                rendered_files.append(RenderedFile(target_file_path, entry.source.read_bytes()))
+            continue
+
+        with profiling.phase("template_load"):
+            template = repo_env.get_template(entry.template)
+        digest = hash_inputs(entry.template, utils.template_source(repo_env, entry.template), digest_context)
+        depends_on = output_dependencies(repo_env, entry.template, tables=[table.name for table in tables])
+        with profiling.phase("render", output=str(target_file_path)):
+            if staging_dir is not None and target_file_path.suffix == ".dart":
+                chunks = template.stream(repo_render_context)
+                chunks.enable_buffering(STREAM_BUFFER_CHUNKS)
+                staged = utils.stage_stream(staging_dir / relative_path, chunks)
+                rendered_files.append(RenderedFile(target_file_path, None, digest, depends_on=depends_on, staged=staged))
+            else:
+                content = template.render(repo_render_context)
+                rendered_files.append(RenderedFile(target_file_path, content, digest, depends_on=depends_on))
+    return rendered_files
+
+# --- Repository Generation Function (Leverages repo_env) ---
+@dataclass
+class PendingRepository:
+    """A repository whose renders have been submitted to an executor but not yet written."""
+    name: str
+    path: Path
+    models_dir: Path
+    structure: Future | None
+    models: list # (table_name, model_file_path, digest, Future) tuples
+    staging_dir: Path | None = None # Scratch copy the new package is built in
+    stale_models: list = field(default_factory=list) # Model files deleted once the package is swapped
+
+def submit_repository(
+    base_repo_name: str,
+    output_dir: Path,
+    all_tables_schema: dict,
+    models_to_generate: list,
+    schema_key_mapping: dict,
+    manifest: Manifest,
+    executor: Executor,
+    tables: dict,
+    shared_fetch: bool = False,
+    decode_threshold: int | None = None,
+    typed_cache: bool = False,
+) -> PendingRepository:
+    """
+    Finds stale models and submits the repository structure (if new) and every
+    out-of-date model to the executor. Nothing is rendered or deleted in this process;
+    stale models are deleted when the package is swapped (see write_repository).
+
+    Whether the models get typed cache records is a property of the package: new
+    packages follow typed_cache, existing ones keep what they were created with.
+    """
+    full_repo_folder_name = f'{base_repo_name}_repository' # e.g., 'customer_repository'
+    target_repository_path = output_dir / full_repo_folder_name
+    target_models_dir = target_repository_path / "lib" / "src" / "models" # Standard model location
+    typed_cache = utils.uses_typed_cache(target_repository_path, typed_cache)
+
+    structure_future = None
+    staging_dir = None
+    stale_models = []
+    if target_repository_path.exists():
+        print(f"\n--- Repository '{full_repo_folder_name}' already exists. Skipping repository structure generation. ---")
+        # Ensure model directory exists even if repo existed, in case it was deleted
+        utils.make_dirs(target_models_dir)
+
+        # --- Find generated models that are no longer mapped to this repository ---
+        # Only files the generator wrote (recorded in the manifest or carrying its header)
+        # are deleted; hand-written models next to them are left alone.
+        expected_model_files = {f"{table_name}.dart" for table_name in models_to_generate}
+        existing_models = sorted(target_models_dir.iterdir()) if target_models_dir.exists() else []
+        for item in existing_models:
+            if not item.is_file() or item.suffix != ".dart" or item.name.endswith(".g.dart") or item.name in expected_model_files:
+                continue
+            if manifest.records(item) or utils.has_generated_header(item):
+                stale_models.append(item)
+                # The Isar part file build_runner generated for a typed model goes with it
+                part_file = item.with_suffix(".g.dart")
+                if part_file.exists():
+                    stale_models.append(part_file)
+        if stale_models:
+            print(f"  {len(stale_models)} stale models in '{target_models_dir}' will be deleted.")
+    else:
+        print(f"\n--- Creating new Repository: '{full_repo_folder_name}' ---")
+        # The package is built in a scratch copy and renamed into place once complete.
+        # Plans never touch disk, so they render in memory.
+        staging_dir = None if utils.is_planning() else utils.make_staging_dir(target_repository_path)
+        structure_future = executor.submit(
+            render_repository_structure,
+            base_repo_name,
+            target_repository_path,
+            tables_for(tables, models_to_generate), # Workers only get this repository's own tables
+            staging_dir,
+            shared_fetch,
+            decode_threshold,
+            typed_cache,
+        )
+
+    # --- Submit models whose inputs changed since the last run ---
+    model_import_prefix = f'package:app_core/app_core.dart'
+    model_template_source = utils.template_source(model_env, MODEL_TEMPLATE_NAME)
+
+    model_futures = []
+    for table_name in models_to_generate:
+        if table_name not in all_tables_schema:
+            print(f"    - Warning: Model '{table_name}' from mapping not found in schema.txt. Skipping.")
+            continue
+        model_file_path = target_models_dir / f"{table_name}.dart"
+        digest = hash_inputs(
+            table_name,
+            all_tables_schema[table_name],
+            schema_key_mapping.get(table_name),
+            model_import_prefix,
+            model_template_source,
+            typed_cache,
+            [tables[table_name].cache_ttl_minutes, tables[table_name].memory_cache_size],
+        )
+        if manifest.is_current(model_file_path, digest):
+            print(f"    - Unchanged model: {utils.snake_to_pascal(table_name)}.dart")
+            continue
+        # Renders inline (and is timed) with --jobs 1; otherwise this only dispatches to a worker
+        with profiling.phase("render", output=str(model_file_path)):
+            future = executor.submit(
+                generate_dart_class_with_jinja,
+                tables[table_name],
+                import_prefix=model_import_prefix,
+                header=utils.generate_header(digest), # Rendered here: workers don't share header settings
+                typed_cache=typed_cache,
+            )
+        model_futures.append((table_name, model_file_path, digest, future))
+
+    return PendingRepository(
+        name=full_repo_folder_name,
+        path=target_repository_path,
+        models_dir=target_models_dir,
+        structure=structure_future,
+        models=model_futures,
+        staging_dir=staging_dir,
+        stale_models=stale_models,
+    )
+
+def collect_repository(pending: PendingRepository) -> list:
+    """Waits for the renders of a submitted repository and returns them as RenderedFile entries."""
+    rendered_files = []
+    if pending.structure is not None:
+        rendered_files.extend(pending.structure.result())
+    for table_name, model_file_path, digest, future in pending.models:
+        try:
+            label = f"model: {utils.snake_to_pascal(table_name)}.dart"
+            depends_on = output_dependencies(model_env, MODEL_TEMPLATE_NAME, tables=[table_name])
+            rendered_files.append(RenderedFile(model_file_path, future.result(), digest, label, depends_on))
+        except Exception as e:
+            print(f"    - Error generating model '{table_name}': {e}")
+    return rendered_files
+
+def write_repository(pending: PendingRepository, rendered_files: list, manifest: Manifest) -> Path:
+    """
+    Swaps the collected (and formatted) files of a repository into place in a fixed
+    order, then deletes its stale models. Nothing in the package changes if staging fails.
+    """
+    print(f"  Generating models for '{pending.name}':")
+    swap_package(rendered_files, manifest, pending.path, pending.staging_dir, pending.stale_models)
+    utils.make_dirs(pending.models_dir) # Kept even when the repository has no models
+    if pending.structure is not None:
+        print(f"  Base repository structure created for '{pending.name}'.")
+    print(f"  Finished model generation for '{pending.name}'.")
+    return pending.path
+
+def create_dart_repository_from_template(
+    base_repo_name: str,
+    output_dir: Path,
+    all_tables_schema: dict,
+    models_to_generate: list,
+    schema_key_mapping: dict,
+    manifest: Manifest | None = None,
+    executor: Executor | None = None,
+    formatter: DartFormatter | None = None,
+    tables: dict | None = None,
+):
+    """
+    Creates a new Dart repository package and generates its associated models.
+    Models whose inputs are unchanged since the last run (per the manifest) are skipped.
+
+    Args:
+        base_repo_name (str): The base name for the new repository (e.g., 'customer').
+        output_dir (Path): The directory where the new repository will be created.
+        all_tables_schema (dict): The complete parsed schema from schema.txt.
+        models_to_generate (list): A list of table names (strings) that belong
+                                   to this specific repository.
+        schema_key_mapping (dict): The dictionary containing primary and foreign keys for all tables.
+        manifest (Manifest | None): Input hashes of previously generated files. If None,
+                                    every model is regenerated.
+        executor (Executor | None): Where the structure and models are rendered. If None,
+                                    they are rendered in this process.
+        formatter (DartFormatter | None): Formats the rendered Dart files before they are
+                                          written. If None, they are written as rendered.
+        tables (dict | None): The IR of every table (ir.build_tables). Built from the schema
+                              and key mapping if None.
+    """
+    manifest = manifest or Manifest()
+    executor = executor or SerialExecutor()
+    tables = tables or build_tables(all_tables_schema, schema_key_mapping)
+    pending = submit_repository(
+        base_repo_name, output_dir, all_tables_schema, models_to_generate, schema_key_mapping, manifest, executor, tables,
+    )
+    rendered_files = collect_repository(pending)
+    if formatter:
+        formatter.format_files(rendered_files)
+    return write_repository(pending, rendered_files, manifest)
+
+# --- Repository Stage ---
+def generate_all_repositories(
+    all_tables_schema: dict,
+    repo_model_mapping: dict,
+    schema_key_mapping: dict,
+    output_dir: Path = OUTPUT_PACKAGES_ROOT,
+    manifest: Manifest | None = None,
+    executor: Executor | None = None,
+    formatter: DartFormatter | None = None,
+    tables: dict | None = None,
+    shared_fetch: bool = False,
+    decode_threshold: int | None = None,
+    typed_cache: bool = False,
+) -> list:
+    """
+    Creates every repository package (and its models) listed in the model mapping.
+
+    All repositories and models are submitted to the executor first, then formatted
+    in a single batch and written in mapping order, so the output does not depend on
+    which worker finishes first.
+
+    Args:
+        all_tables_schema (dict): The complete parsed schema from schema.txt.
+        repo_model_mapping (dict): Repository name -> list of table names from model_map.json.
+        schema_key_mapping (dict): The dictionary containing primary and foreign keys for all tables.
+        output_dir (Path): The root directory where repository packages are created.
+        manifest (Manifest | None): Input hashes of previously generated files.
+        executor (Executor | None): Where repositories and models are rendered. If None,
+                                    they are rendered in this process.
+        formatter (DartFormatter | None): Formats every rendered Dart file in one batch
+                                          before writing. If None, files are written as rendered.
+        tables (dict | None): The IR of every table (ir.build_tables), shared with the other
+                              stages. Built from the schema and key mapping if None.
+        shared_fetch (bool): Render new repositories against api_client's cachedFetch helper
+                             (thin call sites) instead of inlining every method body.
+        decode_threshold (int | None): Render the list reads of new repositories to decode
+                                       payloads of at least this many characters on a background
+                                       isolate. None keeps decoding on the calling isolate.
+        typed_cache (bool): Give new repositories Isar record collections per model, so cached
+                            rows are stored and read back decoded instead of as JSON strings.
+
+    Returns:
+        list: Paths of the repository packages that were created or updated.
+    """
+    manifest = manifest or Manifest()
+    executor = executor or SerialExecutor()
+    tables = tables or build_tables(all_tables_schema, schema_key_mapping)
+    utils.make_dirs(output_dir)
+    print(f"Ensured output directory '{output_dir}' exists.")
+
+    pending_repositories = []
+    for repo_base_name, table_names_for_repo in repo_model_mapping.items():
+        try:
+            pending_repositories.append(submit_repository(
+                repo_base_name,
+                output_dir,
+                all_tables_schema,
+                table_names_for_repo,
+                schema_key_mapping,
+                manifest,
+                executor,
+                tables,
+                shared_fetch,
+                decode_threshold,
+                typed_cache,
+            ))
+        except Exception as e:
+            print(f"Error processing repository '{repo_base_name}': {e}")
+
+    collected_repositories = []
+    for pending in pending_repositories:
+        try:
+            collected_repositories.append((pending, collect_repository(pending)))
+        except Exception as e:
+            utils.remove_staging_dir(pending.staging_dir)
+            print(f"Error processing repository '{pending.name}': {e}")
+
+    if formatter:
+        formatter.format_files([rendered for _, rendered_files in collected_repositories for rendered in rendered_files])
+
+    created_repo_paths = []
+    for pending, rendered_files in collected_repositories:
+        try:
+            created_repo_paths.append(write_repository(pending, rendered_files, manifest))
+        except Exception as e:
+            utils.remove_staging_dir(pending.staging_dir)
+            print(f"Error processing repository '{pending.name}': {e}")
+    return created_repo_paths
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    print("--- Dart Repository and Model Generator ---")
+    print(f"Schema file: {SCHEMA_FILE.resolve()}")
+    print(f"Mapping file: {REPO_MODEL_MAPPING_FILE.resolve()}")
+    print(f"Schema Key Mapping file: {SCHEMA_KEY_MAPPING_FILE.resolve()}")
+    print(f"Cache policy file: {CACHE_POLICY_FILE.resolve()}")
+    print(f"Paginated tables file: {PAGINATED_TABLES_FILE.resolve()}")
+    print(f"Repository template: {REPO_TEMPLATE_DIR.resolve()}")
+    print(f"Model template: {MODEL_TEMPLATE_DIR.resolve()}")
+    print(f"Output root for packages: {OUTPUT_PACKAGES_ROOT.resolve()}")
+    print("-" * 50)
+
+    try:
+        all_tables_schema = utils.read_schema(SCHEMA_FILE)
+        if not all_tables_schema:
+            print(f"No tables found in '{SCHEMA_FILE}'. Exiting.")
+            exit(1)
+        print(f"Loaded schema with {len(all_tables_schema)} tables.")
+
+        repo_model_mapping = utils.read_json(REPO_MODEL_MAPPING_FILE)
+        if not repo_model_mapping:
+            print(f"No repository-model mapping found in '{REPO_MODEL_MAPPING_FILE}'. Exiting.")
+            exit(1)
+        print(f"Loaded mapping for {len(repo_model_mapping)} repositories.")
+
+        schema_key_mapping = utils.read_json(SCHEMA_KEY_MAPPING_FILE)
+        if not schema_key_mapping:
+            print(f"No schema key mapping found in '{SCHEMA_KEY_MAPPING_FILE}'. Exiting.")
+            exit(1)
+        print(f"Loaded schema key mapping for {len(schema_key_mapping)} tables.")
+
+        formatter = DartFormatter(ROOT_DIR)
+        manifest = Manifest(MANIFEST_FILE, formatter=formatter.version)
+        created_repo_paths = generate_all_repositories(
+            all_tables_schema=all_tables_schema,
+            repo_model_mapping=repo_model_mapping,
+            schema_key_mapping=schema_key_mapping,
+            manifest=manifest,
+            formatter=formatter,
+            tables=build_tables(
+                all_tables_schema,
+                schema_key_mapping,
+                load_cache_policy(CACHE_POLICY_FILE),
+                load_paginated_tables(PAGINATED_TABLES_FILE),
+            ),
+        )
+        manifest.save()
+
+        print("\n--- Post-Creation Steps ---")
+        if created_repo_paths:
+            # The app depends on every repository, so resolve the whole tree in dependency order
+            run_pub_get(ROOT_DIR)
+        else:
+            print("No new repositories were created/processed.")
+
+        print("\n--- All operations complete! ---")
+        print(f"Repositories created in: {OUTPUT_PACKAGES_ROOT}")
+
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        exit(1)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing JSON mapping file: {e}")
+        exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred during execution: {e}")
+        exit(1)
\ No newline at end of file
@@ -0,0 +1,135 @@
+import argparse
+import json
+import time
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils
+from inputs import load_inputs
+from manifest import Manifest
+from formatter import DartFormatter
+from pub_get import run_pub_get
+from watcher import create_watcher, wait_for_changes
+from depgraph import affected_outputs, changed_input_nodes, nodes_for_paths
+
+# Reuses the stage wiring (and its Jinja environments) of the one-shot generator
+import generate
+
+# --- Configuration Paths ---
+DATA_DIR = generate.SCHEMA_FILE.parent
+TEMPLATES_DIR = Path("../templates")
+
+DEFAULT_DEBOUNCE_SECONDS = 0.2
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Regenerates the Dart code whenever utilities/data or utilities/templates change.",
+    )
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="Render worker processes (default: 1, in-process).")
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE_SECONDS,
+        metavar="SECONDS",
+        help=f"Wait for this long without changes before regenerating (default: {DEFAULT_DEBOUNCE_SECONDS}).",
+    )
+    parser.add_argument("--poll", action="store_true", help="Poll for changes instead of using inotify.")
+    parser.add_argument(
+        "--deterministic-header",
+        action="store_true",
+        help="Stamp generated headers with each output's input hash instead of the current time.",
+    )
+    return parser.parse_args()
+
+def read_inputs():
+    """Parses the generator inputs, returning None (with the reason printed) if they are unusable."""
+    try:
+        inputs = load_inputs(
+            generate.SCHEMA_FILE,
+            generate.SCHEMA_KEY_MAPPING_FILE,
+            generate.REPO_MODEL_MAPPING_FILE,
+            generate.REPOSITORY_SOURCE,
+            generate.CACHE_POLICY_FILE,
+            generate.PAGINATED_TABLES_FILE,
+        )
+    except FileNotFoundError as e:
+        print(f"Error: Required file not found - {e.filename}")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"Error parsing JSON mapping file: {e}")
+        return None
+    error = generate.check_inputs(inputs)
+    if error:
+        print(error)
+        return None
+    return inputs
+
+def regenerate(inputs, manifest: Manifest, formatter: DartFormatter, jobs: int, affected: list | None = None):
+    """
+    Re-renders the outputs affected by a change (per the dependency graph) and any
+    output the graph does not know yet. Without affected outputs, every output whose
+    digest changed is re-rendered.
+    """
+    started = time.perf_counter()
+    manifest.restrict_to(affected)
+    try:
+        generate.render_all(inputs, manifest, formatter, jobs)
+        run_pub_get(generate.ROOT_DIR)
+    except Exception as e:
+        print(f"An unexpected error occurred during generation: {e}")
+        return
+    finally:
+        manifest.restrict_to(None)
+    print(f"\n--- Regenerated in {time.perf_counter() - started:.2f}s. Watching for changes... ---")
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    args = parse_args()
+    utils.set_deterministic_headers(args.deterministic_header)
+    print("--- Dart Code Generator (watch mode) ---")
+    print(f"Watching: {DATA_DIR.resolve()} and {TEMPLATES_DIR.resolve()}")
+    print(f"Output root: {generate.ROOT_DIR.resolve()}")
+    print("-" * 50)
+
+    # Templates are edited while watching, so always load them from source (Jinja
+    # reloads a template when its file changes) rather than from a precompiled bundle.
+    for env in generate.TEMPLATE_ENVS:
+        if isinstance(env.loader, utils.BundledLoader):
+            env.loader = env.loader.source_loader
+
+    inputs = read_inputs()
+    if inputs is None:
+        exit(1)
+    generate.load_templates()
+    formatter = DartFormatter(generate.ROOT_DIR)
+    manifest = Manifest(generate.MANIFEST_FILE, formatter=formatter.version)
+    regenerate(inputs, manifest, formatter, args.jobs)
+
+    watcher = create_watcher([DATA_DIR, TEMPLATES_DIR], force_polling=args.poll)
+    try:
+        while True:
+            changed = wait_for_changes(watcher, args.debounce)
+            print(f"\n--- Changed: {', '.join(sorted(str(path) for path in changed))} ---")
+            template_changes = [path for path in changed if DATA_DIR not in path.parents]
+            nodes = nodes_for_paths(template_changes, inputs, generate.TEMPLATE_ENVS)
+            if template_changes:
+                utils.scan_template_tree.cache_clear() # Template files may have been added, renamed or removed
+            if len(template_changes) < len(changed):
+                updated_inputs = read_inputs()
+                if updated_inputs is None:
+                    print("Keeping the previous inputs until the data files are valid again.")
+                    continue
+                nodes |= changed_input_nodes(inputs, updated_inputs)
+                inputs = updated_inputs
+            affected = affected_outputs(manifest, nodes)
+            print(f"{len(affected)} previously generated outputs affected.")
+            regenerate(inputs, manifest, formatter, args.jobs, affected)
+    except KeyboardInterrupt:
+        print("\n--- Stopped watching. ---")
+    finally:
+        watcher.close()
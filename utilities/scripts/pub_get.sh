@@ -0,0 +1,6 @@
+#!/bin/bash
+# pub_get.sh
+# Resolve every package under the current directory in dependency order,
+# running independent packages concurrently and skipping fresh ones.
+# Extra arguments (e.g. --jobs 8, --force) are passed through.
+python3 "$(dirname "$0")/../common/pub_get.py" . "$@"
@@ -0,0 +1,88 @@
+from pathlib import Path
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+from jinja2 import Environment, FileSystemLoader
+
+from depgraph import affected_outputs, changed_input_nodes, nodes_for_paths, output_dependencies, template_dependencies
+from inputs import GeneratorInputs
+from manifest import Manifest, MANIFEST_FILE_NAME
+import pytest
+
+@pytest.fixture
+def env(tmp_path):
+    template_dir = tmp_path / "repository_template"
+    template_dir.mkdir()
+    (template_dir / "repository.dart.jinja").write_text("{% include 'read.jinja' %}{% for table in tables %}{% endfor %}")
+    (template_dir / "read.jinja").write_text("{% import 'macros.jinja' as m %}{{ repository }}")
+    (template_dir / "macros.jinja").write_text("{% macro fetch() %}{% endmacro %}")
+    (template_dir / "static.dart.jinja").write_text("// static\n")
+    env = Environment(loader=FileSystemLoader(template_dir))
+    env.template_tree = (template_dir, {})
+    return env
+
+def generator_inputs(**overrides) -> GeneratorInputs:
+    fields = {
+        "schema": {"users": [("user_id", "UUID")], "houses": [("house_id", "UUID")]},
+        "table_keys": {"users": {"primary": ["user_id"]}, "houses": {"primary": ["house_id"]}},
+        "model_map": {"users": ["users"], "houses": ["houses"]},
+        "repositories": ["users", "houses"],
+        "tables": {},
+        "cache_policy": {},
+        "paginated_tables": [],
+    }
+    return GeneratorInputs(**{**fields, **overrides})
+
+# --- Dependency Nodes ---
+
+def test_template_dependencies_follow_includes_and_imports(env):
+    assert template_dependencies(env, "repository.dart.jinja") == {
+        "template:repository_template/repository.dart.jinja",
+        "template:repository_template/read.jinja",
+        "template:repository_template/macros.jinja",
+        "input:model_map.json",
+        "input:repositories.txt",
+    }
+    assert template_dependencies(env, "static.dart.jinja") == {"template:repository_template/static.dart.jinja"}
+
+def test_output_dependencies_add_the_rendered_tables(env):
+    assert output_dependencies(env, "static.dart.jinja", tables=["users"]) == [
+        "table:users",
+        "template:repository_template/static.dart.jinja",
+    ]
+
+# --- Change Detection ---
+
+def test_affected_outputs_are_the_dependents_of_the_changed_nodes(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    manifest.record(tmp_path / "packages/users_repository/lib/src/models/users.dart", "a", ["table:users", "template:model_template/dart_model.dart.jinja"])
+    manifest.record(tmp_path / "packages/houses_repository/lib/src/models/houses.dart", "b", ["table:houses", "template:model_template/dart_model.dart.jinja"])
+    manifest.record(tmp_path / "lib/app.dart", "c", ["input:repositories.txt", "template:lib_templates/app.dart.jinja"])
+
+    assert affected_outputs(manifest, {"table:users"}) == ["packages/users_repository/lib/src/models/users.dart"]
+    assert affected_outputs(manifest, {"template:model_template/dart_model.dart.jinja"}) == [
+        "packages/houses_repository/lib/src/models/houses.dart",
+        "packages/users_repository/lib/src/models/users.dart",
+    ]
+    assert affected_outputs(manifest, {"input:model_map.json"}) == []
+
+def test_changed_input_nodes_are_per_table(tmp_path):
+    old = generator_inputs()
+    assert changed_input_nodes(old, generator_inputs()) == set()
+    assert changed_input_nodes(old, generator_inputs(schema={**old.schema, "users": [("user_id", "TEXT")]})) == {"table:users"}
+    assert changed_input_nodes(old, generator_inputs(cache_policy={"houses": {"ttl_minutes": 5}})) == {"table:houses"}
+    assert changed_input_nodes(old, generator_inputs(paginated_tables=["houses"])) == {"table:houses"}
+    assert changed_input_nodes(old, generator_inputs(repositories=["users"])) == {"input:repositories.txt"}
+
+def test_nodes_for_paths(env, tmp_path):
+    inputs = generator_inputs()
+    template_dir, _ = env.template_tree
+    every_table = {"table:users", "table:houses"}
+    assert nodes_for_paths([tmp_path / "data" / "schema.txt"], inputs, [env]) == every_table
+    assert nodes_for_paths([tmp_path / "data" / "paginated_tables.json"], inputs, [env]) == every_table
+    assert nodes_for_paths([tmp_path / "data" / "model_map.json"], inputs, [env]) == {"input:model_map.json"}
+    assert nodes_for_paths([template_dir / "read.jinja"], inputs, [env]) == {"template:repository_template/read.jinja"}
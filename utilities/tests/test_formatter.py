@@ -0,0 +1,100 @@
+from pathlib import Path
+import subprocess
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+from formatter import DartFormatter, FormatCache
+from output import RenderedFile
+from plan import Plan
+import pytest
+
+@pytest.fixture
+def no_subprocesses(monkeypatch):
+    def run(command, *args, **kwargs):
+        raise AssertionError(f"spawned {command}")
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(subprocess, "Popen", run)
+
+@pytest.fixture
+def fake_dart(monkeypatch):
+    """Stands in for 'dart format': upper-cases every file it is given and records the runs."""
+    runs = []
+    def run(command, *args, **kwargs):
+        runs.append(command)
+        for target in command[2:]:
+            paths = Path(target).rglob("*.dart") if Path(target).is_dir() else [Path(target)]
+            for path in paths:
+                path.write_text(path.read_text().upper())
+        return subprocess.CompletedProcess(command, 0, "", "")
+    monkeypatch.setattr(DartFormatter, "_detect_version", staticmethod(lambda: "Dart SDK version: 3.8.0"))
+    monkeypatch.setattr(subprocess, "run", run)
+    return runs
+
+# --- Format Cache ---
+
+def test_cache_key_covers_version_options_and_source(tmp_path):
+    cache = FormatCache(tmp_path, "Dart SDK version: 3.8.0", b"formatter:\n  page_width: 80\n")
+    key = cache.key(b"class A {}")
+    assert key == FormatCache(tmp_path, "Dart SDK version: 3.8.0", b"formatter:\n  page_width: 80\n").key(b"class A {}")
+    assert key != cache.key(b"class B {}")
+    assert key != FormatCache(tmp_path, "Dart SDK version: 3.9.0", b"formatter:\n  page_width: 80\n").key(b"class A {}")
+    assert key != FormatCache(tmp_path, "Dart SDK version: 3.8.0", b"formatter:\n  page_width: 120\n").key(b"class A {}")
+
+def test_cache_hit_and_miss(tmp_path):
+    cache = FormatCache(tmp_path, "Dart SDK version: 3.8.0")
+    key = cache.key(b"class A{}")
+    assert cache.get(key) is None
+    assert cache.hits == 0
+
+    cache.put(key, b"class A {}\n")
+    assert cache.get(key) == b"class A {}\n"
+    assert cache.hits == 1
+    # The same source under another formatter version misses the entry
+    upgraded = FormatCache(tmp_path, "Dart SDK version: 3.9.0")
+    assert upgraded.get(upgraded.key(b"class A{}")) is None
+    assert upgraded.hits == 0
+
+def test_cached_sources_skip_the_formatter(tmp_path, fake_dart):
+    formatter = DartFormatter(tmp_path, cache_dir=tmp_path / "cache")
+    assert formatter.format_sources(["class a {}", "class b {}"]) == ["CLASS A {}", "CLASS B {}"]
+    assert len(fake_dart) == 1
+
+    # A new formatter (the next run) serves both from the cache and only formats the new source
+    formatter = DartFormatter(tmp_path, cache_dir=tmp_path / "cache")
+    assert formatter.format_sources(["class a {}", "class c {}"]) == ["CLASS A {}", "CLASS C {}"]
+    assert formatter.cache.hits == 1
+    assert len(fake_dart) == 2
+
+    formatter = DartFormatter(tmp_path, cache_dir=tmp_path / "cache")
+    assert formatter.format_sources(["class a {}", "class b {}", "class c {}"]) == ["CLASS A {}", "CLASS B {}", "CLASS C {}"]
+    assert len(fake_dart) == 2 # Every source was a hit
+
+def test_changed_analysis_options_miss_the_cache(tmp_path, fake_dart):
+    DartFormatter(tmp_path, cache_dir=tmp_path / "cache").format_sources(["class a {}"])
+    (tmp_path / "analysis_options.yaml").write_text("formatter:\n  page_width: 120\n")
+
+    formatter = DartFormatter(tmp_path, cache_dir=tmp_path / "cache")
+    formatter.format_sources(["class a {}"])
+    assert formatter.cache.hits == 0
+    assert len(fake_dart) == 2
+
+# --- Plan Mode ---
+
+def test_planning_never_runs_dart(tmp_path, no_subprocesses):
+    plan = Plan(tmp_path)
+    formatter = DartFormatter(tmp_path, cache_dir=tmp_path / "cache", plan=plan, version="Dart SDK version: 3.8.0")
+    assert formatter.version == "Dart SDK version: 3.8.0"
+
+    rendered = RenderedFile(tmp_path / "lib" / "a.dart", "class A {}\n")
+    formatter.format_files([rendered])
+
+    assert rendered.content == "class A {}\n"
+    assert plan.unformatted == {"lib/a.dart"}
+
+def test_planning_without_a_recorded_version(tmp_path, no_subprocesses):
+    formatter = DartFormatter(tmp_path, cache_dir=tmp_path / "cache", plan=Plan(tmp_path))
+    assert not formatter.available
@@ -0,0 +1,113 @@
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+from plan import Plan
+from sql_schema import SchemaSyntaxError, derive_schema_rows, derive_table_keys, parse_schema_sql
+import pytest
+
+REPO_DIR = Path(current_dir, "..", "..").resolve()
+SCHEMA_SQL_FILE = REPO_DIR / "backend" / "node" / "src" / "db" / "schema.sql"
+SCHEMA_FILE = REPO_DIR / "utilities" / "data" / "schema.txt"
+
+# --- schema.sql Parser ---
+
+@pytest.fixture(scope="module")
+def tables():
+    return parse_schema_sql(SCHEMA_SQL_FILE.read_text())
+
+def test_parses_every_table_in_order(tables):
+    assert list(tables) == ["users", "houses", "house_members", "expenses"]
+
+def test_column_names_and_types(tables):
+    users = tables["users"]
+    assert [column.name for column in users.columns] == [
+        "user_id", "display_name", "email", "photo_url",
+        "payment_method", "payment_link", "created_at", "updated_at",
+    ]
+    columns = {column.name: column for column in tables["expenses"].columns}
+    assert columns["total_amount"].sql_type == "DECIMAL(10, 2)"
+    assert columns["settled_at"].sql_type == "TIMESTAMP WITH TIME ZONE"
+    assert columns["expense_date"].default == "CURRENT_DATE"
+    assert columns["total_amount"].checks == ("total_amount >= 0",)
+    assert columns["splits"].not_null and not columns["description"].not_null
+
+def test_keys(tables):
+    house_members = tables["house_members"]
+    assert house_members.primary_key == ("house_member_id",)
+    assert house_members.unique == (("user_id", "house_id"),)
+    assert [(fk.columns, fk.references, fk.referenced_columns, fk.on_delete) for fk in house_members.foreign_keys] == [
+        (("user_id",), "users", ("user_id",), "CASCADE"),
+        (("house_id",), "houses", ("house_id",), "CASCADE"),
+    ]
+    assert tables["users"].unique == (("email",),)
+    assert tables["houses"].foreign_keys[0].on_delete == "RESTRICT"
+
+def test_matches_schema_txt(tables):
+    expected = [tuple(line.split("\t")) for line in SCHEMA_FILE.read_text().splitlines() if line.strip()]
+    derived = [(table, column, sql_type, key) if key else (table, column, sql_type) for table, column, sql_type, key in derive_schema_rows(tables)]
+    assert derived == expected
+
+def test_derived_table_keys(tables):
+    assert derive_table_keys(tables)["house_members"] == {
+        "primary": ["house_member_id"],
+        "foreign": ["user_id", "house_id"],
+        "not_null": ["user_id", "house_id", "is_admin", "is_active"],
+        "unique": ["user_id", "house_id"],
+    }
+
+def test_ignores_other_statements_and_comments():
+    tables = parse_schema_sql(
+        "-- CREATE TABLE fake (id INT);\n"
+        "CREATE INDEX idx ON t (a);\n"
+        "CREATE TABLE public.\"t\" (a INT PRIMARY KEY, note TEXT DEFAULT 'CREATE TABLE x (y INT)');\n"
+    )
+    assert list(tables) == ["t"]
+    assert tables["t"].primary_key == ("a",)
+
+def test_malformed_table_raises():
+    with pytest.raises(SchemaSyntaxError):
+        parse_schema_sql("CREATE TABLE t (a INT, b INT")
+
+# --- Plan ---
+
+def test_plan_report_classifies_writes(tmp_path):
+    (tmp_path / "same.dart").write_bytes(b"same")
+    (tmp_path / "edited.dart").write_bytes(b"old")
+    (tmp_path / "stale.dart").write_bytes(b"stale")
+    (tmp_path / "untouched.dart").write_bytes(b"untouched")
+
+    plan = Plan(tmp_path)
+    assert not plan.write(tmp_path / "same.dart", b"same")
+    assert plan.write(tmp_path / "edited.dart", b"newer")
+    assert plan.write(tmp_path / "new.dart", b"new")
+    plan.delete(tmp_path / "stale.dart")
+
+    report = plan.report(["same.dart", "edited.dart", "stale.dart", "untouched.dart"])
+    assert report["created"] == {"new.dart": 3}
+    assert report["changed"] == {"edited.dart": 2}
+    assert report["deleted"] == {"stale.dart": -5}
+    assert report["unchanged"] == ["same.dart", "untouched.dart"]
+    assert report["net_bytes"] == 0
+    # Nothing reached disk
+    assert (tmp_path / "edited.dart").read_bytes() == b"old"
+    assert (tmp_path / "stale.dart").exists() and not (tmp_path / "new.dart").exists()
+
+def test_plan_report_drops_files_created_then_deleted(tmp_path):
+    plan = Plan(tmp_path)
+    plan.write(tmp_path / "temp.dart", b"temp")
+    plan.delete(tmp_path / "temp.dart")
+    assert not plan.has_changes
+    assert plan.report()["created"] == {}
+
+def test_plan_ignores_layout_only_changes_of_unformatted_files(tmp_path):
+    (tmp_path / "model.dart").write_bytes(b"class A {\n  A(this.a,);\n}\n")
+    plan = Plan(tmp_path)
+    plan.mark_unformatted(tmp_path / "model.dart")
+    assert not plan.write(tmp_path / "model.dart", b"class A { A(this.a); }")
+    assert plan.write(tmp_path / "model.dart", b"class A { A(this.b); }")
+    assert list(plan.report()["changed"]) == ["model.dart"]
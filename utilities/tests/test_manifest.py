@@ -0,0 +1,110 @@
+from pathlib import Path
+import json
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+from manifest import Manifest, MANIFEST_FILE_NAME, hash_inputs
+import utils
+
+def write_output(root: Path, name: str) -> Path:
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("generated\n")
+    return path
+
+# --- Input Hashing ---
+
+def test_hash_covers_every_input_and_the_generator_version(monkeypatch):
+    digest = hash_inputs("users", [["user_id", "UUID"]], {"primary": ["user_id"]})
+    assert digest == hash_inputs("users", [["user_id", "UUID"]], {"primary": ["user_id"]})
+    assert digest != hash_inputs("users", [["user_id", "TEXT"]], {"primary": ["user_id"]})
+    monkeypatch.setattr(utils, "GENERATOR_VERSION", "0.0.0")
+    assert digest != hash_inputs("users", [["user_id", "UUID"]], {"primary": ["user_id"]})
+
+# --- is_current ---
+
+def test_is_current_compares_the_recorded_digest(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    output = write_output(tmp_path, "lib/a.dart")
+    assert not manifest.is_current(output, "one") # Never recorded
+
+    manifest.record(output, "one", ["table:users"])
+    assert manifest.is_current(output, "one")
+    assert not manifest.is_current(output, "two")
+
+def test_missing_outputs_are_never_current(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    output = write_output(tmp_path, "lib/a.dart")
+    manifest.record(output, "one")
+    output.unlink()
+    assert not manifest.is_current(output, "one")
+
+def test_saved_entries_are_current_on_the_next_run(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME, formatter="dart 3.8.0")
+    output = write_output(tmp_path, "lib/a.dart")
+    manifest.record(output, "one", ["template:lib_templates/app.dart.jinja"])
+    manifest.save()
+
+    data = json.loads((tmp_path / MANIFEST_FILE_NAME).read_text())
+    assert data["outputs"] == {"lib/a.dart": "one"}
+    assert data["dependencies"] == {"lib/a.dart": ["template:lib_templates/app.dart.jinja"]}
+    assert Manifest(tmp_path / MANIFEST_FILE_NAME, formatter="dart 3.8.0").is_current(output, "one")
+
+def test_force_and_formatter_changes_make_everything_stale(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME, formatter="dart 3.8.0")
+    output = write_output(tmp_path, "lib/a.dart")
+    manifest.record(output, "one")
+    manifest.save()
+
+    assert not Manifest(tmp_path / MANIFEST_FILE_NAME, force=True, formatter="dart 3.8.0").is_current(output, "one")
+    assert not Manifest(tmp_path / MANIFEST_FILE_NAME, formatter="dart 3.9.0").is_current(output, "one")
+    # Planning never runs dart, so it keeps the recorded formatter
+    planned = Manifest(tmp_path / MANIFEST_FILE_NAME, check_formatter=False)
+    assert planned.formatter == "dart 3.8.0"
+    assert planned.is_current(output, "one")
+
+def test_forget_drops_the_entry(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    output = write_output(tmp_path, "lib/a.dart")
+    manifest.record(output, "one", ["table:users"])
+    manifest.forget(output)
+    assert not manifest.records(output)
+    assert manifest.dependencies == {}
+
+def test_unreadable_manifest_is_ignored(tmp_path):
+    (tmp_path / MANIFEST_FILE_NAME).write_text("{not json")
+    output = write_output(tmp_path, "lib/a.dart")
+    assert not Manifest(tmp_path / MANIFEST_FILE_NAME).is_current(output, "one")
+
+def test_in_memory_manifest_is_not_saved(tmp_path):
+    manifest = Manifest()
+    manifest.record(write_output(tmp_path, "lib/a.dart"), "one")
+    manifest.save()
+    assert list(tmp_path.rglob(MANIFEST_FILE_NAME)) == []
+
+# --- restrict_to (watch mode) ---
+
+def test_restrict_to_limits_renders_to_the_affected_outputs(tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    affected = write_output(tmp_path, "lib/affected.dart")
+    untouched = write_output(tmp_path, "lib/untouched.dart")
+    unknown = write_output(tmp_path, "lib/unknown.dart")
+    manifest.record(affected, "one", ["table:users"])
+    manifest.record(untouched, "one", ["table:houses"])
+    manifest.record(unknown, "one") # No recorded dependencies
+
+    manifest.restrict_to(["lib/affected.dart"])
+    assert not manifest.is_current(affected, "one")
+    assert manifest.is_current(untouched, "two") # The graph says it is unaffected
+    assert not manifest.is_current(unknown, "two") # Not in the graph: checked by digest
+    assert manifest.is_current(unknown, "one")
+
+    untouched.unlink()
+    assert not manifest.is_current(untouched, "one") # Missing outputs are always rendered
+
+    manifest.restrict_to(None)
+    assert manifest.is_current(affected, "one")
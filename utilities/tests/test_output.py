@@ -0,0 +1,124 @@
+from pathlib import Path
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+from manifest import Manifest, MANIFEST_FILE_NAME
+from output import RenderedFile, swap_package
+import utils
+import pytest
+
+@pytest.fixture
+def package(tmp_path):
+    package_path = tmp_path / "users_repository"
+    (package_path / "lib" / "src" / "models").mkdir(parents=True)
+    (package_path / "lib" / "users_repository.dart").write_text("library users_repository;\n")
+    (package_path / "lib" / "src" / "models" / "users.dart").write_text("class Users {}\n")
+    (package_path / "lib" / "src" / "models" / "dropped.dart").write_text("class Dropped {}\n")
+    return package_path
+
+def snapshot(path: Path) -> dict:
+    return {file.relative_to(path).as_posix(): file.read_bytes() for file in sorted(path.rglob("*")) if file.is_file()}
+
+def fail_on(monkeypatch, name: str, target_name: str):
+    """Makes utils.<name> raise for the file called target_name."""
+    original = getattr(utils, name)
+    def failing(*args):
+        if any(Path(arg).name == target_name for arg in args if isinstance(arg, (str, Path))):
+            raise OSError("disk full")
+        return original(*args)
+    monkeypatch.setattr(utils, name, failing)
+
+# --- Existing Packages ---
+
+def test_only_changed_files_are_swapped_in(package, tmp_path):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    library = package / "lib" / "users_repository.dart"
+    model = package / "lib" / "src" / "models" / "users.dart"
+    inode = library.stat().st_ino
+    files = [
+        RenderedFile(library, "library users_repository;\n", "a"),
+        RenderedFile(model, "class Users { final String id; }\n", "b", depends_on=["table:users"]),
+        RenderedFile(package / "lib" / "src" / "models" / "houses.dart", "class Houses {}\n", "c"),
+    ]
+
+    written = swap_package(files, manifest, package, deletions=[package / "lib" / "src" / "models" / "dropped.dart"])
+
+    assert written == [model, package / "lib" / "src" / "models" / "houses.dart"]
+    assert library.stat().st_ino == inode # Unchanged files are not rewritten
+    assert snapshot(package) == {
+        "lib/users_repository.dart": b"library users_repository;\n",
+        "lib/src/models/users.dart": b"class Users { final String id; }\n",
+        "lib/src/models/houses.dart": b"class Houses {}\n",
+    }
+    assert manifest.entries == {
+        "users_repository/lib/users_repository.dart": "a",
+        "users_repository/lib/src/models/users.dart": "b",
+        "users_repository/lib/src/models/houses.dart": "c",
+    }
+
+def test_failed_staging_leaves_the_package_untouched(package, tmp_path, monkeypatch):
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    before = snapshot(package)
+    streamed = utils.stage_bytes(package / "lib" / "src" / "models" / "streamed.dart", b"class Streamed {}\n")
+    fail_on(monkeypatch, "stage_bytes", "houses.dart")
+    files = [
+        RenderedFile(package / "lib" / "src" / "models" / "users.dart", "class Users { final String id; }\n", "b"),
+        RenderedFile(package / "lib" / "src" / "models" / "houses.dart", "class Houses {}\n", "c"),
+        RenderedFile(package / "lib" / "src" / "models" / "streamed.dart", None, "d", staged=streamed),
+    ]
+
+    with pytest.raises(OSError):
+        swap_package(files, manifest, package, deletions=[package / "lib" / "src" / "models" / "dropped.dart"])
+
+    assert snapshot(package) == before # No file changed, no deletion ran, no temp file left
+    assert manifest.entries == {}
+
+def test_failed_swap_leaves_no_temp_files(package, tmp_path, monkeypatch):
+    fail_on(monkeypatch, "install_staged", "users.dart")
+    files = [
+        RenderedFile(package / "lib" / "users_repository.dart", "library users_repository; // v2\n", "a"),
+        RenderedFile(package / "lib" / "src" / "models" / "users.dart", "class Users { final String id; }\n", "b"),
+        RenderedFile(package / "lib" / "src" / "models" / "houses.dart", "class Houses {}\n", "c"),
+    ]
+
+    with pytest.raises(OSError):
+        swap_package(files, Manifest(tmp_path / MANIFEST_FILE_NAME), package)
+
+    assert not [path for path in package.rglob("*") if ".tmp" in path.name]
+
+# --- New Packages ---
+
+def test_new_package_is_renamed_into_place(tmp_path):
+    package_path = tmp_path / "houses_repository"
+    staging_dir = utils.make_staging_dir(package_path)
+    files = [
+        RenderedFile(package_path / "lib" / "houses_repository.dart", "library houses_repository;\n", "a"),
+        RenderedFile(package_path / "pubspec.yaml", b"name: houses_repository\n"),
+    ]
+
+    written = swap_package(files, Manifest(tmp_path / MANIFEST_FILE_NAME), package_path, staging_dir)
+
+    assert written == [file.path for file in files]
+    assert snapshot(package_path) == {"lib/houses_repository.dart": b"library houses_repository;\n", "pubspec.yaml": b"name: houses_repository\n"}
+    assert not staging_dir.exists()
+
+def test_failed_new_package_is_discarded(tmp_path, monkeypatch):
+    package_path = tmp_path / "houses_repository"
+    staging_dir = utils.make_staging_dir(package_path)
+    streamed = utils.stage_bytes(staging_dir / "lib" / "src" / "houses_repository.dart", b"class HousesRepository {}\n")
+    fail_on(monkeypatch, "install_staged", "houses_repository.dart")
+    files = [
+        RenderedFile(package_path / "pubspec.yaml", b"name: houses_repository\n"),
+        RenderedFile(package_path / "lib" / "src" / "houses_repository.dart", None, "a", staged=streamed),
+    ]
+
+    with pytest.raises(OSError):
+        swap_package(files, Manifest(tmp_path / MANIFEST_FILE_NAME), package_path, staging_dir)
+
+    assert not package_path.exists()
+    assert not staging_dir.exists()
+    assert not streamed.exists()
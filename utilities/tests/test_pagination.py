@@ -0,0 +1,74 @@
+from pathlib import Path
+import re
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+generate_dir = os.path.join(current_dir, '..', 'generate')
+sys.path.append(parent_dir)
+sys.path.append(generate_dir)
+
+from ir import build_tables
+import pytest
+
+PACKAGES_DIR = Path(current_dir, "..", "..", "frontend", "roommate_expense_tracker", "packages").resolve()
+CUBIT_TEMPLATE = "cubit/{{ feature }}_cubit.dart.jinja"
+
+# Repository calls made by a cubit, e.g. '_usersRepository.fetchHouseMembersPage('
+REPOSITORY_CALL = re.compile(r"_\w+Repository\s*\.\s*(\w+)\(")
+# Methods a repository defines, e.g. 'Future<PageResult<HouseMembers>> fetchHouseMembersPage({'
+REPOSITORY_METHOD = re.compile(r"^\s*Future<.*?>\s+(\w+)\(", re.MULTILINE)
+
+@pytest.fixture(scope="module")
+def stages():
+    # The stages resolve their data and template paths against utilities/generate
+    cwd = os.getcwd()
+    os.chdir(generate_dir)
+    try:
+        import generate
+        from inputs import load_inputs
+        inputs = load_inputs(
+            generate.SCHEMA_FILE,
+            generate.SCHEMA_KEY_MAPPING_FILE,
+            generate.REPO_MODEL_MAPPING_FILE,
+            generate.REPOSITORY_SOURCE,
+            generate.CACHE_POLICY_FILE,
+            generate.PAGINATED_TABLES_FILE,
+        )
+        yield generate.generate_repositories, generate.generate_features, inputs
+    finally:
+        os.chdir(cwd)
+
+def cubit_calls(generate_features, feature: str, tables: list) -> set:
+    [cubit] = generate_features.render_feature_templates(feature, tables, [(CUBIT_TEMPLATE, None, "")])
+    return set(REPOSITORY_CALL.findall(cubit))
+
+# --- Paginated Tables ---
+
+def test_only_listed_tables_are_paginated(stages):
+    _, _, inputs = stages
+    assert sorted(name for name, table in inputs.tables.items() if table.paginated) == ["expenses", "house_members"]
+
+def test_listed_table_needs_created_at():
+    tables = build_tables({"events": [("event_id", "UUID")]}, {"events": {"primary": ["event_id"]}}, paginated_tables=["events"])
+    assert not tables["events"].paginated
+
+# --- Cubit / Repository Method Names ---
+
+def test_cubits_only_call_checked_in_repository_methods(stages):
+    # Existing repository packages are never re-rendered, while cubits are
+    _, generate_features, inputs = stages
+    for feature, names in inputs.model_map.items():
+        source = (PACKAGES_DIR / f"{feature}_repository" / "lib" / "src" / f"{feature}_repository.dart").read_text()
+        missing = cubit_calls(generate_features, feature, [inputs.tables[name] for name in names]) - set(REPOSITORY_METHOD.findall(source))
+        assert not missing, f"{feature} cubit calls methods its repository lacks: {sorted(missing)}"
+
+def test_cubits_only_call_rendered_repository_methods(stages, tmp_path):
+    generate_repositories, generate_features, inputs = stages
+    for feature, names in inputs.model_map.items():
+        tables = [inputs.tables[name] for name in names]
+        rendered = generate_repositories.render_repository_structure(feature, tmp_path / feature, tables)
+        [repository] = [file.content for file in rendered if file.path.parent.name == "src" and file.path.name == f"{feature}_repository.dart"]
+        missing = cubit_calls(generate_features, feature, tables) - set(REPOSITORY_METHOD.findall(repository))
+        assert not missing, f"{feature} cubit calls methods a new repository lacks: {sorted(missing)}"
@@ -0,0 +1,116 @@
+from pathlib import Path
+import os
+import sys
+import threading
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import pub_get
+import pytest
+
+def write_package(root: Path, relative: str, dependencies=()) -> Path:
+    package_dir = root / relative
+    package_dir.mkdir(parents=True, exist_ok=True)
+    lines = [f"name: {package_dir.name}", "dependencies:"]
+    for dependency in dependencies:
+        lines += [f"  {Path(dependency).name}:", f"    path: {dependency}"]
+    (package_dir / "pubspec.yaml").write_text("\n".join(lines) + "\n")
+    return package_dir.resolve()
+
+def make_fresh(package_dir: Path):
+    (package_dir / "pubspec.lock").write_text("")
+    (package_dir / ".dart_tool").mkdir(exist_ok=True)
+    (package_dir / ".dart_tool" / "package_config.json").write_text("{}")
+    past = time.time() - 60
+    os.utime(package_dir / "pubspec.yaml", (past, past))
+
+@pytest.fixture
+def tree(tmp_path):
+    """The app's layout: the app depends on a repository, which depends on the core packages."""
+    return {
+        "core": write_package(tmp_path, "packages/app_core"),
+        "api": write_package(tmp_path, "packages/api_client", ["../app_core"]),
+        "repository": write_package(tmp_path, "packages/users_repository", ["../app_core", "../api_client"]),
+        "app": write_package(tmp_path, ".", ["packages/users_repository", "packages/app_core"]),
+    }
+
+@pytest.fixture
+def runs(monkeypatch):
+    """Replaces 'flutter pub get' with a recorder of (event, package) tuples."""
+    events = []
+    lock = threading.Lock()
+    failing = set()
+
+    def fake_pub_get(package_dir):
+        with lock:
+            events.append(("start", package_dir))
+        time.sleep(0.01)
+        with lock:
+            events.append(("end", package_dir))
+        return package_dir not in failing, "done"
+
+    monkeypatch.setattr(pub_get, "flutter_pub_get", fake_pub_get)
+    return events, failing
+
+def started(events) -> list:
+    return [package for event, package in events if event == "start"]
+
+# --- Package Discovery ---
+
+def test_dependency_graph_follows_path_dependencies(tree, tmp_path):
+    (tmp_path / "build" / "ignored").mkdir(parents=True)
+    (tmp_path / "build" / "ignored" / "pubspec.yaml").write_text("name: ignored\n")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "pubspec.yaml").write_text("name: hidden\n")
+
+    assert pub_get.build_dependency_graph(tmp_path) == {
+        tree["core"]: set(),
+        tree["api"]: {tree["core"]},
+        tree["repository"]: {tree["core"], tree["api"]},
+        tree["app"]: {tree["repository"], tree["core"]},
+    }
+
+# --- Resolution ---
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_packages_resolve_after_their_dependencies(tree, tmp_path, runs, jobs):
+    events, _ = runs
+    assert pub_get.run_pub_get(tmp_path, jobs=jobs)
+
+    graph = pub_get.build_dependency_graph(tmp_path)
+    assert sorted(started(events)) == sorted(graph)
+    for package, dependencies in graph.items():
+        start = events.index(("start", package))
+        for dependency in dependencies:
+            assert events.index(("end", dependency)) < start
+
+def test_fresh_packages_are_skipped_unless_a_dependency_was_resolved(tree, tmp_path, runs):
+    events, _ = runs
+    for key in ("core", "api", "app"):
+        make_fresh(tree[key])
+
+    assert pub_get.run_pub_get(tmp_path)
+    # The repository is stale, so the app that depends on it is resolved again
+    assert started(events) == [tree["repository"], tree["app"]]
+
+    events.clear()
+    assert pub_get.run_pub_get(tmp_path, force=True)
+    assert len(started(events)) == 4
+
+def test_dependents_of_a_failed_package_are_not_attempted(tree, tmp_path, runs):
+    events, failing = runs
+    failing.add(tree["api"])
+
+    assert not pub_get.run_pub_get(tmp_path)
+    assert started(events) == [tree["core"], tree["api"]]
+
+def test_circular_dependencies_fail(tmp_path, runs):
+    events, _ = runs
+    write_package(tmp_path, "a", ["../b"])
+    write_package(tmp_path, "b", ["../a"])
+
+    assert not pub_get.run_pub_get(tmp_path)
+    assert events == []
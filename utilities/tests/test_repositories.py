@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+generate_dir = os.path.join(current_dir, '..', 'generate')
+sys.path.append(parent_dir)
+sys.path.append(generate_dir)
+
+import utils
+from ir import build_tables
+from manifest import Manifest, MANIFEST_FILE_NAME
+from parallel import SerialExecutor
+import pytest
+
+SCHEMA = {"users": [("user_id", "UUID"), ("email", "VARCHAR(255)")]}
+TABLE_KEYS = {"users": {"primary": ["user_id"], "foreign": [], "not_null": ["email"], "unique": ["email"]}}
+
+@pytest.fixture(scope="module")
+def generate_repositories():
+    # The stage resolves its template paths against utilities/generate
+    cwd = os.getcwd()
+    os.chdir(generate_dir)
+    try:
+        import generate_repositories
+        yield generate_repositories
+    finally:
+        os.chdir(cwd)
+
+# --- Stale Models ---
+
+def test_only_generated_models_are_stale(generate_repositories, tmp_path):
+    models_dir = tmp_path / "users_repository" / "lib" / "src" / "models"
+    models_dir.mkdir(parents=True)
+    (models_dir / "users.dart").write_text(f"// {utils.GENERATED_MARKER}\nclass Users {{}}\n")
+    (models_dir / "dropped.dart").write_text(f"import 'package:app_core/app_core.dart';\n\n// {utils.GENERATED_MARKER}\n")
+    (models_dir / "dropped.g.dart").write_text("part of 'dropped.dart';\n")
+    (models_dir / "recorded.dart").write_text("class Recorded {}\n")
+    (models_dir / "hand_written.dart").write_text("class HandWritten {}\n")
+    manifest = Manifest(tmp_path / MANIFEST_FILE_NAME)
+    manifest.record(models_dir / "recorded.dart", "digest")
+
+    pending = generate_repositories.submit_repository(
+        "users", tmp_path, SCHEMA, ["users"], TABLE_KEYS, manifest, SerialExecutor(), build_tables(SCHEMA, TABLE_KEYS),
+    )
+
+    assert sorted(path.name for path in pending.stale_models) == ["dropped.dart", "dropped.g.dart", "recorded.dart"]
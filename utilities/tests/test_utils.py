@@ -0,0 +1,53 @@
+from pathlib import Path
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..', 'common')
+sys.path.append(parent_dir)
+
+import utils
+import pytest
+
+# --- write_if_changed ---
+
+def test_creates_missing_file_and_parents(tmp_path):
+    path = tmp_path / "lib" / "src" / "a.dart"
+    assert utils.write_if_changed(path, "class A {}\n")
+    assert path.read_text() == "class A {}\n"
+
+def test_unchanged_content_is_not_rewritten(tmp_path):
+    path = tmp_path / "a.dart"
+    path.write_bytes(b"class A {}\n")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    before = path.stat()
+
+    assert not utils.write_if_changed(path, "class A {}\n")
+    after = path.stat()
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+def test_changed_content_replaces_the_file_atomically(tmp_path):
+    path = tmp_path / "run.sh"
+    path.write_bytes(b"old\n")
+    path.chmod(0o755)
+    inode = path.stat().st_ino
+
+    assert utils.write_if_changed(path, b"new\n")
+    # A new file renamed over the old one, never the old one truncated in place
+    assert path.stat().st_ino != inode
+    assert path.read_bytes() == b"new\n"
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert sorted(tmp_path.iterdir()) == [path]
+
+def test_failed_replace_keeps_the_old_file(tmp_path, monkeypatch):
+    path = tmp_path / "a.dart"
+    path.write_bytes(b"old\n")
+
+    def fail(source, target):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", fail)
+
+    with pytest.raises(OSError):
+        utils.write_if_changed(path, b"new\n")
+    assert path.read_bytes() == b"old\n"
+    assert sorted(tmp_path.iterdir()) == [path] # The temp file is cleaned up